@@ -0,0 +1,197 @@
+# src/assets.py
+"""
+Process-wide image registry: every PNG is decoded once, every scaled variant built once.
+
+    img = ASSETS.image("assets/animation/people01.png")
+    cell = ASSETS.fit(path, cell_w, cell_h, 1.30)              # sprite frames (fit to a grid cell)
+    cell_flipped = ASSETS.fit(path, cell_w, cell_h, 1.30, flip=True)
+    thumb = ASSETS.resized(path, (w, h))                      # exact size (menus)
+
+Entries are keyed by (path, target size, ratio[, flip]), so a Retry or a new round
+that asks for the same frames gets the same surfaces back without touching disk or
+smoothscale. Returned surfaces are shared: blit them, never draw on them.
+stats()/report() give the entry count and the pixel memory held.
+
+load_scaled() adds an on-disk cache under CFG.ASSET_CACHE_DIR for cell-fitted frames:
+one raw RGBA file per (source content hash, cell_w, cell_h, ratio), so a warm start
+reads pixels straight into a surface with no PNG decode and no smoothscale. An edited
+PNG hashes differently and simply misses; stale files are harmless (delete the dir).
+    header   magic b"PFPPX1", w/h u16 u16, original w/h u16 u16, then w*h*4 bytes RGBA
+"""
+from __future__ import annotations
+import hashlib
+import os
+import struct
+from pathlib import Path
+from typing import Callable, Dict, Hashable, Optional, Tuple
+
+import pygame as pg
+
+from src.config import CFG
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+_PX_MAGIC = b"PFPPX1"
+_PX_HEADER = struct.Struct("<6sHHHH")
+
+
+def _key_path(path) -> str:
+    p = Path(path)
+    if not p.is_absolute():
+        p = _ROOT / p
+    return str(p.resolve())
+
+
+def fit_size(size: Tuple[int, int], cell_w: int, cell_h: int, ratio: float) -> Tuple[int, int]:
+    """Largest size keeping the aspect that fits (cell * ratio)."""
+    w, h = size
+    maxw, maxh = int(cell_w * ratio), int(cell_h * ratio)
+    s = min(maxw / max(w, 1), maxh / max(h, 1))
+    return max(1, int(w * s)), max(1, int(h * s))
+
+
+def surface_bytes(surf: pg.Surface) -> int:
+    return surf.get_pitch() * surf.get_height()
+
+
+class AssetRegistry:
+    def __init__(self):
+        self._items: Dict[Hashable, pg.Surface] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def put(self, key: Hashable, surf: pg.Surface):
+        """Register a surface built elsewhere (e.g. the atlas) so it is accounted for."""
+        self._items[key] = surf
+
+    def _get(self, key: Hashable, build: Callable[[], pg.Surface]) -> pg.Surface:
+        surf = self._items.get(key)
+        if surf is None:
+            self.misses += 1
+            surf = self._items[key] = build()
+        else:
+            self.hits += 1
+        return surf
+
+    def image(self, path) -> pg.Surface:
+        """Decoded original (convert_alpha'd once a display exists)."""
+        p = _key_path(path)
+
+        def build():
+            img = pg.image.load(p)
+            return img.convert_alpha() if pg.display.get_surface() is not None else img
+        return self._get((p, None, None), build)
+
+    def fit(self, path, cell_w: int, cell_h: int, ratio: float = 1.30, flip: bool = False) -> pg.Surface:
+        """Original scaled to fit a (cell_w, cell_h) cell times ratio; optionally mirrored."""
+        p = _key_path(path)
+        if flip:
+            return self._get((p, (cell_w, cell_h), ratio, True),
+                             lambda: pg.transform.flip(self.fit(p, cell_w, cell_h, ratio), True, False))
+
+        def build():
+            img = self.image(p)
+            return pg.transform.smoothscale(img, fit_size(img.get_size(), cell_w, cell_h, ratio))
+        return self._get((p, (cell_w, cell_h), ratio), build)
+
+    def resized(self, path, size: Tuple[int, int]) -> pg.Surface:
+        """Original smoothscaled to exactly size."""
+        p = _key_path(path)
+        size = (max(1, int(size[0])), max(1, int(size[1])))
+        return self._get((p, size, None), lambda: pg.transform.smoothscale(self.image(p), size))
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._items), "bytes": sum(surface_bytes(s) for s in self._items.values()),
+                "hits": self.hits, "misses": self.misses}
+
+    def report(self) -> str:
+        """One line per entry plus a total, largest first."""
+        rows = sorted(self._items.items(), key=lambda kv: -surface_bytes(kv[1]))
+        lines = []
+        for key, surf in rows:
+            if len(key) >= 3:
+                path, size, ratio, *flip = key
+                what = "original" if size is None else f"{size[0]}x{size[1]}" + (f" x{ratio}" if ratio else "")
+                label = f"{Path(path).name} {what}{' flipped' if flip else ''}"
+            else:
+                label = " ".join(map(str, key))
+            lines.append(f"{surface_bytes(surf) / 1024:9.1f} KiB  {label}  ({surf.get_width()}x{surf.get_height()})")
+        st = self.stats()
+        lines.append(f"{st['bytes'] / 1024:9.1f} KiB  total, {st['entries']} surfaces "
+                     f"({st['hits']} hits / {st['misses']} loads+scales)")
+        return "\n".join(lines)
+
+
+ASSETS = AssetRegistry()
+
+
+# -----------------------------------------------------------------------------
+# On-disk cache of cell-fitted pixels
+# -----------------------------------------------------------------------------
+def _cache_dir() -> Optional[Path]:
+    """CFG.ASSET_CACHE_DIR resolved against the repo root (None = disabled)."""
+    if not getattr(CFG, "ASSET_CACHE", True):
+        return None
+    name = getattr(CFG, "ASSET_CACHE_DIR", "") or ""
+    return (_ROOT / name) if name else None
+
+
+def _content_hash(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha1(f.read()).hexdigest()[:20]
+
+
+def _cache_file(cache: Path, path: str, cell_w: int, cell_h: int, ratio: float) -> Path:
+    return cache / f"{Path(path).stem}-{_content_hash(path)}-{cell_w}x{cell_h}-{ratio:g}.px"
+
+
+def _read_px(file: Path) -> Optional[Tuple[pg.Surface, Tuple[int, int]]]:
+    try:
+        with open(file, "rb") as f:
+            data = f.read()
+        magic, w, h, ow, oh = _PX_HEADER.unpack_from(data, 0)
+    except (OSError, struct.error):
+        return None
+    if magic != _PX_MAGIC or len(data) != _PX_HEADER.size + w * h * 4:
+        return None
+    surf = pg.image.frombuffer(memoryview(data)[_PX_HEADER.size:], (w, h), "RGBA")
+    return surf, (ow, oh)
+
+
+def _write_px(file: Path, surf: pg.Surface, orig_size: Tuple[int, int]):
+    w, h = surf.get_size()
+    tmp = file.with_suffix(f".tmp{os.getpid()}")
+    try:
+        file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(_PX_HEADER.pack(_PX_MAGIC, w, h, *orig_size))
+            f.write(pg.image.tobytes(surf, "RGBA"))
+        os.replace(tmp, file)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def load_scaled(path, cell_w: int, cell_h: int, ratio: float = 1.30) -> Tuple[pg.Surface, Tuple[int, int]]:
+    """
+    (PNG fitted to a cell, original size). Served from the disk cache when it holds
+    this content at this size; otherwise decoded + smoothscaled once and written back.
+    The surface is freshly read (or built) and owned by the caller.
+    """
+    p = _key_path(path)
+    cache = _cache_dir()
+    file = _cache_file(cache, p, cell_w, cell_h, ratio) if cache is not None else None
+    if file is not None:
+        hit = _read_px(file)
+        if hit is not None:
+            return hit
+    img = ASSETS.image(p)
+    surf = pg.transform.smoothscale(img, fit_size(img.get_size(), cell_w, cell_h, ratio))
+    if file is not None:
+        _write_px(file, surf, img.get_size())
+    return surf, img.get_size()
@@ -0,0 +1,148 @@
+# src/atlas.py
+"""
+Character texture atlas: every frame PNG in assets/animation, both facings, every
+scale variant in use, packed into one SRCALPHA surface plus an index.
+
+    atlas = character_atlas(cell_w, cell_h, 1.30)
+    img = atlas.frame("roo01.png", cell_w, cell_h, 1.30, flip=True)   # subsurface view
+
+Frames are subsurfaces, so sprites share the atlas pixels (blits read from one
+block of memory) and the atlas is the single place sprite memory lives; it is
+registered in ASSETS. Asking for a variant the atlas doesn't hold repacks it with
+the union of all variants requested so far (the window is fixed-size, so in
+practice that happens once).
+
+    python -m src.atlas              # pack for the configured window, print the index
+    python -m src.atlas --save out.png
+"""
+from __future__ import annotations
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import pygame as pg
+
+from src.assets import ASSETS, load_scaled
+
+_ANIM_DIR = Path(__file__).resolve().parents[1] / "assets" / "animation"
+_PAD = 1            # transparent gutter between frames
+_MAX_W = 2048
+
+Variant = Tuple[int, int, float]                 # (cell_w, cell_h, ratio)
+FrameKey = Tuple[str, int, int, float, bool]     # (name, cell_w, cell_h, ratio, flip)
+
+
+def frame_names() -> List[str]:
+    return sorted(p.name for p in _ANIM_DIR.glob("*.png"))
+
+
+def _shelf_pack(sizes: Dict[FrameKey, Tuple[int, int]], max_w: int) -> Tuple[Dict[FrameKey, pg.Rect], Tuple[int, int]]:
+    """Shelf packing, tallest first; returns (rects, atlas size)."""
+    order = sorted(sizes, key=lambda k: (-sizes[k][1], -sizes[k][0], k))
+    width = min(max_w, max(1, sum(w + _PAD for w, _ in sizes.values())))
+    width = max(width, max((w for w, _ in sizes.values()), default=1))
+    rects: Dict[FrameKey, pg.Rect] = {}
+    x = y = shelf_h = 0
+    for k in order:
+        w, h = sizes[k]
+        if x and x + w > width:
+            x, y, shelf_h = 0, y + shelf_h + _PAD, 0
+        rects[k] = pg.Rect(x, y, w, h)
+        x += w + _PAD
+        shelf_h = max(shelf_h, h)
+    return rects, (width, max(1, y + shelf_h))
+
+
+class Atlas:
+    def __init__(self, surface: pg.Surface, index: Dict[FrameKey, pg.Rect], orig_sizes: Dict[str, Tuple[int, int]]):
+        self.surface = surface
+        self.index = index
+        self.orig_sizes = orig_sizes
+        self._views: Dict[FrameKey, pg.Surface] = {}
+
+    @property
+    def variants(self) -> Tuple[Variant, ...]:
+        return tuple(sorted({(k[1], k[2], k[3]) for k in self.index}))
+
+    def has(self, cell_w: int, cell_h: int, ratio: float) -> bool:
+        return (cell_w, cell_h, ratio) in self.variants
+
+    def frame(self, name: str, cell_w: int, cell_h: int, ratio: float, flip: bool = False) -> pg.Surface:
+        key = (name, cell_w, cell_h, ratio, flip)
+        view = self._views.get(key)
+        if view is None:
+            view = self._views[key] = self.surface.subsurface(self.index[key])
+        return view
+
+    def orig_size(self, name: str) -> Tuple[int, int]:
+        return self.orig_sizes[name]
+
+    @property
+    def bytes(self) -> int:
+        return self.surface.get_pitch() * self.surface.get_height()
+
+
+def build_atlas(variants: Iterable[Variant], names: Optional[List[str]] = None) -> Atlas:
+    """Scale every frame for every variant, flip each, pack them all into one surface."""
+    names = names if names is not None else frame_names()
+    variants = sorted(set(variants))
+    orig_sizes: Dict[str, Tuple[int, int]] = {}
+
+    scaled: Dict[FrameKey, pg.Surface] = {}
+    for cw, ch, ratio in variants:
+        for n in names:
+            s, orig_sizes[n] = load_scaled(_ANIM_DIR / n, cw, ch, ratio)   # disk cache or decode+scale
+            scaled[(n, cw, ch, ratio, False)] = s
+            scaled[(n, cw, ch, ratio, True)] = pg.transform.flip(s, True, False)
+
+    index, size = _shelf_pack({k: s.get_size() for k, s in scaled.items()}, _MAX_W)
+    surf = pg.Surface(size, pg.SRCALPHA)
+    if pg.display.get_surface() is not None:
+        surf = surf.convert_alpha()
+    surf.fill((0, 0, 0, 0))
+    for k, s in scaled.items():
+        surf.blit(s, index[k], special_flags=pg.BLEND_RGBA_MAX)   # exact copy onto transparent pixels
+    return Atlas(surf, index, orig_sizes)
+
+
+_ATLAS: Optional[Atlas] = None
+_ATLAS_KEY = ("atlas", "characters")
+
+
+def character_atlas(cell_w: int, cell_h: int, ratio: float = 1.30) -> Atlas:
+    """The shared atlas, (re)packed so it holds this variant."""
+    global _ATLAS
+    if _ATLAS is None or not _ATLAS.has(cell_w, cell_h, ratio):
+        variants = set(_ATLAS.variants if _ATLAS is not None else ()) | {(cell_w, cell_h, ratio)}
+        _ATLAS = build_atlas(variants)
+        ASSETS.put(_ATLAS_KEY, _ATLAS.surface)
+    return _ATLAS
+
+
+def main(argv=None):
+    import argparse
+    import os
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+    from src.config import CFG
+    from src.main import WIN_W, WIN_H
+    from src.ui.board import compute_play_rect, HUD_H
+
+    ap = argparse.ArgumentParser(description="Pack the character atlas for the configured window.")
+    ap.add_argument("--save", help="write the atlas surface to this PNG")
+    args = ap.parse_args(argv)
+
+    pg.init()
+    pg.display.set_mode((1, 1))
+    pr = compute_play_rect(WIN_W, WIN_H, hud_h=HUD_H, margin=8)
+    atlas = character_atlas(pr.width // CFG.GRID_W, pr.height // CFG.GRID_H, 1.30)
+    w, h = atlas.surface.get_size()
+    print(f"[atlas] {w}x{h}, {len(atlas.index)} frames, {atlas.bytes / 1024:.0f} KiB")
+    for k, r in sorted(atlas.index.items(), key=lambda kv: (kv[1].y, kv[1].x)):
+        name, cw, ch, ratio, flip = k
+        print(f"  {name:12s} {cw}x{ch} x{ratio}{' flip' if flip else '     '}  at ({r.x},{r.y}) {r.w}x{r.h}")
+    if args.save:
+        pg.image.save(atlas.surface, args.save)
+    pg.quit()
+
+
+if __name__ == "__main__":
+    main()
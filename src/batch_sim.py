@@ -0,0 +1,372 @@
+# src/batch_sim.py
+"""
+Struct-of-arrays version of src.simulation.MatchSim for balancing runs.
+
+N independent rounds live in NumPy arrays of shape (N,); one step(actions) call
+advances all of them by a fixed dt with the same rules as MatchSim (grid contact,
+scripted human input). Finished lanes are tallied and restarted in place, so a
+single BatchSim can churn through 100k+ rounds on one core:
+
+    bs = BatchSim(4096)
+    stats = bs.run_rounds(100_000, seed=1)
+
+Actions are small ints: ACT_NONE/UP/DOWN/LEFT/RIGHT, optionally OR'ed with ACT_BLOCK
+(SPACE held). NumPy is only needed for these headless tools, not for the game.
+"""
+from __future__ import annotations
+import numpy as np
+
+from src.bitboard import SAFE_INDEX, move_tables
+from src.config import CFG
+from src.pathing import distance_field
+from src.reachability import human_steps_per_decision, reachability
+from src.simulation import R_FACE_LEFT, R_FACE_RIGHT
+from src.tablebase import NO_MOVE, load_tablebase
+
+# ---- action encoding ----
+ACT_NONE  = 0
+ACT_UP    = 1
+ACT_DOWN  = 2
+ACT_LEFT  = 3
+ACT_RIGHT = 4
+ACT_BLOCK = 8          # bit flag, combine with a direction
+_DIR_MASK = 7
+
+# ---- safe-move offsets (columns of the bitboard roo_safe table) ----
+K_RIGHT2, K_LEFT2 = SAFE_INDEX[(2, 0)], SAFE_INDEX[(-2, 0)]
+K_DOWN2,  K_UP2   = SAFE_INDEX[(0, 2)], SAFE_INDEX[(0, -2)]
+K_RIGHT1, K_LEFT1 = SAFE_INDEX[(1, 0)], SAFE_INDEX[(-1, 0)]
+K_DOWN1,  K_UP1   = SAFE_INDEX[(0, 1)], SAFE_INDEX[(0, -1)]
+
+# ---- lane outcome ----
+WIN_NONE  = 0
+WIN_HUMAN = 1
+WIN_ROO   = 2
+
+
+def random_actions(rng: np.random.Generator, n: int, p_block: float = 0.3) -> np.ndarray:
+    """Uniform random direction per lane, SPACE held with probability p_block."""
+    acts = rng.integers(ACT_NONE, ACT_RIGHT + 1, size=n, dtype=np.int8)
+    return acts | np.where(rng.random(n) < p_block, ACT_BLOCK, 0).astype(np.int8)
+
+
+class BatchSim:
+    """
+    N rounds stepped in lockstep with a shared clock (`now`) and per-lane timers.
+      - step(actions) advances every lane by dt_ms and returns the lanes that ended.
+      - finished lanes are counted in wins_h / wins_r / round_ms and reset when auto_reset.
+    """
+
+    def __init__(self, n: int, dt_ms: int = 16, cfg=None, auto_reset: bool = True):
+        self.cfg = cfg if cfg is not None else CFG
+        self.n = int(n)
+        self.dt_ms = int(dt_ms)
+        self.auto_reset = auto_reset
+
+        c = self.cfg
+        self.face_only = getattr(c, "AI_TURN_ONLY_MODE", False)
+        self.ai_follow = getattr(c, "AI_ALLOW_MOVE", True) and not self.face_only
+        self.ai_punch  = getattr(c, "AI_ALLOW_PUNCH", True) and not self.face_only
+
+        self.now = 0
+        self._st_h_max = float(getattr(c, "HUMAN_STAMINA", 100))
+        self._st_r_max = float(getattr(c, "ROO_STAMINA", 100))
+        self._roo_safe = np.asarray(move_tables(c.GRID_W, c.GRID_H).roo_safe, np.int32)  # (cells, cells, 8)
+        cells = c.GRID_W * c.GRID_H
+        if getattr(c, "AI_USE_DISTANCE_FIELD", True):
+            # [human cell, roo cell] -> best approach jump (-1: greedy follow)
+            self._approach = np.asarray([distance_field(c.GRID_W, c.GRID_H, h).step for h in range(cells)],
+                                        np.int32)
+        else:
+            self._approach = np.full((cells, cells), -1, np.int32)
+        tb = load_tablebase(c) if getattr(c, "AI_USE_DISTANCE_FIELD", True) else None
+        if tb is not None:
+            # [human cell, roo cell, human stamina bucket] -> solved jump (-1: not forced)
+            moves = (np.frombuffer(tb.entries(), np.uint8)[0::2] & 7).astype(np.int32)
+            moves[moves == NO_MOVE] = -1
+            self._tb_moves = moves.reshape(cells, cells, tb.buckets)
+            self._tb_walk = float(tb.walk_cost)
+        else:
+            self._tb_moves = None
+        reach = reachability(c.GRID_W, c.GRID_H, human_steps_per_decision(c))
+        # [human cell, roo cell] -> roo can force contact
+        self._forced = np.asarray([[bool(m >> r & 1) for r in range(cells)] for m in reach.forced], bool)
+        n = self.n
+        # positions / facing
+        self.hx = np.zeros(n, np.int32); self.hy = np.zeros(n, np.int32)
+        self.rx = np.zeros(n, np.int32); self.ry = np.zeros(n, np.int32)
+        self.h_face = np.zeros(n, np.int8); self.r_face = np.zeros(n, np.int8)
+        # hp / stamina / lives
+        self.hp   = np.zeros(n, np.float64)
+        self.st_h = np.zeros(n, np.float64)
+        self.st_r = np.zeros(n, np.float64)
+        self.lives_halves = np.zeros(n, np.int8)
+        # flags
+        self.blocking   = np.zeros(n, bool)
+        self.block_held = np.zeros(n, bool)
+        self.intend     = np.zeros(n, bool)
+        self.winner     = np.zeros(n, np.int8)
+        self.landed     = np.zeros(n, np.int16)   # punches that connected (hit or blocked) this round
+        self.stalemate  = np.zeros(n, bool)
+        self.evade_since = np.zeros(n, np.int64)  # -1: roo can force contact
+        # timers (absolute ms)
+        self.round_start   = np.zeros(n, np.int64)
+        self.last_move     = np.zeros(n, np.int64)
+        self.hitstop_until = np.zeros(n, np.int64)
+        self.ai_pause      = np.zeros(n, np.int64)
+        self.last_ai       = np.zeros(n, np.int64)
+        self.last_punch    = np.zeros(n, np.int64)
+        self.windup_until  = np.zeros(n, np.int64)
+
+        # tallies
+        self.wins_h = 0
+        self.wins_r = 0
+        self.rounds = 0
+        self.round_ms_total = 0
+        self.punches = 0
+        self.hits = 0
+        self.stalemates = 0   # rounds that ran out the clock without a single punch landing
+        self.stalemate_flags = 0  # stalemate watch firings (see src/reachability.py)
+
+        self.reset(np.ones(n, bool))
+
+    # ---------- lanes ----------
+    def reset(self, mask: np.ndarray):
+        """Start a fresh round in the selected lanes (bool mask or index array; same state as MatchSim.next_round)."""
+        c = self.cfg
+        self.hx[mask] = 1;              self.hy[mask] = c.GRID_H // 2
+        self.rx[mask] = c.GRID_W - 2;   self.ry[mask] = c.GRID_H // 2
+        self.h_face[mask] = R_FACE_RIGHT
+        self.r_face[mask] = R_FACE_LEFT
+        self.hp[mask]   = getattr(c, "HUMAN_STAMINA", 100)
+        self.st_h[mask] = getattr(c, "HUMAN_STAMINA", 100)
+        self.st_r[mask] = getattr(c, "ROO_STAMINA", 100)
+        self.lives_halves[mask] = getattr(c, "HUMAN_HEARTS", 2) * 2
+        self.blocking[mask] = False
+        self.block_held[mask] = False
+        self.intend[mask] = False
+        self.winner[mask] = WIN_NONE
+        self.landed[mask] = 0
+        self.stalemate[mask] = False
+        self.evade_since[mask] = -1
+        self.round_start[mask] = self.now
+        self.last_move[mask] = 0
+        self.hitstop_until[mask] = 0
+        self.ai_pause[mask] = 0
+        self.last_ai[mask] = 0
+        self.last_punch[mask] = -10_000
+        self.windup_until[mask] = 0
+
+    def _safe_move_roo(self, idx: np.ndarray, k: np.ndarray) -> np.ndarray:
+        """
+        Vectorized MatchSim._safe_move_roo for lanes `idx`, offset SAFE_OFFSETS[k] per lane
+        (one gather from the precomputed table). Returns the subset of idx that actually moved.
+        """
+        cols = self.cfg.GRID_W
+        rx = self.rx[idx]
+        dst = self._roo_safe[self.ry[idx] * cols + rx, self.hy[idx] * cols + self.hx[idx], k]
+        ok = dst >= 0
+        moved, dst, rx = idx[ok], dst[ok], rx[ok]
+        tx, ty = dst % cols, dst // cols
+        face = self.r_face[moved]
+        face[tx > rx] = R_FACE_RIGHT
+        face[tx < rx] = R_FACE_LEFT
+        self.r_face[moved] = face
+        self.rx[moved] = tx
+        self.ry[moved] = ty
+        return moved
+
+    # ---------- step ----------
+    def step(self, actions: np.ndarray) -> np.ndarray:
+        """
+        Advance every lane by dt_ms. Returns the boolean mask of lanes that ended this step.
+        Per-step work is dense only for stamina; moves, AI decisions and punches touch the
+        (few) lanes that are due, via index arrays.
+        """
+        c = self.cfg
+        self.now += self.dt_ms
+        now = self.now
+        dt_sec = self.dt_ms / 1000.0
+        actions = np.asarray(actions)
+        active = self.winner == WIN_NONE
+        st_h, st_r = self.st_h, self.st_r
+
+        # SPACE edges
+        want_block = (actions & ACT_BLOCK) != 0
+        edge = active & (want_block != self.block_held)
+        if edge.any():
+            self.block_held ^= edge
+            self.blocking[edge] = want_block[edge]
+
+        live = active & (self.hitstop_until <= now)
+
+        # Human stamina drain/regen
+        drain = live & self.blocking
+        regen = live & ~drain
+        st_h -= drain * (c.BLOCK_DRAIN_PER_SEC * dt_sec)
+        st_h += regen * (c.ST_REGEN_PER_SEC_H * dt_sec)
+        np.clip(st_h, 0.0, self._st_h_max, out=st_h)
+        self.blocking &= ~(drain & (st_h <= c.BLOCK_MIN_STAMINA))
+
+        # Round countdown (every lane of a batch shares the round length, so check the oldest)
+        if now - int(self.round_start.min()) >= c.ROUND_SECONDS * 1000:
+            timeout = live & ((now - self.round_start) // 1000 >= c.ROUND_SECONDS)
+            t = np.flatnonzero(timeout)
+            self._timeout_winner(t)
+            live &= ~timeout
+
+        # Stalemate watch (same rule as MatchSim)
+        cols = c.GRID_W
+        evade = ~self._forced[self.hy * cols + self.hx, self.ry * cols + self.rx]
+        since = np.where(evade, np.where(self.evade_since < 0, now, self.evade_since), -1)
+        np.copyto(self.evade_since, since, where=live)
+        self.stalemate &= ~(live & ~evade)
+        fire = live & evade & ~self.stalemate & (now - self.evade_since >= c.STALEMATE_MS)
+        if fire.any():
+            self.stalemate |= fire
+            self.stalemate_flags += int(np.count_nonzero(fire))
+            if c.STALEMATE_END_ROUND:
+                self._timeout_winner(np.flatnonzero(fire))
+                live &= ~fire
+
+        # Human move
+        d = actions & _DIR_MASK
+        i = np.flatnonzero(live & (d != ACT_NONE) & (now - self.last_move >= c.MOVE_COOLDOWN_MS))
+        if i.size:
+            di = d[i]
+            self.h_face[i[di == ACT_LEFT]] = R_FACE_LEFT
+            self.h_face[i[di == ACT_RIGHT]] = R_FACE_RIGHT
+            nx = self.hx[i] + (di == ACT_RIGHT) - (di == ACT_LEFT)
+            ny = self.hy[i] + (di == ACT_DOWN) - (di == ACT_UP)
+            ok = ((nx >= 0) & (nx < c.GRID_W) & (ny >= 0) & (ny < c.GRID_H)
+                  & ~((nx == self.rx[i]) & (ny == self.ry[i]))
+                  & (st_h[i] >= c.WALK_COST))
+            i, nx, ny = i[ok], nx[ok], ny[ok]
+            self.hx[i] = nx
+            self.hy[i] = ny
+            st_h[i] -= c.WALK_COST
+            self.last_move[i] = now
+            rx = self.rx[i]
+            self.r_face[i[nx > rx]] = R_FACE_RIGHT
+            self.r_face[i[nx < rx]] = R_FACE_LEFT
+
+        # AI tick
+        ai = live & (self.ai_pause <= now)
+        rest = ai & (st_r < c.ROO_REST_THRESHOLD)
+        st_r += rest * (c.ST_REGEN_PER_SEC_R * dt_sec)
+        np.minimum(st_r, self._st_r_max, out=st_r)
+        ai &= ~rest
+        dx = self.hx - self.rx
+        np.copyto(self.r_face, np.where(dx >= 0, R_FACE_RIGHT, R_FACE_LEFT).astype(np.int8), where=ai)
+        if not self.face_only:
+            if self.ai_punch:
+                wind = (ai & (now - self.last_punch >= c.PUNCH_COOLDOWN_MS)
+                        & ~self.intend & (self.hy == self.ry))
+                self.intend |= wind
+                self.windup_until[wind] = now + c.PUNCH_WINDUP_MS
+                ai &= ~wind
+            if self.ai_follow:
+                i = np.flatnonzero(ai & (now - self.last_ai >= c.AI_DECIDE_EVERY_MS))
+                if i.size:
+                    self.last_ai[i] = now
+                    dxi = dx[i]
+                    dyi = self.hy[i] - self.ry[i]
+                    on_x = dxi != 0
+                    k = np.where(on_x, np.where(dxi > 0, K_RIGHT2, K_LEFT2),
+                                 np.where(dyi > 0, K_DOWN2, K_UP2))
+                    hi = self.hy[i] * c.GRID_W + self.hx[i]
+                    ri = self.ry[i] * c.GRID_W + self.rx[i]
+                    kf = self._approach[hi, ri]
+                    if self._tb_moves is not None:
+                        b = np.clip((st_h[i] // self._tb_walk).astype(np.int32), 0, self._tb_moves.shape[2] - 1)
+                        kt = self._tb_moves[hi, ri, b]
+                        kf = np.where(kt >= 0, kt, kf)
+                    go = (kf >= 0) | on_x | (dyi != 0)
+                    k = np.where(kf >= 0, kf, k)
+                    moved = self._safe_move_roo(i[go], k[go])
+                    st_r[moved] = np.maximum(0.0, st_r[moved] - c.ROO_JUMP_ST_DRAIN)
+
+        # Punch commit
+        if self.ai_punch:
+            i = np.flatnonzero(live & self.intend & (self.windup_until <= now))
+            if i.size:
+                self._commit(i, now)
+
+        ended = active & (self.winner != WIN_NONE)
+        if ended.any():
+            e = np.flatnonzero(ended)
+            self.wins_h += int(np.count_nonzero(self.winner[e] == WIN_HUMAN))
+            self.wins_r += int(np.count_nonzero(self.winner[e] == WIN_ROO))
+            self.rounds += int(e.size)
+            self.stalemates += int(np.count_nonzero(self.landed[e] == 0))
+            self.round_ms_total += int((now - self.round_start[e]).sum())
+            if self.auto_reset:
+                self.reset(e)
+        return ended
+
+    def _timeout_winner(self, t: np.ndarray):
+        alive = (self.hp[t] > 0) & (self.lives_halves[t] > 0)
+        self.winner[t] = np.where(alive, WIN_HUMAN, WIN_ROO)
+
+    def _commit(self, i: np.ndarray, now: int):
+        """Resolve the punches (lanes i) that finished their wind-up this step."""
+        c = self.cfg
+        self.intend[i] = False
+        self.r_face[i] = np.where(self.hx[i] - self.rx[i] >= 0, R_FACE_RIGHT, R_FACE_LEFT)
+        self.last_punch[i] = now
+        hit = self.hy[i] == self.ry[i]
+        self.ai_pause[i[~hit]] = now + 220
+        self.punches += int(i.size)
+        self.hits += int(np.count_nonzero(hit))
+        i = i[hit]
+        self.landed[i] += 1
+
+        blocked = self.blocking[i]
+        b = i[blocked]
+        if b.size:
+            self.hp[b] = np.maximum(0.0, self.hp[b] - c.PUNCH_BLOCKED_DAMAGE)
+            self.st_r[b] = np.maximum(0.0, self.st_r[b] - c.BLOCK_SHARED_LOSS)
+            self.st_h[b] = np.maximum(0.0, self.st_h[b] - c.BLOCK_SHARED_LOSS * 0.5)
+            self.hitstop_until[b] = now + c.HITSTOP_MS
+            # step back: opposite X, then up, then down
+            back = np.where(self.r_face[b] == R_FACE_RIGHT, K_LEFT1, K_RIGHT1)
+            left = np.setdiff1d(b, self._safe_move_roo(b, back))
+            left = np.setdiff1d(left, self._safe_move_roo(left, K_UP1))
+            self._safe_move_roo(left, K_DOWN1)
+            self.ai_pause[b] = now + c.BLOCK_RECOVER_MS
+
+        h = i[~blocked]
+        if h.size:
+            hp = self.hp[h] - c.PUNCH_DAMAGE
+            self.hitstop_until[h] = now + c.HITSTOP_MS
+            ko = hp <= 0
+            hp[ko] = self._st_h_max
+            self.hp[h] = np.maximum(0.0, hp)
+            k = h[ko]
+            self.lives_halves[k] = np.maximum(0, self.lives_halves[k] - 1)
+            self.winner[k[self.lives_halves[k] == 0]] = WIN_ROO
+
+    # ---------- convenience ----------
+    def run_rounds(self, n_rounds: int, seed: int = 0, p_block: float = 0.3,
+                   policy=None) -> dict:
+        """
+        Step until at least n_rounds rounds have finished and return the tallies.
+        policy(bs, rng) -> actions; defaults to random_actions.
+        """
+        rng = np.random.default_rng(seed)
+        while self.rounds < n_rounds:
+            acts = policy(self, rng) if policy else random_actions(rng, self.n, p_block)
+            self.step(acts)
+        return self.stats()
+
+    def stats(self) -> dict:
+        r = max(1, self.rounds)
+        return {
+            "rounds": self.rounds,
+            "roo_win_rate": self.wins_r / r,
+            "human_win_rate": self.wins_h / r,
+            "mean_round_ms": self.round_ms_total / r,
+            "hit_rate": self.hits / max(1, self.punches),
+            "stalemate_rate": self.stalemates / r,
+            "stalemate_flag_rate": self.stalemate_flags / r,
+        }
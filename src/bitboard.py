@@ -0,0 +1,127 @@
+# src/bitboard.py
+"""
+Bitboard view of the grid + move tables precomputed once per (cols, rows).
+
+A cell (x, y) is index i = y * cols + x and bit (1 << i); the 8x5 board fits in a
+40-bit int. Tables are plain tuples indexed by cell, built on first use and cached
+per grid size, so rule checks are a lookup plus a bit test:
+
+    t = move_tables(8, 5)
+    t.human_legal[h][r] >> dst & 1     # human at h may step to dst while roo is at r
+    t.roo_legal[r][h]   >> dst & 1     # roo at r may jump to dst (no landing on / passing h)
+    t.human_moves[h][r]                # tuple of destination cells, no allocation
+
+roo_safe[r][h][k] mirrors the game's "safe move" for the offsets in SAFE_OFFSETS
+(clamp to board, stop one short when the human is in the way, -1 = blocked).
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+GridPos = Tuple[int, int]
+
+# Offsets the kangaroo AI actually asks for: 2-tile follow jumps and 1-tile step backs
+SAFE_OFFSETS: Tuple[GridPos, ...] = (
+    (2, 0), (-2, 0), (0, 2), (0, -2),
+    (1, 0), (-1, 0), (0, 1), (0, -1),
+)
+SAFE_INDEX = {off: k for k, off in enumerate(SAFE_OFFSETS)}
+
+
+def iter_bits(mask: int):
+    """Yield the cell index of every set bit, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+@dataclass(frozen=True)
+class MoveTables:
+    cols: int
+    rows: int
+    full: int                                   # mask with every cell set
+    human_steps: Tuple[int, ...]                # [i] -> 4-neighbour mask
+    roo_jumps: Tuple[int, ...]                  # [i] -> in-bounds ±2 landing mask
+    human_legal: Tuple[Tuple[int, ...], ...]    # [h][r] -> legal step mask
+    roo_legal: Tuple[Tuple[int, ...], ...]      # [r][h] -> legal jump mask
+    human_moves: Tuple[Tuple[Tuple[int, ...], ...], ...]   # [h][r] -> destinations
+    roo_moves: Tuple[Tuple[Tuple[int, ...], ...], ...]     # [r][h] -> destinations
+    roo_safe: Tuple[Tuple[Tuple[int, ...], ...], ...]      # [r][h][k] -> dst or -1
+
+    @property
+    def cells(self) -> int:
+        return self.cols * self.rows
+
+    def idx(self, p: GridPos) -> int:
+        return p[1] * self.cols + p[0]
+
+    def pos(self, i: int) -> GridPos:
+        return (i % self.cols, i // self.cols)
+
+    def bit(self, p: GridPos) -> int:
+        return 1 << (p[1] * self.cols + p[0])
+
+
+def _safe_dst(r: GridPos, h: GridPos, off: GridPos, cols: int, rows: int) -> int:
+    """Reference 'safe move' (same logic as MatchSim._safe_move_roo), as a cell index or -1."""
+    rx, ry = r
+    tx = max(0, min(cols - 1, rx + off[0]))
+    ty = max(0, min(rows - 1, ry + off[1]))
+    mid = (rx + (1 if tx > rx else -1 if tx < rx else 0),
+           ry + (1 if ty > ry else -1 if ty < ry else 0))
+    if mid == h or (tx, ty) == h:
+        tx, ty = mid
+        if (tx, ty) == h:
+            return -1
+    return ty * cols + tx
+
+
+@lru_cache(maxsize=None)
+def move_tables(cols: int, rows: int) -> MoveTables:
+    """Build (once per grid size) every move table used by the rules, AI and batch sims."""
+    n = cols * rows
+
+    def ok(x, y): return 0 <= x < cols and 0 <= y < rows
+
+    steps, jumps = [], []
+    for i in range(n):
+        x, y = i % cols, i // cols
+        s = j = 0
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            if ok(x + dx, y + dy):
+                s |= 1 << ((y + dy) * cols + x + dx)
+            if ok(x + 2 * dx, y + 2 * dy):
+                j |= 1 << ((y + 2 * dy) * cols + x + 2 * dx)
+        steps.append(s)
+        jumps.append(j)
+
+    human_legal, roo_legal, roo_safe = [], [], []
+    for a in range(n):
+        h_row, r_row, safe_row = [], [], []
+        for b in range(n):
+            bbit = 1 << b
+            # human at a, roo at b: any free neighbour
+            h_row.append(steps[a] & ~bbit)
+            # roo at a, human at b: no landing on b, no passing through b
+            shadow = 0
+            if steps[a] & bbit:
+                far = 2 * b - a
+                if 0 <= far < n and jumps[a] >> far & 1:
+                    shadow = 1 << far
+            r_row.append(jumps[a] & ~bbit & ~shadow)
+            safe_row.append(tuple(_safe_dst((a % cols, a // cols), (b % cols, b // cols), off, cols, rows)
+                                  if a != b else -1 for off in SAFE_OFFSETS))
+        human_legal.append(tuple(h_row))
+        roo_legal.append(tuple(r_row))
+        roo_safe.append(tuple(safe_row))
+
+    return MoveTables(
+        cols=cols, rows=rows, full=(1 << n) - 1,
+        human_steps=tuple(steps), roo_jumps=tuple(jumps),
+        human_legal=tuple(human_legal), roo_legal=tuple(roo_legal),
+        human_moves=tuple(tuple(tuple(iter_bits(m)) for m in row) for row in human_legal),
+        roo_moves=tuple(tuple(tuple(iter_bits(m)) for m in row) for row in roo_legal),
+        roo_safe=tuple(roo_safe),
+    )
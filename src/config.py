@@ -35,7 +35,7 @@ class _CFG:
     GRID_DARK:  tuple = COL_GRID_DARK
 
     # --- Hitbox config ---
-    HITBOX_MODE = "bbox"  # "bbox" | "parts" | "mask", using bbox (yellow box) this time
+    HITBOX_MODE = "bbox"  # "bbox" | "parts" | "mask" | "poly" (convex pieces), using bbox (yellow box) this time
     HITBOX_JSON = "assets/animation/hitbox_meta.json"
 
     # --- Debug draw toggles ---
@@ -45,7 +45,18 @@ class _CFG:
 
     # --- Gameplay timing ---
     FPS: int = 60
+    DIRTY_RECTS: bool = False              # opt-in: redraw/present only changed regions (screens with dirty_region)
+    TEXT_CACHE_SIZE: int = 256             # rendered text surfaces kept by ui.text_cache (LRU)
+    LOGIC_STEP_MS: int = 8                 # fixed logic step (~120 Hz); whole ms keep the sim's timers exact
+    MAX_LOGIC_STEPS: int = 5               # frame-skip cap: logic steps per rendered frame, the rest is dropped
+    RECORD_REPLAYS: bool = False           # opt-in: write each match's input edges (src/replay.py) to REPLAY_DIR
+    REPLAY_DIR: str = "replays"            # relative to the repo root
+    REPLAY_KEEP: int = 50                  # newest match files kept in REPLAY_DIR (0 = keep all)
+    ASSET_CACHE: bool = True               # keep cell-fitted sprite pixels on disk (src/assets.load_scaled)
+    ASSET_CACHE_DIR: str = ".cache/assets"
     ROUND_SECONDS: int = 20
+    STALEMATE_MS: int = 3000               # flag a round once the roo can't force contact for this long
+    STALEMATE_END_ROUND: bool = False      # True: end flagged rounds early (soak/balancing runs)
 
     # Evade & combat
     EVADE_GRACE_MS: int = 120
@@ -110,5 +121,7 @@ class _CFG:
     AI_TURN_ONLY_MODE: bool = False        # <<< TEMP: only face the player, do not move/punch
     AI_ALLOW_MOVE: bool = True             # master switch for enabling movement
     AI_ALLOW_PUNCH: bool = True            # master switch for enabling punching
+    AI_USE_DISTANCE_FIELD: bool = True     # follow the shortest jump path (src/pathing.py); False = old greedy X-then-Y
+    AI_TABLEBASE: str = "assets/tablebase.bin"  # solved chase moves (python -m src.tablebase); "" or missing/stale file = distance field
 
 CFG = _CFG()
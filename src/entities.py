@@ -2,6 +2,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Tuple
 
+from src.bitboard import move_tables
+
 GridPos = Tuple[int, int]
 
 # --------- Utilities ---------
@@ -31,18 +33,11 @@ class Entity:
 class Human(Entity):
     def can_move(self, x: int, y: int, roo_pos: GridPos, cols: int, rows: int) -> bool:
         """Human can only move 1 tile in up/down/left/right; cannot go out of bounds; cannot occupy the same tile as the kangaroo."""
-        nx, ny = x, y
-        # Must move exactly 1 tile and not diagonally
-        dx, dy = nx - self.pos[0], ny - self.pos[1]
-        if (abs(dx) + abs(dy)) != 1:
-            return False
-        # Bounds
-        if not in_bounds((nx, ny), cols, rows):
-            return False
-        # Cannot overlap with kangaroo
-        if (nx, ny) == roo_pos:
+        if not (0 <= x < cols and 0 <= y < rows):
             return False
-        return True
+        # Precomputed per grid size: 4-neighbours minus the kangaroo's cell
+        t = move_tables(cols, rows)
+        return bool(t.human_legal[t.idx(self.pos)][t.idx(roo_pos)] >> (y * cols + x) & 1)
 
 # --------- Kangaroo: jumps 2 tiles each time, 4-connected; cannot pass through or land on human ---------
 @dataclass
@@ -55,28 +50,11 @@ class Kangaroo(Entity):
         - Cannot land on the human's position
         - The middle tile cannot be occupied by the human (no passing through)
         """
-        nx, ny = x, y
-        dx, dy = nx - self.pos[0], ny - self.pos[1]
-
-        # Orthogonal two tiles
-        is_orth_two = ((abs(dx) == 2 and dy == 0) or (abs(dy) == 2 and dx == 0))
-        if not is_orth_two:
-            return False
-
-        if not in_bounds((nx, ny), cols, rows):
+        if not (0 <= x < cols and 0 <= y < rows):
             return False
-
-        # Cannot land on the player
-        if (nx, ny) == human_pos:
-            return False
-
-        # Middle tile cannot be the player (prevent passing through)
-        mid = (self.pos[0] + (1 if dx > 0 else (-1 if dx < 0 else 0)),
-               self.pos[1] + (1 if dy > 0 else (-1 if dy < 0 else 0)))
-        if mid == human_pos:
-            return False
-
-        return True
+        # Precomputed per grid size: ±2 landings minus the human's cell and the cell behind it
+        t = move_tables(cols, rows)
+        return bool(t.roo_legal[t.idx(self.pos)][t.idx(human_pos)] >> (y * cols + x) & 1)
 
     def ai_jump_towards(self, human_pos: GridPos, block_pos: GridPos,
                         cols: int, rows: int) -> None:
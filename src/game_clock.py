@@ -0,0 +1,88 @@
+# src/game_clock.py
+"""
+GameClock: the one time source for screens (owned by ScreenManager as m.game_clock).
+
+Wall time only paces frames; game time (now, in ms) moves in fixed logic steps:
+
+    dt = m.game_clock.tick(CFG.FPS)           # wait for the next frame (fake: no wait)
+    m.game_clock.advance(dt, m.update)        # runs m.update(step_ms) 0..n times
+    ... draw using m.game_clock.now / .alpha
+
+  - pause()/resume(): game time stops (the round timer no longer runs under PauseScreen)
+  - scale:            game ms per wall ms (0.5 = slow motion, 4 = fast)
+  - fast_forward(ms): run ms of game time on the next advance, ignoring the frame-skip cap
+  - fake mode (no pygame clock): tick() returns a nominal frame without sleeping, so
+    headless runs go as fast as the CPU allows and are fully deterministic
+"""
+from __future__ import annotations
+import math
+from typing import Callable, Optional
+
+from src.config import CFG
+
+
+class GameClock:
+    def __init__(self, clock=None, step_ms: Optional[int] = None, max_steps: Optional[int] = None,
+                 start_ms: int = 0):
+        self.clock = clock                       # pygame.time.Clock, or None = fake mode
+        self.step_ms = max(1, int(step_ms if step_ms is not None else getattr(CFG, "LOGIC_STEP_MS", 8)))
+        self.max_steps = max(1, int(max_steps if max_steps is not None else getattr(CFG, "MAX_LOGIC_STEPS", 5)))
+        self.now = int(start_ms)                 # game ms, advanced only by logic steps
+        self.alpha = 1.0                         # fraction of a step since the last one (render interpolation)
+        self.scale = 1.0
+        self.paused = False
+        self._acc = 0.0
+        self._ff = 0
+
+    @property
+    def fake(self) -> bool:
+        return self.clock is None
+
+    # --- frame pacing ---
+    def tick(self, fps: int) -> int:
+        """Wall ms since the last frame; fake mode returns one nominal frame immediately."""
+        if self.clock is None:
+            return int(1000 // max(1, fps))
+        return self.clock.tick(fps)
+
+    # --- controls ---
+    def pause(self):
+        self.paused = True
+
+    def resume(self):
+        self.paused = False
+
+    def set_scale(self, scale: float):
+        self.scale = max(0.0, float(scale))
+
+    def fast_forward(self, ms: int):
+        self._ff += max(0, int(ms))
+
+    def reset(self, start_ms: int = 0):
+        self.now = int(start_ms)
+        self._acc, self._ff, self.alpha = 0.0, 0, 1.0
+
+    # --- stepping ---
+    def advance(self, frame_ms: float, update: Callable[[int], None]) -> int:
+        """Feed one frame of wall time; run update(step_ms) once per due logic step. Returns the step count."""
+        if self.paused:
+            return 0
+        self._acc += frame_ms * self.scale
+        cap = self.max_steps * max(1, math.ceil(self.scale))
+        steps = 0
+        while self._acc >= self.step_ms and steps < cap:
+            self._step(update)
+            self._acc -= self.step_ms
+            steps += 1
+        if steps == cap and self._acc >= self.step_ms:
+            self._acc %= self.step_ms   # slow frame: skip the backlog instead of spiralling
+        while self._ff >= self.step_ms:
+            self._step(update)
+            self._ff -= self.step_ms
+            steps += 1
+        self.alpha = self._acc / self.step_ms
+        return steps
+
+    def _step(self, update: Callable[[int], None]):
+        self.now += self.step_ms
+        update(self.step_ms)
@@ -0,0 +1,254 @@
+# src/hitbox_bin.py
+"""
+Compiled hitbox metadata: hitbox_meta.json (the editable source) as a compact binary
+file next to it, mapped with mmap and decoded one frame at a time.
+
+The JSON is ~500 KB, almost all of it maskPoly pixel outlines, and parsing it whole
+on first use used to stall the first punch. The binary keeps the same data as int16
+arrays behind a fixed-size header and a per-frame offset index, so opening it costs
+one header read and a frame is decoded (into the same dict shape as the JSON) the
+first time it is looked up. Compiling also runs the offline polygon stage
+(src/polygon.py): each maskPoly is simplified within a tolerance ("polySimple", tens
+of vertices) and split into convex pieces ("convex") for HITBOX_MODE "poly".
+
+File layout (little endian):
+    header   magic b"PFPHB1", version u16, frame count u16, sha1 of the source JSON (20 bytes),
+             simplification tolerance u16 (1/100 px)
+    index    per frame: name (32 bytes, utf-8, NUL padded), record offset u32, record size u32
+    record   flags u16, part count u16, poly point count u32, simple point count u16,
+             convex piece count u16, then int16 arrays:
+             bbox x,y,w,h (flag 1) | fist.left (2) | fist.right (4) | punchL (8) | punchR (16)
+             | parts x,y,w,h * count | maskPoly x,y * count | polySimple x,y * count
+             | convex piece sizes * count | convex piece x,y * (sum of sizes)
+A source JSON whose hash differs from the header makes the file stale (the JSON is used).
+
+    python -m src.hitbox_bin                       # compile assets/animation/hitbox_meta.json
+    python -m src.hitbox_bin path/to/meta.json --tolerance 1.5
+"""
+from __future__ import annotations
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from src.polygon import convex_pieces, simplify
+
+_MAGIC = b"PFPHB1"
+_VERSION = 2
+_HEADER = struct.Struct("<6sHH20sH")
+_ENTRY = struct.Struct("<32sII")
+_RECORD = struct.Struct("<HHIHH")
+DEFAULT_TOLERANCE = 1.5
+
+F_BBOX, F_FIST_L, F_FIST_R, F_PUNCH_L, F_PUNCH_R = 1, 2, 4, 8, 16
+_POINTS = ((F_FIST_L, ("fist", "left")), (F_FIST_R, ("fist", "right")),
+           (F_PUNCH_L, ("punchL",)), (F_PUNCH_R, ("punchR",)))
+
+
+def bin_path(json_path) -> str:
+    return str(Path(json_path).with_suffix(".bin"))
+
+
+def _sha1(data: bytes) -> bytes:
+    return hashlib.sha1(data).digest()
+
+
+def _i16(values, what: str) -> array:
+    out = array("h")
+    for v in values:
+        if int(v) != v or not -32768 <= v <= 32767:
+            raise ValueError(f"{what}: {v!r} is not an int16")
+        out.append(int(v))
+    return out
+
+
+def _point(meta: dict, path) -> Optional[list]:
+    for k in path:
+        meta = meta.get(k) if isinstance(meta, dict) else None
+    return meta
+
+
+def _record(name: str, meta: dict, tolerance: float) -> bytes:
+    flags, arrs = 0, array("h")
+    if meta.get("bbox"):
+        flags |= F_BBOX
+        arrs += _i16(meta["bbox"], f"{name} bbox")
+    for flag, path in _POINTS:
+        pt = _point(meta, path)
+        if pt is not None:
+            flags |= flag
+            arrs += _i16(pt, f"{name} {'.'.join(path)}")
+    parts = meta.get("parts") or []
+    for r in parts:
+        arrs += _i16((r["x"], r["y"], r["w"], r["h"]), f"{name} parts")
+    poly = meta.get("maskPoly") or []
+    for p in poly:
+        arrs += _i16(p, f"{name} maskPoly")
+    simple = simplify(poly, tolerance) if len(poly) >= 3 else []
+    pieces = convex_pieces(simple) if len(simple) >= 3 else []
+    for p in simple:
+        arrs += _i16(p, f"{name} polySimple")
+    arrs += _i16([len(pc) for pc in pieces], f"{name} convex")
+    for pc in pieces:
+        for p in pc:
+            arrs += _i16(p, f"{name} convex")
+    if sys.byteorder == "big":
+        arrs.byteswap()
+    return _RECORD.pack(flags, len(parts), len(poly), len(simple), len(pieces)) + arrs.tobytes()
+
+
+def compile_meta(source: bytes, tolerance: float = DEFAULT_TOLERANCE) -> bytes:
+    """JSON bytes -> binary file bytes (frames in name order, so output is deterministic)."""
+    meta = json.loads(source.decode("utf-8"))
+    names = sorted(meta)
+    records = [_record(n, meta[n], tolerance) for n in names]
+    out = bytearray(_HEADER.pack(_MAGIC, _VERSION, len(names), _sha1(source), int(round(tolerance * 100))))
+    off = _HEADER.size + _ENTRY.size * len(names)
+    for n, rec in zip(names, records):
+        raw = n.encode("utf-8")
+        if len(raw) > 32:
+            raise ValueError(f"frame name too long for the index: {n}")
+        out += _ENTRY.pack(raw, off, len(rec))
+        off += len(rec)
+    for rec in records:
+        out += rec
+    return bytes(out)
+
+
+def build(json_path, out: Optional[str] = None, tolerance: float = DEFAULT_TOLERANCE) -> str:
+    out = out or bin_path(json_path)
+    with open(json_path, "rb") as f:
+        data = compile_meta(f.read(), tolerance)
+    tmp = out + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(data)
+    Path(tmp).replace(out)
+    return out
+
+
+class HitboxFile(Mapping):
+    """Read-only {frame name: meta dict} over a compiled file; a frame is decoded on first lookup."""
+
+    def __init__(self, path: str):
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version = struct.unpack_from("<6sH", self._mm, 0)
+        if magic != _MAGIC or version != _VERSION:
+            self.close()
+            raise ValueError(f"{path} is not a compiled hitbox file (or an unsupported version)")
+        _, _, count, self.source_sha1, tol = _HEADER.unpack_from(self._mm, 0)
+        self.tolerance = tol / 100.0
+        self._index: Dict[str, tuple] = {}
+        for i in range(count):
+            raw, off, size = _ENTRY.unpack_from(self._mm, _HEADER.size + i * _ENTRY.size)
+            self._index[raw.rstrip(b"\0").decode("utf-8")] = (off, size)
+        self._decoded: Dict[str, dict] = {}
+
+    def close(self):
+        self._mm.close()
+        self._f.close()
+
+    def _decode(self, name: str) -> dict:
+        off, size = self._index[name]
+        flags, n_parts, n_poly, n_simple, n_pieces = _RECORD.unpack_from(self._mm, off)
+        a = array("h")
+        a.frombytes(self._mm[off + _RECORD.size: off + size])
+        if sys.byteorder == "big":
+            a.byteswap()
+        meta, i = {}, 0
+        if flags & F_BBOX:
+            meta["bbox"] = list(a[0:4])
+            i = 4
+        for flag, path in _POINTS:
+            if flags & flag:
+                d = meta
+                for k in path[:-1]:
+                    d = d.setdefault(k, {})
+                d[path[-1]] = list(a[i:i + 2])
+                i += 2
+        if n_parts:
+            meta["parts"] = [{"x": a[j], "y": a[j + 1], "w": a[j + 2], "h": a[j + 3]}
+                             for j in range(i, i + 4 * n_parts, 4)]
+            i += 4 * n_parts
+        if n_poly:
+            meta["maskPoly"] = [[a[j], a[j + 1]] for j in range(i, i + 2 * n_poly, 2)]
+            i += 2 * n_poly
+        if n_simple:
+            meta["polySimple"] = [[a[j], a[j + 1]] for j in range(i, i + 2 * n_simple, 2)]
+            i += 2 * n_simple
+        if n_pieces:
+            sizes = a[i:i + n_pieces]
+            i += n_pieces
+            meta["convex"] = []
+            for sz in sizes:
+                meta["convex"].append([[a[j], a[j + 1]] for j in range(i, i + 2 * sz, 2)])
+                i += 2 * sz
+        return meta
+
+    def __getitem__(self, name: str) -> dict:
+        meta = self._decoded.get(name)
+        if meta is None:
+            meta = self._decoded[name] = self._decode(name)
+        return meta
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+
+def load_compiled(json_path) -> Optional[HitboxFile]:
+    """The compiled file for json_path, or None if it is missing, unreadable or stale."""
+    path = bin_path(json_path)
+    try:
+        hb = HitboxFile(path)
+    except (OSError, ValueError, struct.error):
+        return None
+    try:
+        with open(json_path, "rb") as f:
+            current = _sha1(f.read())
+    except OSError:
+        return hb          # compiled file shipped without its source
+    if current != hb.source_sha1:
+        hb.close()
+        print(f"[hitbox] {path} is stale; rebuild with: python -m src.hitbox_bin", file=sys.stderr)
+        return None
+    return hb
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Compile hitbox_meta.json into hitbox_meta.bin.")
+    ap.add_argument("json", nargs="?",
+                    default=str(Path(__file__).resolve().parents[1] / "assets" / "animation" / "hitbox_meta.json"))
+    ap.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="max outline deviation of polySimple, in source pixels")
+    args = ap.parse_args(argv)
+
+    out = build(args.json, tolerance=args.tolerance)
+    hb = HitboxFile(out)
+    with open(args.json, "rb") as f:
+        ref = json.loads(f.read().decode("utf-8"))
+    for n in ref:
+        got = {k: v for k, v in hb[n].items() if k not in ("polySimple", "convex")}
+        assert got == ref[n], f"round trip mismatch for {n}"
+    print(f"[hitbox] {out}: {Path(out).stat().st_size} bytes for {len(hb)} frames "
+          f"(source {Path(args.json).stat().st_size} bytes)")
+    for n in hb:
+        m = hb[n]
+        print(f"  {n:12s} maskPoly {len(m.get('maskPoly', [])):5d} -> {len(m.get('polySimple', [])):3d} vertices, "
+              f"{len(m.get('convex', [])):2d} convex pieces")
+    hb.close()
+
+
+if __name__ == "__main__":
+    main()
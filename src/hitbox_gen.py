@@ -0,0 +1,137 @@
+# src/hitbox_gen.py
+"""
+Headless hitbox generator: every frame PNG in assets/animation -> hitbox_meta.json
+(and its compiled hitbox_meta.bin, see src/hitbox_bin.py).
+
+Per frame, in image pixels: "bbox" is the tight bounding rect of the alpha mask
+(alpha >= ALPHA_THR), "parts" one body rect shrunk from it, "maskPoly" the mask
+outline and "fist" the left/right punch points. Frames are analysed in a process
+pool (no window: SDL runs on the dummy driver), and the JSON is written in frame-name
+order with a fixed layout, so the same PNGs always give the same bytes.
+
+Fist points (and punchL/punchR, if present) are hand-tuned: for a frame already in
+the JSON they are kept as they are; only new frames get the default points from
+their bbox. Frames whose PNG is gone are dropped.
+
+    python -m src.hitbox_gen                 # regenerate the JSON, then compile the .bin
+    python -m src.hitbox_gen --check         # exit 1 if the JSON is out of date (writes nothing)
+    python -m src.hitbox_gen --jobs 4 --no-bin
+"""
+from __future__ import annotations
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+import pygame as pg
+
+from src.hitbox_bin import DEFAULT_TOLERANCE, build
+
+_ANIM_DIR = Path(__file__).resolve().parents[1] / "assets" / "animation"
+
+ALPHA_THR = 170
+SHRINK_X, SHRINK_YU, SHRINK_YD = 0.18, 0.06, 0.14
+HAND_TUNED = ("fist", "punchL", "punchR")
+
+
+def _hit_rect(b: pg.Rect) -> pg.Rect:
+    hit = b.copy()
+    hit.x += int(hit.w * SHRINK_X)
+    hit.w = int(hit.w * (1.0 - SHRINK_X * 2))
+    hit.y += int(hit.h * SHRINK_YU)
+    hit.h = int(hit.h * (1.0 - SHRINK_YU - SHRINK_YD))
+    return hit
+
+
+def default_fists(b: pg.Rect) -> dict:
+    pad_x = int(b.w * 0.07)
+    y = b.y + int(b.h * 0.40)
+    return {"left": [b.left + pad_x, y], "right": [b.right - pad_x, y]}
+
+
+def analyse(path: str) -> Tuple[str, Optional[dict]]:
+    """(frame name, meta without hand-tuned points); meta is None for a fully transparent PNG."""
+    img = pg.image.load(path)
+    m = pg.mask.from_surface(img, ALPHA_THR)
+    rects = m.get_bounding_rects()
+    if not rects:
+        return Path(path).name, None
+    b = rects[0]
+    hit = _hit_rect(b)
+    return Path(path).name, {
+        "bbox": [b.x, b.y, b.w, b.h],
+        "parts": [{"x": hit.x, "y": hit.y, "w": hit.w, "h": hit.h}],
+        "maskPoly": [[int(x), int(y)] for (x, y) in m.outline()],
+    }
+
+
+def generate(anim_dir: Path, previous: Dict[str, dict], jobs: Optional[int] = None) -> Tuple[Dict[str, dict], List[str]]:
+    """({name: meta} in name order, names that got default fists)."""
+    paths = [str(p) for p in sorted(anim_dir.glob("*.png"))]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        analysed = dict(pool.map(analyse, paths, chunksize=4))
+    out, defaulted = {}, []
+    for name in sorted(analysed):
+        meta = analysed[name]
+        if meta is None:
+            print(f"[hitbox] {name}: empty mask, skipped", file=sys.stderr)
+            continue
+        old = previous.get(name) or {}
+        kept = {k: old[k] for k in HAND_TUNED if k in old}
+        if "fist" not in kept:
+            kept["fist"] = default_fists(pg.Rect(meta["bbox"]))
+            defaulted.append(name)
+        meta.update((k, kept[k]) for k in HAND_TUNED if k in kept)
+        out[name] = meta
+    return out, defaulted
+
+
+def dumps(meta: Dict[str, dict]) -> str:
+    return json.dumps(meta, indent=2, ensure_ascii=False)
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Regenerate hitbox_meta.json from the frame PNGs, headless.")
+    ap.add_argument("anim_dir", nargs="?", default=str(_ANIM_DIR))
+    ap.add_argument("--jobs", type=int, default=None, help="worker processes (default: one per CPU)")
+    ap.add_argument("--check", action="store_true", help="only report whether the JSON is up to date")
+    ap.add_argument("--no-bin", action="store_true", help="don't compile hitbox_meta.bin")
+    ap.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                    help="polySimple tolerance passed to the compiler")
+    args = ap.parse_args(argv)
+
+    anim_dir = Path(args.anim_dir)
+    json_path = anim_dir / "hitbox_meta.json"
+    current = json_path.read_text(encoding="utf-8") if json_path.exists() else ""
+    previous = json.loads(current) if current else {}
+
+    meta, defaulted = generate(anim_dir, previous, args.jobs)
+    text = dumps(meta)
+    for name in defaulted:
+        print(f"[hitbox] {name}: new frame, default fist points")
+    for name in sorted(set(previous) - set(meta)):
+        print(f"[hitbox] {name}: no PNG, dropped")
+
+    if args.check:
+        ok = text == current
+        print(f"[hitbox] {json_path} is {'up to date' if ok else 'out of date'}")
+        return 0 if ok else 1
+    if text != current:
+        tmp = json_path.with_suffix(".json.tmp")
+        tmp.write_text(text, encoding="utf-8")
+        tmp.replace(json_path)
+        print(f"[hitbox] wrote {json_path} ({len(meta)} frames)")
+    else:
+        print(f"[hitbox] {json_path} unchanged ({len(meta)} frames)")
+    if not args.no_bin:
+        print(f"[hitbox] compiled {build(json_path, tolerance=args.tolerance)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
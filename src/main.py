@@ -51,8 +51,11 @@ def main():
     manager = ScreenManager(screen, clock, fonts, (WIN_W, WIN_H))
     manager.goto("home")  # 需要在 screens.py 的 routes 中注册 "home"
 
+    # Fixed-step logic: frames feed the manager's GameClock, logic advances in whole steps
+    game_clock = manager.game_clock
+
     while True:
-        dt = clock.tick(CFG.FPS)
+        dt = game_clock.tick(CFG.FPS)
 
         # 无焦点提示层（仅响应点击/关闭）
         if not pg.key.get_focused():
@@ -68,6 +71,7 @@ def main():
                     pg.quit(); sys.exit()
                 if e.type == pg.MOUSEBUTTONDOWN:
                     pass
+            manager.invalidate()
             continue
 
         for e in pg.event.get():
@@ -75,12 +79,11 @@ def main():
                 pg.quit(); sys.exit()
             manager.handle_event(e)
 
-        manager.update(dt)
+        game_clock.advance(dt, manager.update)
 
-        # 先用背景色清屏，避免某个 screen 没有绘制导致纯黑
-        screen.fill(CFG.BG)
+        # 绘制一帧（清屏在 ScreenManager.draw 内），每帧只 present 一次
         manager.draw()
-        pg.display.flip()
+        manager.present()
 
 if __name__ == "__main__":
     main()
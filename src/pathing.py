@@ -0,0 +1,94 @@
+# src/pathing.py
+"""
+Distance fields for kangaroo pathing on the jump graph.
+
+The roo moves with the AI's "safe move" (±2 tiles, clamped at the border, cut one
+tile short when the human is in the way), so which rows/columns it can reach depends
+on parity, the border and where the human stands. For a fixed human cell we run one
+backwards BFS over that graph from every contact cell (same row as the human, the
+rule grid_contact uses) and keep, per roo cell:
+
+    dist[r]  number of jumps to the nearest contact cell (UNREACHABLE if none)
+    step[r]  SAFE_OFFSETS index of the best first jump (-1 at goal / unreachable)
+
+Fields are cached per (cols, rows, human cell), so an AI decision is two lookups.
+"""
+from __future__ import annotations
+from collections import deque
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+from src.bitboard import SAFE_OFFSETS, move_tables
+
+UNREACHABLE = 255
+
+# Jump offsets only (the 1-tile entries of SAFE_OFFSETS are step backs, not pathing moves)
+JUMP_KS = tuple(k for k, (dx, dy) in enumerate(SAFE_OFFSETS) if abs(dx) + abs(dy) == 2)
+
+
+@dataclass(frozen=True)
+class DistanceField:
+    human: int                 # human cell index the field was built for
+    dist: Tuple[int, ...]      # [roo cell] -> jumps to contact
+    step: Tuple[int, ...]      # [roo cell] -> SAFE_OFFSETS index or -1
+
+    def reachable(self, r: int) -> bool:
+        return self.dist[r] != UNREACHABLE
+
+
+def contact_cells(cols: int, rows: int, h: int) -> Tuple[int, ...]:
+    """Cells from which a punch connects on a human at h (same row, not h itself)."""
+    y = h // cols
+    return tuple(y * cols + x for x in range(cols) if y * cols + x != h)
+
+
+@lru_cache(maxsize=None)
+def distance_field(cols: int, rows: int, h: int) -> DistanceField:
+    """BFS distance field (and best first jump) for a human standing on cell h."""
+    t = move_tables(cols, rows)
+    n = cols * rows
+    hx, hy = h % cols, h // cols
+
+    # forward jump graph with the human as blocker; drop no-op moves (clamped in place)
+    fwd = [[] if r == h else [(k, d) for k in JUMP_KS
+                              for d in (t.roo_safe[r][h][k],) if d >= 0 and d != r]
+           for r in range(n)]
+    rev = [[] for _ in range(n)]
+    for r in range(n):
+        for _, d in fwd[r]:
+            rev[d].append(r)
+
+    dist = [UNREACHABLE] * n
+    q = deque()
+    for g in contact_cells(cols, rows, h):
+        dist[g] = 0
+        q.append(g)
+    while q:
+        d = q.popleft()
+        for r in rev[d]:
+            if dist[r] == UNREACHABLE:
+                dist[r] = dist[d] + 1
+                q.append(r)
+
+    # best first jump; ties keep the old AI's habit: toward the human on X, then on Y
+    step = [-1] * n
+    for r in range(n):
+        if dist[r] in (0, UNREACHABLE):
+            continue
+        rx, ry = r % cols, r // cols
+
+        def pref(kd):
+            dx, dy = SAFE_OFFSETS[kd[0]]
+            toward = (dx * (hx - rx) > 0) or (dy * (hy - ry) > 0)
+            return (dist[kd[1]], not toward, dx == 0)
+
+        step[r] = min(fwd[r], key=pref)[0]
+
+    return DistanceField(human=h, dist=tuple(dist), step=tuple(step))
+
+
+def approach_step(cols: int, rows: int, roo_pos, human_pos) -> int:
+    """SAFE_OFFSETS index of the optimal approach jump, or -1 (already in contact / unreachable)."""
+    f = distance_field(cols, rows, human_pos[1] * cols + human_pos[0])
+    return f.step[roo_pos[1] * cols + roo_pos[0]]
@@ -0,0 +1,226 @@
+# src/polygon.py
+"""
+Hit polygons: simplify pixel outlines and split them into convex pieces, offline;
+test convex pieces against each other, per frame.
+
+maskPoly outlines (pg.mask.outline) have one vertex per boundary pixel, 1.4k-2.2k per
+frame. simplify() (Ramer-Douglas-Peucker on the closed contour, max deviation
+`tolerance` px) leaves tens of vertices; convex_pieces() triangulates that (ear
+clipping) and merges triangles back while they stay convex (Hertel-Mehlhorn), giving
+a handful of convex polygons. Two sets of those overlap iff some pair does, which
+pieces_overlap() answers with bounding-box rejects and the separating axis test.
+Points are (x, y) tuples in image pixels, y down.
+"""
+from __future__ import annotations
+from typing import List, Sequence, Tuple
+
+Point = Tuple[float, float]
+Poly = List[Point]
+
+
+def _cross(o: Point, a: Point, b: Point) -> float:
+    return (a[0] - o[0]) * (b[1] - o[1]) - (a[1] - o[1]) * (b[0] - o[0])
+
+
+def signed_area(poly: Sequence[Point]) -> float:
+    n = len(poly)
+    return 0.5 * sum(poly[i][0] * poly[(i + 1) % n][1] - poly[(i + 1) % n][0] * poly[i][1] for i in range(n))
+
+
+def _seg_dist2(p: Point, a: Point, b: Point) -> float:
+    dx, dy = b[0] - a[0], b[1] - a[1]
+    L2 = dx * dx + dy * dy
+    if L2 == 0:
+        return (p[0] - a[0]) ** 2 + (p[1] - a[1]) ** 2
+    t = max(0.0, min(1.0, ((p[0] - a[0]) * dx + (p[1] - a[1]) * dy) / L2))
+    qx, qy = a[0] + t * dx, a[1] + t * dy
+    return (p[0] - qx) ** 2 + (p[1] - qy) ** 2
+
+
+def _rdp(pts: Sequence[Point], tol2: float) -> Poly:
+    """Open-polyline RDP (iterative); keeps both ends."""
+    keep = [False] * len(pts)
+    keep[0] = keep[-1] = True
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        i, j = stack.pop()
+        best, idx = -1.0, -1
+        for k in range(i + 1, j):
+            d = _seg_dist2(pts[k], pts[i], pts[j])
+            if d > best:
+                best, idx = d, k
+        if idx >= 0 and best > tol2:
+            keep[idx] = True
+            stack.append((i, idx))
+            stack.append((idx, j))
+    return [p for p, k in zip(pts, keep) if k]
+
+
+def _clean(poly: Sequence[Point]) -> Poly:
+    """Drop repeated and collinear vertices."""
+    out: Poly = []
+    for p in poly:
+        if not out or p != out[-1]:
+            out.append(p)
+    if len(out) > 1 and out[0] == out[-1]:
+        out.pop()
+    changed = True
+    while changed and len(out) > 3:
+        changed = False
+        for i in range(len(out)):
+            if _cross(out[i - 1], out[i], out[(i + 1) % len(out)]) == 0:
+                del out[i]
+                changed = True
+                break
+    return out
+
+
+def simplify(outline: Sequence[Sequence[float]], tolerance: float = 1.5) -> Poly:
+    """Closed outline -> polygon whose edges stay within tolerance px of every outline point."""
+    pts = _clean([(p[0], p[1]) for p in outline])
+    if len(pts) <= 3:
+        return pts
+    # split the ring at its two most distant points (first point and the farthest from it)
+    far = max(range(len(pts)), key=lambda k: (pts[k][0] - pts[0][0]) ** 2 + (pts[k][1] - pts[0][1]) ** 2)
+    tol2 = tolerance * tolerance
+    a = _rdp(pts[:far + 1], tol2)
+    b = _rdp(pts[far:] + [pts[0]], tol2)
+    return _clean(a[:-1] + b[:-1])
+
+
+def convex_hull(points: Sequence[Point]) -> Poly:
+    """Andrew's monotone chain, counter-clockwise (in y-up terms)."""
+    pts = sorted(set((p[0], p[1]) for p in points))
+    if len(pts) <= 2:
+        return pts
+    lower: Poly = []
+    for p in pts:
+        while len(lower) >= 2 and _cross(lower[-2], lower[-1], p) <= 0:
+            lower.pop()
+        lower.append(p)
+    upper: Poly = []
+    for p in reversed(pts):
+        while len(upper) >= 2 and _cross(upper[-2], upper[-1], p) <= 0:
+            upper.pop()
+        upper.append(p)
+    return lower[:-1] + upper[:-1]
+
+
+def _in_triangle(p: Point, a: Point, b: Point, c: Point) -> bool:
+    return _cross(a, b, p) >= 0 and _cross(b, c, p) >= 0 and _cross(c, a, p) >= 0
+
+
+def _triangulate(poly: Poly) -> List[Tuple[int, int, int]]:
+    """Ear clipping on a positively oriented simple polygon; [] if it gets stuck."""
+    idx = list(range(len(poly)))
+    tris = []
+    guard = 0
+    while len(idx) > 3:
+        n = len(idx)
+        for k in range(n):
+            i0, i1, i2 = idx[k - 1], idx[k], idx[(k + 1) % n]
+            a, b, c = poly[i0], poly[i1], poly[i2]
+            if _cross(a, b, c) <= 0:
+                continue
+            if any(_in_triangle(poly[j], a, b, c) for j in idx if j not in (i0, i1, i2)):
+                continue
+            tris.append((i0, i1, i2))
+            del idx[k]
+            break
+        else:
+            return []
+        guard += 1
+        if guard > 4 * len(poly):
+            return []
+    tris.append(tuple(idx))
+    return tris
+
+
+def _is_convex(piece: Sequence[int], poly: Poly) -> bool:
+    n = len(piece)
+    return all(_cross(poly[piece[i - 1]], poly[piece[i]], poly[piece[(i + 1) % n]]) >= 0 for i in range(n))
+
+
+def _merge(a: List[int], b: List[int]) -> List[int] | None:
+    """Join two index rings sharing one edge (a has u->v, b has v->u); None if they don't."""
+    for i in range(len(a)):
+        u, v = a[i], a[(i + 1) % len(a)]
+        for j in range(len(b)):
+            if b[j] == v and b[(j + 1) % len(b)] == u:
+                # walk a from v round to u, then b's vertices strictly between u and v
+                ring = [a[(i + 1 + k) % len(a)] for k in range(len(a))]
+                ring += [b[(j + 2 + k) % len(b)] for k in range(len(b) - 2)]
+                return ring
+    return None
+
+
+def convex_pieces(poly: Sequence[Point]) -> List[Poly]:
+    """Hertel-Mehlhorn: triangulate, then drop diagonals while the union stays convex."""
+    poly = _clean(list(poly))
+    if len(poly) < 3:
+        return [poly] if poly else []
+    if signed_area(poly) < 0:
+        poly = poly[::-1]
+    tris = _triangulate(poly)
+    if not tris:
+        return [convex_hull(poly)]
+    pieces = [list(t) for t in tris]
+    merged = True
+    while merged:
+        merged = False
+        for i in range(len(pieces)):
+            for j in range(i + 1, len(pieces)):
+                ring = _merge(pieces[i], pieces[j])
+                if ring is not None and _is_convex(ring, poly):
+                    pieces[i] = ring
+                    del pieces[j]
+                    merged = True
+                    break
+            if merged:
+                break
+    return [[poly[k] for k in p] for p in pieces]
+
+
+# -----------------------------------------------------------------------------
+# Per-frame tests
+# -----------------------------------------------------------------------------
+def bounds(poly: Sequence[Point]) -> Tuple[float, float, float, float]:
+    xs = [p[0] for p in poly]
+    ys = [p[1] for p in poly]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def _separated(a: Sequence[Point], b: Sequence[Point]) -> bool:
+    n = len(a)
+    for i in range(n):
+        (x0, y0), (x1, y1) = a[i], a[(i + 1) % n]
+        nx, ny = y0 - y1, x1 - x0
+        amin = amax = a[0][0] * nx + a[0][1] * ny
+        for x, y in a:
+            d = x * nx + y * ny
+            amin, amax = min(amin, d), max(amax, d)
+        bmin = bmax = b[0][0] * nx + b[0][1] * ny
+        for x, y in b:
+            d = x * nx + y * ny
+            bmin, bmax = min(bmin, d), max(bmax, d)
+        if amax < bmin or bmax < amin:
+            return True
+    return False
+
+
+def convex_overlap(a: Sequence[Point], b: Sequence[Point]) -> bool:
+    """Separating axis test for two convex polygons (touching counts as overlap)."""
+    if len(a) < 3 or len(b) < 3:
+        return False
+    return not (_separated(a, b) or _separated(b, a))
+
+
+def pieces_overlap(A: Sequence[Tuple[tuple, Sequence[Point]]], B: Sequence[Tuple[tuple, Sequence[Point]]]) -> bool:
+    """A, B: [(bounds, convex piece)]; any overlapping pair, bounds rejected first."""
+    for (ax0, ay0, ax1, ay1), pa in A:
+        for (bx0, by0, bx1, by1), pb in B:
+            if ax1 < bx0 or bx1 < ax0 or ay1 < by0 or by1 < ay0:
+                continue
+            if convex_overlap(pa, pb):
+                return True
+    return False
@@ -0,0 +1,106 @@
+# src/reachability.py
+"""
+Can the kangaroo force contact, or can the human evade forever?
+
+Model: the roo makes one safe jump per AI decision, then the human answers with up
+to `human_steps` walks (or stands still), never stepping onto the roo's row on the
+way. Contact = same row (grid_contact). A retrograde fixpoint over all (human, roo)
+cell pairs marks the configurations from which the roo wins no matter what the human
+does; every other pair is one where a careful human can keep the round going until
+the clock runs out.
+
+The result is cached per (cols, rows, human_steps) as one bitmask per human cell:
+
+    r = reachability(8, 5)
+    r.roo_forces((1, 2), (6, 0))     # -> bool
+
+MatchSim uses it to flag (and optionally end) stalemated rounds early.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Tuple
+
+from src.bitboard import move_tables
+from src.pathing import JUMP_KS
+
+
+@dataclass(frozen=True)
+class Reachability:
+    cols: int
+    rows: int
+    human_steps: int
+    forced: Tuple[int, ...]     # [human cell] -> bitmask of roo cells where the roo forces contact
+
+    def roo_forces(self, human_pos, roo_pos) -> bool:
+        h = human_pos[1] * self.cols + human_pos[0]
+        return bool(self.forced[h] >> (roo_pos[1] * self.cols + roo_pos[0]) & 1)
+
+    def evade_ratio(self) -> float:
+        """Share of (human, roo) placements where the human can evade forever."""
+        n = self.cols * self.rows
+        forced = sum(bin(m).count("1") for m in self.forced)
+        return 1.0 - forced / float(n * (n - 1))
+
+
+def human_steps_per_decision(cfg) -> int:
+    """How many walks the human can afford between two roo jumps on stamina regen alone (>= 1)."""
+    per_sec = cfg.ST_REGEN_PER_SEC_H / max(1e-6, float(cfg.WALK_COST))
+    return max(1, int(per_sec * cfg.AI_DECIDE_EVERY_MS / 1000.0))
+
+
+@lru_cache(maxsize=None)
+def reachability(cols: int, rows: int, human_steps: int = 1) -> Reachability:
+    t = move_tables(cols, rows)
+    n = cols * rows
+    row_mask = [sum(1 << (y * cols + x) for x in range(cols)) for y in range(rows)]
+
+    def contact(h, r): return h // cols == r // cols
+
+    # Human replies after the roo landed on r: cells within human_steps walks, off the roo's row
+    def replies(h, r):
+        seen, frontier = 1 << h, [h]
+        for _ in range(human_steps):
+            nxt = []
+            for x in frontier:
+                for d in t.human_moves[x][r]:
+                    if not (seen >> d & 1) and not contact(d, r):
+                        seen |= 1 << d
+                        nxt.append(d)
+            frontier = nxt
+        return seen
+
+    # win[r] = bitmask of human cells h such that (h, r) is a roo win (roo to move)
+    win = [row_mask[r // cols] & ~(1 << r) for r in range(n)]
+    moves = [[(h, [d for k in JUMP_KS for d in (t.roo_safe[r][h][k],) if d >= 0 and d != r])
+              for h in range(n) if h != r] for r in range(n)]
+    reply = {}
+
+    changed = True
+    while changed:
+        changed = False
+        for r in range(n):
+            for h, dsts in moves[r]:
+                if win[r] >> h & 1:
+                    continue
+                for d in dsts:
+                    if contact(h, d):
+                        hit = True
+                    else:
+                        rep = reply.get((h, d))
+                        if rep is None:
+                            rep = reply[(h, d)] = replies(h, d)
+                        hit = (rep & ~win[d]) == 0
+                    if hit:
+                        win[r] |= 1 << h
+                        changed = True
+                        break
+
+    forced = [0] * n
+    for r in range(n):
+        m = win[r]
+        while m:
+            low = m & -m
+            forced[low.bit_length() - 1] |= 1 << r
+            m ^= low
+    return Reachability(cols=cols, rows=rows, human_steps=human_steps, forced=tuple(forced))
@@ -0,0 +1,298 @@
+# src/replay.py
+"""
+Input-edge replays: a match is its start time plus every change of the input state.
+
+GameScreen records, per logic frame (one GameClock step), each edge of the five
+inputs MatchSim sees (arrows + SPACE) and the frame where the player continued to
+the next round. Since the rules are deterministic for a given input sequence, that
+is enough to rebuild the whole match, either headless (no pygame, as fast as the
+CPU allows) or through GameScreen with rendering at any GameClock speed.
+
+Binary layout (little endian):
+    header   magic b"PFPRPL", version u16, step_ms u16, grid w/h u8 u8, start_ms u32,
+             hitbox mode u8 (index into HITBOX_MODES), flags u8 (1: REQUIRE_FIST_POINT)
+    events   varint(frames since previous event) + one code byte
+               code = (input << 1) | pressed    input: 0 up, 1 down, 2 left, 3 right, 4 block
+               NEXT_ROUND (0xFE), END (0xFF, last event: frame the recording stopped)
+A typical edge costs 2 bytes.
+
+Headless playback uses grid_contact, which only matches the screen's bbox test.
+Matches recorded with HITBOX_MODE "poly" or "mask" (shape tests behind the boxes) or
+with REQUIRE_FIST_POINT are refused there; --render replays them through GameScreen
+with the recorded contact settings.
+
+    python -m src.replay replays/match.rpl            # headless, prints the round results
+    python -m src.replay replays/match.rpl --render --speed 4
+"""
+from __future__ import annotations
+import struct
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import List, Tuple
+
+from src.config import CFG
+from src.simulation import MatchSim, SimInput
+
+INPUTS = ("up", "down", "left", "right", "block")
+NEXT_ROUND = 0xFE
+END = 0xFF
+
+_ROOT = Path(__file__).resolve().parents[1]
+_MAGIC = b"PFPRPL"
+_VERSION = 2
+_HEADER = struct.Struct("<6sHHBBIBB")
+F_FIST_POINT = 1
+
+HITBOX_MODES = ("bbox", "parts", "mask", "poly")
+GRID_MODES = ("bbox", "parts")          # contact modes grid_contact reproduces exactly
+
+
+def hitbox_mode(cfg=None) -> str:
+    c = cfg if cfg is not None else CFG
+    mode = str(getattr(c, "HITBOX_MODE", "bbox")).lower()
+    return mode if mode in HITBOX_MODES else "bbox"
+
+
+def _put_varint(out: bytearray, v: int):
+    while v >= 0x80:
+        out.append((v & 0x7F) | 0x80)
+        v >>= 7
+    out.append(v)
+
+
+def _get_varint(data, i: int) -> Tuple[int, int]:
+    v = shift = 0
+    while True:
+        b = data[i]
+        i += 1
+        v |= (b & 0x7F) << shift
+        if b < 0x80:
+            return v, i
+        shift += 7
+
+
+@dataclass
+class Replay:
+    step_ms: int
+    grid: Tuple[int, int]
+    start_ms: int
+    hitbox_mode: str = "bbox"
+    fist_point: bool = False        # REQUIRE_FIST_POINT was on
+    events: List[Tuple[int, int]] = field(default_factory=list)   # (frame, code), frame-ordered
+
+    @property
+    def frames(self) -> int:
+        return self.events[-1][0] if self.events else 0
+
+    @property
+    def grid_exact(self) -> bool:
+        """Whether grid_contact reproduces the contact test this match was recorded with."""
+        return self.hitbox_mode in GRID_MODES and not self.fist_point
+
+    def to_bytes(self) -> bytes:
+        out = bytearray(_HEADER.pack(_MAGIC, _VERSION, self.step_ms, self.grid[0], self.grid[1],
+                                     self.start_ms & 0xFFFFFFFF, HITBOX_MODES.index(self.hitbox_mode),
+                                     F_FIST_POINT if self.fist_point else 0))
+        prev = 0
+        for frame, code in self.events:
+            _put_varint(out, frame - prev)
+            out.append(code)
+            prev = frame
+        return bytes(out)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Replay":
+        magic, version = struct.unpack_from("<6sH", data, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("not a replay file (or an unsupported version)")
+        _, _, step_ms, w, h, start_ms, mode, flags = _HEADER.unpack_from(data, 0)
+        if mode >= len(HITBOX_MODES):
+            raise ValueError(f"unknown hitbox mode {mode} in replay header")
+        rep = cls(step_ms=step_ms, grid=(w, h), start_ms=start_ms, hitbox_mode=HITBOX_MODES[mode],
+                  fist_point=bool(flags & F_FIST_POINT))
+        i, frame = _HEADER.size, 0
+        while i < len(data):
+            delta, i = _get_varint(data, i)
+            frame += delta
+            rep.events.append((frame, data[i]))
+            i += 1
+        return rep
+
+    def save(self, path: str):
+        with open(path, "wb") as f:
+            f.write(self.to_bytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Replay":
+        with open(path, "rb") as f:
+            return cls.from_bytes(f.read())
+
+
+def replay_dir(cfg=None) -> Path:
+    """CFG.REPLAY_DIR resolved against the repo root."""
+    c = cfg if cfg is not None else CFG
+    p = Path(getattr(c, "REPLAY_DIR", "") or "replays")
+    return p if p.is_absolute() else _ROOT / p
+
+
+def prune_replays(folder: Path, keep: int) -> int:
+    """Delete all but the newest `keep` match files in folder (keep <= 0: keep all); returns the count removed."""
+    if keep <= 0:
+        return 0
+    files = sorted(folder.glob("match-*.rpl"))    # names start with the recording time
+    removed = 0
+    for f in files[:-keep]:
+        try:
+            f.unlink()
+            removed += 1
+        except OSError:
+            pass
+    return removed
+
+
+class ReplayRecorder:
+    """Turns the per-frame SimInput stream into edge events."""
+
+    def __init__(self, step_ms: int, start_ms: int, cfg=None):
+        c = cfg if cfg is not None else CFG
+        self.replay = Replay(step_ms=step_ms, grid=(c.GRID_W, c.GRID_H), start_ms=start_ms,
+                             hitbox_mode=hitbox_mode(c), fist_point=bool(getattr(c, "REQUIRE_FIST_POINT", False)))
+        self._state = [False] * len(INPUTS)
+
+    def frame_of(self, now: int) -> int:
+        return (now - self.replay.start_ms) // self.replay.step_ms
+
+    def feed(self, frame: int, inp: SimInput):
+        ev = self.replay.events
+        for k, name in enumerate(INPUTS):
+            down = bool(getattr(inp, name))
+            if down != self._state[k]:
+                self._state[k] = down
+                ev.append((frame, (k << 1) | down))
+
+    def next_round(self, frame: int):
+        self.replay.events.append((frame, NEXT_ROUND))
+
+    def snapshot(self, frame: int) -> Replay:
+        """The match so far, closed with END at frame (recording can go on)."""
+        r = self.replay
+        return Replay(step_ms=r.step_ms, grid=r.grid, start_ms=r.start_ms, hitbox_mode=r.hitbox_mode,
+                      fist_point=r.fist_point, events=r.events + [(frame, END)])
+
+
+class ReplayPlayer:
+    """Feeds a Replay back frame by frame: input(frame) and whether a round continues there."""
+
+    def __init__(self, replay: Replay):
+        self.replay = replay
+        self._i = 0
+        self._state = [False] * len(INPUTS)
+        self._next_round = False
+        self.done = False
+
+    def advance(self, frame: int):
+        """Apply every event up to and including frame."""
+        ev = self.replay.events
+        self._next_round = False
+        while self._i < len(ev) and ev[self._i][0] <= frame:
+            code = ev[self._i][1]
+            if code == NEXT_ROUND:
+                self._next_round = True
+            elif code == END:
+                self.done = True
+            else:
+                self._state[code >> 1] = bool(code & 1)
+            self._i += 1
+
+    def input(self) -> SimInput:
+        return SimInput(*self._state)
+
+    def next_round_due(self) -> bool:
+        return self._next_round
+
+
+def _contact_desc(replay: Replay) -> str:
+    return f"HITBOX_MODE {replay.hitbox_mode!r}" + (" + REQUIRE_FIST_POINT" if replay.fist_point else "")
+
+
+def replay_headless(replay: Replay, cfg=None) -> Tuple[MatchSim, list]:
+    """Run a replay through MatchSim with grid contact; returns (sim, events)."""
+    if not replay.grid_exact:
+        raise ValueError(f"recorded with {_contact_desc(replay)}, which grid contact "
+                         f"does not reproduce; play it back with --render")
+    step = replay.step_ms
+    sim = MatchSim(now=replay.start_ms, cfg=cfg)
+    player = ReplayPlayer(replay)
+    events = []
+    last = replay.frames
+    for frame in range(1, last + 1):
+        player.advance(frame)
+        now = replay.start_ms + frame * step
+        if sim.winner is None:
+            events.extend(sim.step(now, step, player.input()))
+        # the player continued from the result overlay after this frame's (frozen) update
+        if player.next_round_due() and sim.winner is not None and not sim.match_over:
+            sim.next_round(now)
+    return sim, events
+
+
+def _render(replay: Replay, speed: float):
+    import pygame as pg
+    from src.screen.screens import ScreenManager
+    from src.main import WIN_W, WIN_H, pick_font
+
+    CFG.HITBOX_MODE = replay.hitbox_mode     # sprites build their hit shapes for this mode
+    CFG.REQUIRE_FIST_POINT = replay.fist_point
+    pg.init()
+    screen = pg.display.set_mode((WIN_W, WIN_H), pg.SCALED)
+    pg.display.set_caption("PUNCH for PEACE - replay")
+    fonts = {"title": pick_font(52), "big": pick_font(32), "mid": pick_font(22),
+             "sml": pick_font(18), "hud": pick_font(20), "timer": pick_font(28)}
+    manager = ScreenManager(screen, pg.time.Clock(), fonts, (WIN_W, WIN_H))
+    manager.game_clock.reset(replay.start_ms)
+    manager.game_clock.set_scale(speed)
+    manager.goto("game", replay=replay)
+    game = manager.current()
+    while manager.current() is game and not game.replay_player.done:
+        dt = manager.game_clock.tick(CFG.FPS)
+        for e in pg.event.get():
+            if e.type == pg.QUIT or (e.type == pg.KEYDOWN and e.key == pg.K_ESCAPE):
+                pg.quit()
+                return
+        manager.game_clock.advance(dt, manager.update)
+        manager.draw()
+        manager.present()
+    pg.quit()
+
+
+def main(argv=None):
+    import argparse
+    ap = argparse.ArgumentParser(description="Play back a recorded match.")
+    ap.add_argument("path")
+    ap.add_argument("--render", action="store_true", help="show the match in a window")
+    ap.add_argument("--speed", type=float, default=1.0, help="GameClock scale for --render")
+    args = ap.parse_args(argv)
+
+    rep = Replay.load(args.path)
+    if (rep.grid != (CFG.GRID_W, CFG.GRID_H)) or rep.step_ms != getattr(CFG, "LOGIC_STEP_MS", 8):
+        print(f"[replay] warning: recorded with grid {rep.grid} / step {rep.step_ms} ms", file=sys.stderr)
+    if args.render:
+        _render(rep, args.speed)
+        return
+    if not rep.grid_exact:
+        print(f"[replay] recorded with {_contact_desc(rep)}: headless grid contact would "
+              f"replay a different match; use --render", file=sys.stderr)
+        sys.exit(2)
+    t0 = time.perf_counter()
+    sim, _ = replay_headless(rep)
+    wall = time.perf_counter() - t0
+    game_s = rep.frames * rep.step_ms / 1000.0
+    print(f"[replay] {len(rep.events)} events, {game_s:.1f}s of play in {wall:.2f}s "
+          f"({game_s / max(wall, 1e-9):.0f}x)")
+    print(f"[replay] rounds: {sim.round_results}  score H:{sim.score_h} R:{sim.score_r}")
+
+
+if __name__ == "__main__":
+    main()
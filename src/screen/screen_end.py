@@ -1,6 +1,7 @@
 # screen_end.py
 import pygame as pg
 from config import CFG
+from src.ui.text_cache import render_text
 
 class EndScreen:
     def __init__(self, manager, result_text: str):
@@ -21,9 +22,9 @@ class EndScreen:
     def draw(self):
         s = self.m.screen
         s.fill((24,24,28))
-        title = self.m.fonts["title"].render(self.result, True, (220,220,230))
+        title = render_text(self.m.fonts["title"], self.result, (220,220,230))
         s.blit(title, title.get_rect(center=(self.W//2, self.H//2 - 20)))
 
         hint = "[Enter] Retry    [H] Back to Home    Esc to Quit"
-        tip = self.m.fonts["mid"].render(hint, True, (200,200,210))
+        tip = render_text(self.m.fonts["mid"], hint, (200,200,210))
         s.blit(tip, tip.get_rect(center=(self.W//2, self.H//2 + 40)))
@@ -1,11 +1,16 @@
 # src/screen/screen_game.py
 from __future__ import annotations
+import os
+import time
 import pygame as pg
+from src.assets import ASSETS
 from src.config import CFG
-from src.entities import Human, Kangaroo
-from src.stamina import StaminaBar
+from src.simulation import MatchSim, SimInput, R_FACE_LEFT, R_FACE_RIGHT
+from src.replay import Replay, ReplayPlayer, ReplayRecorder, prune_replays, replay_dir
 from src.ui.board import compute_play_rect, draw_board, grid_center
-from src.ui.hud import draw_top_hud, HUD_H
+from src.ui.hud import HudLayers, HUD_H
+from src.ui.text_cache import render_text, sys_font
+from src.polygon import pieces_overlap
 from src.sprites import make_people_sprite, make_roo_sprite
 
 # ---- feature toggles from CFG ----
@@ -14,14 +19,6 @@ AI_FACE_ONLY       = getattr(CFG, "AI_TURN_ONLY_MODE", False)
 AI_FOLLOW_ENABLED  = (getattr(CFG, "AI_ALLOW_MOVE", True)  and not AI_FACE_ONLY)
 AI_PUNCH_ENABLED   = (getattr(CFG, "AI_ALLOW_PUNCH", True) and not AI_FACE_ONLY)
 
-# ---- facing enum ----
-R_FACE_LEFT  = -1
-R_FACE_RIGHT =  1
-
-# ---- timing aliases ----
-MOVE_COOLDOWN_MS = getattr(CFG, "MOVE_COOLDOWN_MS", 110)
-HITSTOP_MS       = getattr(CFG, "HITSTOP_MS", 120)
-
 # ---- snap/spacing defaults (safe fallbacks) ----
 CONTACT_MIN_Y_OVERLAP = getattr(CFG, "CONTACT_MIN_Y_OVERLAP", 24)
 CONTACT_MAX_GAP_X     = getattr(CFG, "CONTACT_MAX_GAP_X", 0)       # allow tiny negative slit
@@ -31,97 +28,61 @@ BASELINE_MARGIN       = getattr(CFG, "BASELINE_MARGIN", 5)         # floor margi
 ROW_GAP_Y             = getattr(CFG, "ROW_GAP_Y", 6)               # min gap between two rows
 ROW_TOP_PADDING       = getattr(CFG, "ROW_TOP_PADDING", 8)         # padding above top row
 
-PUNCH_ANIM_MS         = getattr(CFG, "PUNCH_ANIM_MS", 320)
-PUNCH_COOLDOWN_MS     = getattr(CFG, "PUNCH_COOLDOWN_MS", 650)
-PUNCH_WINDUP_MS       = getattr(CFG, "PUNCH_WINDUP_MS", 200)
-PUNCH_DAMAGE          = getattr(CFG, "PUNCH_DAMAGE", 12)
-PUNCH_BLOCKED_DAMAGE  = getattr(CFG, "PUNCH_BLOCKED_DAMAGE", 3)
-
-BLOCK_DRAIN_PER_SEC   = getattr(CFG, "BLOCK_DRAIN_PER_SEC", 22)
-BLOCK_MIN_STAMINA     = getattr(CFG, "BLOCK_MIN_STAMINA", 8)
-BLOCK_RECOVER_MS      = getattr(CFG, "BLOCK_RECOVER_MS", 260)
-BLOCK_SHARED_LOSS     = getattr(CFG, "BLOCK_SHARED_LOSS", 6)
-
-ST_REGEN_PER_SEC_H    = getattr(CFG, "ST_REGEN_PER_SEC_H", 12)
-ST_REGEN_PER_SEC_R    = getattr(CFG, "ST_REGEN_PER_SEC_R", 12)
-WALK_COST             = getattr(CFG, "WALK_COST", 3)
-ROO_JUMP_ST_DRAIN     = getattr(CFG, "ROO_JUMP_ST_DRAIN", 5)
-ROO_REST_THRESHOLD    = getattr(CFG, "ROO_REST_THRESHOLD", 12)
-
 ROUND_SECONDS         = getattr(CFG, "ROUND_SECONDS", 45)
 
-def _clamp(v, lo, hi): return max(lo, min(hi, v))
-
 
 class GameScreen:
     """
     Grid-based duel (Human vs Roo).
-    Key rules:
+    Key rules (implemented in src.simulation.MatchSim; this class only renders and feeds input):
       - Human walks 1 cell; Roo jumps 2 cells (no pass-through, cannot land on human).
       - All collisions, fist anchors and rendering use the SAME baseline-aligned centers.
       - Visual adjacency uses tight yellow bboxes, not the old green/blue rectangles.
     """
 
-    def __init__(self, manager):
+    def __init__(self, manager, replay: Replay | None = None):
         self.m = manager
         self.W, self.H = manager.size
 
-        # Entities
-        self.human = Human(pos=(1, CFG.GRID_H // 2))
-        self.roo   = Kangaroo(pos=(CFG.GRID_W - 2, CFG.GRID_H // 2))
-
-        # HP / stamina
-        self.hp_h = StaminaBar(getattr(CFG, "HUMAN_STAMINA", 100)); self.hp_h.reset()
-        self.st_h = StaminaBar(getattr(CFG, "HUMAN_STAMINA", 100))
-        self.st_r = StaminaBar(getattr(CFG, "ROO_STAMINA", 100))
-
-        # Lives (half hearts)
-        self.lives_halves = getattr(CFG, "HUMAN_HEARTS", 2) * 2
-        self.roo_halves   = getattr(CFG, "ROO_HEARTS", 3)   * 2
+        # Game time comes from the manager's GameClock (fixed steps, stops while paused)
+        self.clock = manager.game_clock
 
-        # Round/Timer
-        self.round_idx   = 1
-        self.round_start = pg.time.get_ticks()
+        # Rules: pixel-accurate contact test + console log hooked into the headless sim
+        self.sim = MatchSim(now=self.clock.now, contact=self._punch_contact, log=self._dbg)
+        self._prev_pos = (self.sim.human.pos, self.sim.roo.pos)  # grid positions one step ago
         self.overtime_started = None
-
-        self.round_results = [None, None, None]  # Record each round result: 'human' / 'roo' / 'tie' / None
         self._freeze_for_overlay = False  # Freeze update during the result overlay
+        self._space_held = False
 
-        # Runtime states
-        self.blocking = False
-        self.last_block_down_ms = -10_000
-        self.last_move_ms = 0
-        self.last_human_step_ms = -10_000
-        self.hitstop_until = 0
-        self.ai_pause_until = 0
-        self.last_ai_ms = 0
-        self.last_punch_ms = -10_000
-        self.intend_punch = False
-        self.punch_windup_until = 0
-        self.roo_punch_until = 0
+        # Replays: play one back instead of reading keys, or record this match's input edges
+        self._t0 = self.clock.now
+        self.replay_player = ReplayPlayer(replay) if replay is not None else None
+        self.recorder = None
+        if self.replay_player is None and getattr(CFG, "RECORD_REPLAYS", False):
+            self.recorder = ReplayRecorder(self.clock.step_ms, self.clock.now)
+            self._replay_path = os.path.join(replay_dir(),
+                                             time.strftime("match-%Y%m%d-%H%M%S") + f"-{self._t0}.rpl")
 
         # Logs
         self._dbg(f"Flags | face_only={AI_FACE_ONLY}  move={AI_FOLLOW_ENABLED}  punch={AI_PUNCH_ENABLED}")
-        self.score_h = 0
-        self.score_r = 0
         self.msg_text, self.msg_color, self.msg_until = "", (255,255,255), 0
         self.popup_kind, self.popup_until = None, 0
 
         # Layout & sprites
+        self.hud = HudLayers()
         self.play_rect = compute_play_rect(self.W, self.H, hud_h=HUD_H, margin=8)
         cell_w = self.play_rect.width  // CFG.GRID_W
         cell_h = self.play_rect.height // CFG.GRID_H
         self.sprite_h = make_people_sprite(cell_w, cell_h)
         self.sprite_r = make_roo_sprite(cell_w, cell_h)
-
-        # Facing
-        self.h_face = R_FACE_RIGHT
-        self.r_face = R_FACE_LEFT
-        self.roo_prev = self.roo.pos
+        st = ASSETS.stats()
+        self._dbg(f"Assets | {st['entries']} surfaces, {st['bytes'] / 1024:.0f} KiB "
+                  f"({st['hits']} hits / {st['misses']} loads+scales)")
 
         # Cached
         self._cell_w = cell_w
         self._cell_h = cell_h
+        self._ensure_layout()
 
         # SFX (optional)
         self.sfx = {}
@@ -134,19 +95,19 @@ class GameScreen:
     # ---------- debug print ----------
     def _dbg(self, msg: str):
         if DEBUG_LOG:
-            t = pg.time.get_ticks()
-            rx, ry = self.roo.pos
-            hx, hy = self.human.pos
+            t = self.clock.now
+            rx, ry = self.sim.roo.pos
+            hx, hy = self.sim.human.pos
             print(f"[{t:7d}ms] H({hx},{hy}) R({rx},{ry}) | {msg}")
 
     # ---------- messages ----------
     def _set_center_msg(self, text, color=(255,255,255), ms=900):
         self.msg_text = text
         self.msg_color = color
-        self.msg_until = pg.time.get_ticks() + ms
+        self.msg_until = self.clock.now + ms
 
     def _spawn_float_msg(self, text, color, pos, ms=900):
-        t = pg.time.get_ticks()
+        t = self.clock.now
         self.float_msgs.append({
             # New structure (used for the “rise and fade” effect above)
             "text": text,
@@ -160,15 +121,20 @@ class GameScreen:
             "pos": (int(pos[0]), int(pos[1])),
         })
 
+    @staticmethod
+    def _float_y(itm, now):
+        # drift up with game time (15 px/s), so drawing a frame twice doesn't move it twice
+        return itm["y"] - (now - itm["born"]) * 0.015
+
     def _font(self, name, size_fallback=18):
         f = self.m.fonts.get(name)
         if f: return f
-        return pg.font.SysFont(None, size_fallback)
+        return sys_font(None, size_fallback)
 
     def _log_event(self, text, color=(230, 230, 230), ms=1400):
         self.debug_events.append({
             "text": text, "color": color,
-            "until": pg.time.get_ticks() + ms
+            "until": self.clock.now + ms
         })
 
     # -- hit test: only check horizontal adjacency (ignore Y) --
@@ -189,20 +155,13 @@ class GameScreen:
 
     # =====================  Tight yellow bbox helpers  =====================
 
-    def _frame_tight_bbox(self, sprite, center_xy, *, flip_h: bool) -> pg.Rect:
+    def _frame_tight_bbox(self, sprite, center_xy, *, flip_h: bool, key=None) -> pg.Rect:
         """
-        Tight bounding rect (non-transparent) of sprite's *current frame* in screen coords.
+        Tight bounding rect (non-transparent) of sprite's *current frame* (or frame `key`) in screen coords.
         """
-        frame = sprite.current_frame()
-        img = frame[0] if isinstance(frame, tuple) else frame
-        if img is None:
+        if key is None and sprite.current_frame() is None:
             return pg.Rect(center_xy[0] - 1, center_xy[1] - 1, 2, 2)
-        if flip_h:
-            img = pg.transform.flip(img, True, False)
-        blit = img.get_rect(center=center_xy)
-        tight = img.get_bounding_rect(min_alpha=10)  # local
-        tight.move_ip(blit.topleft)                  # -> screen
-        return tight
+        return sprite.tight_rect(center_xy, flip_h=flip_h, key=key)
 
     def _row_baseline_y(self, row: int) -> int:
         """Visual 'floor' Y for a given grid row."""
@@ -220,49 +179,76 @@ class GameScreen:
             return self.play_rect.top + ROW_TOP_PADDING
         return self._row_baseline_y(row - 1) - ROW_GAP_Y
 
-    def _center_on_row_baseline(self, sprite, grid_pos: tuple[int, int], face_lr: int, *, is_roo: bool) -> tuple[int,int]:
+    def _center_on_row_baseline(self, sprite, grid_pos: tuple[int, int], face_lr: int, *, is_roo: bool,
+                                key=None) -> tuple[int,int]:
         """
         Compute a screen center so the *tight* bbox:
           - bottom sits exactly on the row's baseline, and
           - top never crosses the row ceiling (prevents vertical overlap with the row above).
-        This is used universally for: rendering, hit tests, and fist anchors.
+        Builder for the layout table; per-frame code looks centers up with _base_center.
         """
         cx, cy = grid_center(self.play_rect, *grid_pos)
         flip_h = (face_lr > 0) if is_roo else (face_lr < 0)
 
         # First align bottom to baseline
-        rect0 = self._frame_tight_bbox(sprite, (cx, cy), flip_h=flip_h)
+        rect0 = self._frame_tight_bbox(sprite, (cx, cy), flip_h=flip_h, key=key)
         baseline = self._row_baseline_y(grid_pos[1])
         dy = baseline - rect0.bottom
         cy1 = cy + dy
 
         # Then enforce ceiling constraint (no overlap with upper row)
         ceil_y = self._row_ceiling_y(grid_pos[1])
-        rect1 = self._frame_tight_bbox(sprite, (cx, cy1), flip_h=flip_h)
+        rect1 = self._frame_tight_bbox(sprite, (cx, cy1), flip_h=flip_h, key=key)
         if rect1.top < ceil_y:
             cy1 += (ceil_y - rect1.top)  # push down just enough
 
         return (cx, cy1)
 
+    # ---------- layout table (depends only on play_rect; rebuilt on resize) ----------
+    def _ensure_layout(self):
+        """
+        Baseline centers for every (entity, cell, frame, flip) are built eagerly; snapped
+        face-to-face pairs are memoized on first use. Both are dropped when play_rect changes.
+        """
+        if getattr(self, "_layout_rect", None) == self.play_rect:
+            return
+        self._layout_rect = self.play_rect.copy()
+        self._pair_table = {}
+        table = {}
+        for sprite, is_roo in ((self.sprite_h, False), (self.sprite_r, True)):
+            for key in sprite.frame_keys():
+                for face in (R_FACE_LEFT, R_FACE_RIGHT):
+                    flip_h = (face > 0) if is_roo else (face < 0)
+                    for y in range(CFG.GRID_H):
+                        for x in range(CFG.GRID_W):
+                            table[(is_roo, (x, y), key, flip_h)] = self._center_on_row_baseline(
+                                sprite, (x, y), face, is_roo=is_roo, key=key)
+        self._base_table = table
+
+    def _base_center(self, sprite, grid_pos, face_lr: int, *, is_roo: bool) -> tuple[int,int]:
+        """Table lookup of _center_on_row_baseline for the sprite's current frame."""
+        flip_h = (face_lr > 0) if is_roo else (face_lr < 0)
+        return self._base_table[(is_roo, tuple(grid_pos), sprite.frame_key(), flip_h)]
+
     # Public getters that optionally accept an override center (in screen space)
     def human_rect(self, center_override: tuple[int,int] | None = None) -> pg.Rect:
-        cxy = center_override or self._center_on_row_baseline(self.sprite_h, self.human.pos, self.h_face, is_roo=False)
-        return self._frame_tight_bbox(self.sprite_h, cxy, flip_h=(self.h_face < 0))
+        cxy = center_override or self._base_center(self.sprite_h, self.sim.human.pos, self.sim.h_face, is_roo=False)
+        return self._frame_tight_bbox(self.sprite_h, cxy, flip_h=(self.sim.h_face < 0))
 
     def roo_rect(self, center_override: tuple[int,int] | None = None) -> pg.Rect:
-        cxy = center_override or self._center_on_row_baseline(self.sprite_r, self.roo.pos, self.r_face, is_roo=True)
-        return self._frame_tight_bbox(self.sprite_r, cxy, flip_h=(self.r_face > 0))
+        cxy = center_override or self._base_center(self.sprite_r, self.sim.roo.pos, self.sim.r_face, is_roo=True)
+        return self._frame_tight_bbox(self.sprite_r, cxy, flip_h=(self.sim.r_face > 0))
 
     def roo_fist_point(self) -> tuple[int,int]:
         """Pixel-accurate fist anchor (from JSON) using baseline-aligned center + proper flip."""
-        center = self._center_on_row_baseline(self.sprite_r, self.roo.pos, self.r_face, is_roo=True)
-        return self.sprite_r.fist_point(center, flip_h=(self.r_face > 0))
+        center = self._base_center(self.sprite_r, self.sim.roo.pos, self.sim.r_face, is_roo=True)
+        return self.sprite_r.fist_point(center, flip_h=(self.sim.r_face > 0))
 
     def _human_yellow_rect_at(self, center_xy) -> pg.Rect:
-        return self._frame_tight_bbox(self.sprite_h, center_xy, flip_h=(self.h_face < 0))
+        return self._frame_tight_bbox(self.sprite_h, center_xy, flip_h=(self.sim.h_face < 0))
 
     def _roo_yellow_rect_at(self, center_xy) -> pg.Rect:
-        return self._frame_tight_bbox(self.sprite_r, center_xy, flip_h=(self.r_face > 0))
+        return self._frame_tight_bbox(self.sprite_r, center_xy, flip_h=(self.sim.r_face > 0))
 
     # Snap two characters along X so their yellow bboxes touch (no slit)
     def _centers_face_to_face_snap(self, base_h: tuple[int, int], base_r: tuple[int, int]):
@@ -305,53 +291,56 @@ class GameScreen:
 
         return tuple(new_h), tuple(new_r)
 
-    def _centers_screen(self) -> tuple[tuple[int,int], tuple[int,int]]:
+    def _centers_screen(self, h_pos=None, r_pos=None) -> tuple[tuple[int,int], tuple[int,int]]:
         """Return (human_center, roo_center) — baseline-aligned, ceiling-safe, then snapped along X."""
-        base_h = self._center_on_row_baseline(self.sprite_h, self.human.pos, self.h_face, is_roo=False)
-        base_r = self._center_on_row_baseline(self.sprite_r, self.roo.pos, self.r_face, is_roo=True)
-        return self._centers_face_to_face_snap(base_h, base_r)
-
-    # =====================  Facing helpers  =====================
-    def _face_str(self, f): return "Right" if f == R_FACE_RIGHT else "Left"
-
-    def _set_face(self, face):
-        if face != self.r_face:
-            self._dbg(f"Face: {self._face_str(self.r_face)} -> {self._face_str(face)}")
-        self.r_face = face
-
-    def _face_towards_player_x(self):
-        rx, ry = self.roo.pos
-        hx, hy = self.human.pos
-        self._set_face(R_FACE_RIGHT if (hx - rx) >= 0 else R_FACE_LEFT)
-
-    def _face_after_player_moved(self):
-        rx, _ = self.roo.pos
-        hx, _ = self.human.pos
-        if hx > rx: self._set_face(R_FACE_RIGHT)
-        elif hx < rx: self._set_face(R_FACE_LEFT)
-
-    # =====================  Safe move for Roo  =====================
-    def _safe_move_roo(self, tx, ty) -> bool:
-        """No overlap, no pass-through; also updates facing by X."""
-        rx, ry = self.roo.pos
-        tx = _clamp(tx, 0, CFG.GRID_W - 1)
-        ty = _clamp(ty, 0, CFG.GRID_H - 1)
-
-        mid = (rx + (1 if tx > rx else -1 if tx < rx else 0),
-               ry + (1 if ty > ry else -1 if ty < ry else 0))
-
-        if mid == self.human.pos or (tx, ty) == self.human.pos:
-            tx, ty = mid
-            if (tx, ty) == self.human.pos:
-                self._dbg("SafeMove: blocked by human, cancel")
-                return False
-
-        self.roo_prev = self.roo.pos
-        self.roo.pos = (tx, ty)
-        if tx > rx: self._set_face(R_FACE_RIGHT)
-        if tx < rx: self._set_face(R_FACE_LEFT)
-        self._dbg(f"SafeMove: to ({tx},{ty}), face {self._face_str(self.r_face)}")
-        return True
+        h_pos = tuple(h_pos or self.sim.human.pos)
+        r_pos = tuple(r_pos or self.sim.roo.pos)
+        key = (h_pos, self.sprite_h.frame_key(), self.sim.h_face < 0,
+               r_pos, self.sprite_r.frame_key(), self.sim.r_face > 0)
+        pair = self._pair_table.get(key)
+        if pair is None:
+            base_h = self._base_center(self.sprite_h, h_pos, self.sim.h_face, is_roo=False)
+            base_r = self._base_center(self.sprite_r, r_pos, self.sim.r_face, is_roo=True)
+            pair = self._pair_table[key] = self._centers_face_to_face_snap(base_h, base_r)
+        return pair
+
+    def _centers_interpolated(self) -> tuple[tuple[int,int], tuple[int,int]]:
+        """Render centers between the previous and the latest logic step (manager.alpha)."""
+        cur = self._centers_screen()
+        a = self.clock.alpha
+        if a >= 1.0 or self._prev_pos == (self.sim.human.pos, self.sim.roo.pos):
+            return cur
+        prev = self._centers_screen(*self._prev_pos)
+        return tuple((round(p[0] + (c[0] - p[0]) * a), round(p[1] + (c[1] - p[1]) * a))
+                     for p, c in zip(prev, cur))
+
+    # =====================  Contact hook for the sim  =====================
+    def _punch_contact(self, sim: MatchSim, commit: bool) -> bool:
+        """Yellow-bbox contact using the same snapped centers as drawing."""
+        if commit:
+            # The punch frame is what lands; test with it like the original commit did
+            self.sprite_r.set_state("punch")
+        h_center, r_center = self._centers_screen()
+        h_rect = self.human_rect(h_center)
+        r_rect = self.roo_rect(r_center)
+        hit_ok = can_punch_yellow(h_rect, r_rect, sim.r_face)
+
+        # "poly"/"mask" modes: the touching boxes are only the broad phase; the shapes must meet
+        mode = getattr(CFG, "HITBOX_MODE", "bbox")
+        if hit_ok and mode == "poly":
+            hit_ok = can_punch_poly(self.sprite_h.hit_pieces(h_center, flip_h=(sim.h_face < 0)),
+                                    self.sprite_r.hit_pieces(r_center, flip_h=(sim.r_face > 0)), sim.r_face)
+        elif hit_ok and mode == "mask":
+            hit_ok = can_punch_mask(self.sprite_h.mask_and_rect(h_center, flip_h=(sim.h_face < 0)),
+                                    self.sprite_r.mask_and_rect(r_center, flip_h=(sim.r_face > 0)), sim.r_face)
+
+        # Optional: also require the fist anchor, pushed CONTACT_MAX_GAP_X toward the facing
+        # like the shapes above, to be inside the target bbox (the boxes only touch)
+        if commit and hit_ok and getattr(CFG, "REQUIRE_FIST_POINT", False):
+            fx, fy = self.sprite_r.fist_point(r_center, flip_h=(sim.r_face > 0))
+            reach = getattr(CFG, "CONTACT_MAX_GAP_X", 8) * (1 if sim.r_face > 0 else -1)
+            hit_ok = h_rect.collidepoint(fx + reach, fy)
+        return hit_ok
 
     # =====================  Input  =====================
     def handle_event(self, e):
@@ -364,42 +353,46 @@ class GameScreen:
                 self.m.push("pause")   # PauseScreen must be registered in manager
                 return
             if e.key == pg.K_SPACE:
-                self._set_blocking(True); return
+                self._space_held = True; return
             # ignore others
         elif e.type == pg.KEYUP:
             if e.key == pg.K_SPACE:
-                self._set_blocking(False); return
+                self._space_held = False; return
             # ignore others
 
-    def _set_blocking(self, on: bool):
-        self.blocking = bool(on)
-        # if on:
-        #     self.last_block_down_ms = pg.time.get_ticks()
-        if on:
-            self.last_block_down_ms = pg.time.get_ticks()
-            # Bottom-right hint (displayed separately from debug info)
-            self.debug_events.append({
-                "text": "You: BLOCK (holding)",
-                "color": (210, 230, 255),
-                "until": pg.time.get_ticks() + 1200,
-                "kind": "hint",
-            })
-        else:
-            self.debug_events.append({
-                "text": "You: BLOCK release",
-                "color": (210, 230, 255),
-                "until": pg.time.get_ticks() + 900,
-                "kind": "hint",
-            })
+    def _frame(self) -> int:
+        """Logic frame index since this screen started (replay time base)."""
+        return (self.clock.now - self._t0) // self.clock.step_ms
+
+    def _read_input(self) -> SimInput:
+        keys = pg.key.get_pressed()
+        return SimInput(up=keys[pg.K_UP], down=keys[pg.K_DOWN],
+                        left=keys[pg.K_LEFT], right=keys[pg.K_RIGHT],
+                        block=self._space_held)
 
     # =====================  Update  =====================
     def update(self, dt_ms: int):
 
+        if self.replay_player is not None:
+            self.replay_player.advance(self._frame())
+
+        # Animation runs on logic time: the "poly"/"mask" contact tests read the current frame,
+        # so it must not depend on when (or whether) the screen was drawn
+        self._advance_sprites(self.clock.now)
+
+        # Expire transient texts here, not in draw(): a frame may be drawn once per dirty region
+        self.float_msgs = [m for m in self.float_msgs if self.clock.now < m["until"]]
+        self.debug_events = [e for e in self.debug_events if self.clock.now < e["until"]]
+
         # Freeze before any logic
         if self._freeze_for_overlay:
+            # Replay: continue where the player left the result overlay
+            if self.replay_player is not None and self.replay_player.next_round_due():
+                self._result_continue()
             return
 
-        now = pg.time.get_ticks()
+        now = self.clock.now
+        self._prev_pos = (self.sim.human.pos, self.sim.roo.pos)
 
         # —— During round popup: completely freeze logic —— #
         if self.popup_until > now:
@@ -409,25 +402,10 @@ class GameScreen:
         if self.popup_kind and self.popup_until <= now:
             # Clear popup flags
             self.popup_kind, self.popup_until = None, 0
-            if self.round_idx < 3:
-                # Enter next round
-                self.round_idx += 1
-                # Restore HP/stamina
-                self.hp_h.reset()
-                self.st_h.reset();
-                self.st_r.reset()
-                # Reset positions and facing
-                self.human.pos = (1, CFG.GRID_H // 2)
-                self.roo.pos = (CFG.GRID_W - 2, CFG.GRID_H // 2)
-                self.h_face = R_FACE_RIGHT
-                self.r_face = R_FACE_LEFT
-                # Clear transient renders & reset timer
-                self.float_msgs.clear()
-                self.debug_events.clear()
-                self.round_start = now
-                self.overtime_started = None
+            if self.sim.round_idx < 3:
+                self._start_next_round(now)
                 # Optional: give a short opening hint
-                self._set_center_msg(f"Round {self.round_idx}", (255, 255, 255), ms=800)
+                self._set_center_msg(f"Round {self.sim.round_idx}", (255, 255, 255), ms=800)
             else:
                 # After 3 rounds: match over (pause here; call EndScreen jump here if needed)
                 self._set_center_msg("Match Over", (255, 255, 255), ms=1800)
@@ -435,316 +413,236 @@ class GameScreen:
                 self.popup_until = now + 10_000_000
                 return
 
-        # Hitstop keeps animation running via draw()
-        if now < self.hitstop_until:
-            return
-
-        # Human stamina drain/regen
-        dt_sec = dt_ms / 1000.0
-        if self.blocking:
-            self.st_h.lose(BLOCK_DRAIN_PER_SEC * dt_sec)
-            if self.st_h.cur <= BLOCK_MIN_STAMINA:
-                self._set_blocking(False)
+        if self.replay_player is not None:
+            inp = self.replay_player.input()
         else:
-            self.st_h.cur = min(self.st_h.max, self.st_h.cur + ST_REGEN_PER_SEC_H * dt_sec)
-
-        # —— Round countdown check —— #
-        elapsed_sec = (now - self.round_start) // 1000
-        if elapsed_sec >= ROUND_SECONDS and self.popup_kind is None:
-            # Simple win/lose: if human still alive → Win; otherwise Lose; (you can refine once human can punch later)
-            winner = "human" if (self.hp_h.cur > 0 and self.lives_halves > 0) else "roo"
-            self._end_round(winner)
-            return
-
-        # Human move (continuous keyboard + cooldown + stamina)
-        keys = pg.key.get_pressed()
-        if now - self.last_move_ms >= MOVE_COOLDOWN_MS:
-            hx, hy = self.human.pos
-            nx, ny = hx, hy
-            if keys[pg.K_UP]:
-                ny -= 1
-            elif keys[pg.K_DOWN]:
-                ny += 1
-            elif keys[pg.K_LEFT]:
-                nx -= 1; self.h_face = R_FACE_LEFT
-            elif keys[pg.K_RIGHT]:
-                nx += 1; self.h_face = R_FACE_RIGHT
-
-            if (nx, ny) != (hx, hy) and self.human.can_move(nx, ny, roo_pos=self.roo.pos, cols=CFG.GRID_W,
-                                                            rows=CFG.GRID_H):
-                if self.st_h.cur >= WALK_COST:
-                    self.human.move_to(nx, ny)
-                    self.st_h.lose(WALK_COST)
-                    self.last_move_ms = now
-                    self.last_human_step_ms = now
-                    self._face_after_player_moved()
-
-        # AI tick
-        self._ai_decide(now, dt_sec)
-
-        # Punch commit (single hit-check moment)
-        if AI_PUNCH_ENABLED and getattr(self, "intend_punch", False) and now >= self.punch_windup_until:
-            self.intend_punch = False
-
-            prev = self.r_face
-            self._face_towards_player_x()
-            self._dbg(f"Punch commit face: {self._face_str(prev)} -> {self._face_str(self.r_face)}")
-
+            inp = self._read_input()
+            if self.recorder is not None:
+                self.recorder.feed(self._frame(), inp)
+        for ev in self.sim.step(now, dt_ms, inp):
+            self._on_sim_event(ev)
+
+    def _on_sim_event(self, ev):
+        """Turn sim events into sprites, popups, logs and sfx."""
+        k = ev.kind
+        if k == "block_on":
+            # Bottom-right hint (displayed separately from debug info)
+            self.debug_events.append({
+                "text": "You: BLOCK (holding)",
+                "color": (210, 230, 255),
+                "until": ev.t + 1200,
+                "kind": "hint",
+            })
+        elif k == "block_off":
+            self.debug_events.append({
+                "text": "You: BLOCK release",
+                "color": (210, 230, 255),
+                "until": ev.t + 900,
+                "kind": "hint",
+            })
+        elif k == "roo_jump":
+            self.sprite_r.set_state("jump")
+        elif k == "windup":
+            self._log_event("Roo wind-up", (200, 200, 255))
+        elif k == "punch":
             self.sprite_r.set_state("punch")
-            self.roo_punch_until = now + PUNCH_ANIM_MS
-            self.last_punch_ms = now
-
-            # Use the same snapped centers as drawing
-            h_center, r_center = self._centers_screen()
-            h_rect = self.human_rect(h_center)
-            r_rect = self.roo_rect(r_center)
-
-            hit_ok = can_punch_yellow(h_rect, r_rect, self.r_face)
-
-            # Optional: also require the fist anchor to be inside target bbox
-            if hit_ok and getattr(CFG, "REQUIRE_FIST_POINT", False):
-                hit_ok = h_rect.collidepoint(self.sprite_r.fist_point(r_center, flip_h=(self.r_face > 0)))
-
-            if not hit_ok:
-                self.ai_pause_until = now + 220
-                self._dbg("Punch result: WHIFF")
-                self._log_event("Roo punch: miss", (200, 200, 200))
-                return
-
-            # BLOCK or HIT
-            if self.blocking:
-                self._dbg("Punch result: BLOCK")
-                try:
-                    self.sfx.get("block") and self.sfx["block"].play()
-                except:
-                    pass
-
-                self.hp_h.lose(PUNCH_BLOCKED_DAMAGE)
-                self.st_r.lose(BLOCK_SHARED_LOSS)
-                self.st_h.lose(BLOCK_SHARED_LOSS * 0.5)
-
-                pos = h_rect.midtop
-                self._spawn_float_msg("BLOCK!", (230, 230, 230), (pos[0], pos[1] - 26))
-                self._log_event("Roo punch -> BLOCK", (230, 230, 230))
-
-                self.hitstop_until = now + HITSTOP_MS
-                self._roo_step_back()
-                self.ai_pause_until = now + BLOCK_RECOVER_MS
-                self.score_r += 1
-                return
-
-            # HIT
-            self._dbg("Punch result: HIT")
+        elif k == "punch_end":
+            self.sprite_r.set_state("idle")
+        elif k == "whiff":
+            self._log_event("Roo punch: miss", (200, 200, 200))
+        elif k == "blocked":
+            try:
+                self.sfx.get("block") and self.sfx["block"].play()
+            except:
+                pass
+            pos = self.human_rect(self._centers_screen()[0]).midtop
+            self._spawn_float_msg("BLOCK!", (230, 230, 230), (pos[0], pos[1] - 26))
+            self._log_event("Roo punch -> BLOCK", (230, 230, 230))
+        elif k == "hit":
             try:
                 self.sfx.get("hit") and self.sfx["hit"].play()
             except:
                 pass
-
-            self.hp_h.lose(PUNCH_DAMAGE)
-            pos = h_rect.midtop
-            self._spawn_float_msg(f"-{PUNCH_DAMAGE} HP", (240, 80, 80), (pos[0], pos[1] - 20))
-            self._log_event(f"Roo punch -> HIT (-{PUNCH_DAMAGE})", (240, 120, 120))
-
-            self.hitstop_until = now + HITSTOP_MS
-            self.score_r += 1
-
-            if self.hp_h.cur <= 0:
-                self.lives_halves = max(0, self.lives_halves - 1)
-                self.hp_h.reset()
-                self._set_center_msg("- 1/2 ♥", (245, 120, 120), ms=900)
-                self._dbg(f"Half-heart lost -> {self.lives_halves}")
-                if self.lives_halves == 0:
-                    self._end_round("roo")
-                    return
-
-        # Auto reset punch anim
-        if getattr(self, "roo_punch_until", 0) and now >= self.roo_punch_until:
-            self.sprite_r.set_state("idle")
-            self.roo_punch_until = 0
-
-    # =====================  AI & round/timer  =====================
-    def _roo_step_back(self):
-        """Step back after being blocked (prefer opposite X, fallback Y)."""
-        rx, ry = self.roo.pos
-        step_x = -1 if self.r_face == R_FACE_RIGHT else 1
-        if not self._safe_move_roo(rx + step_x, ry):
-            if not self._safe_move_roo(rx, ry - 1):
-                self._safe_move_roo(rx, ry + 1)
-
-    def _ai_decide(self, now, dt_sec: float):
-        """AI every frame: face → (maybe) wind-up punch → (else) follow."""
-        if now < self.hitstop_until or now < getattr(self, "ai_pause_until", 0):
-            return
-
-        if self.st_r.cur < ROO_REST_THRESHOLD:
-            self.st_r.cur = min(self.st_r.max, self.st_r.cur + ST_REGEN_PER_SEC_R * dt_sec)
-            return
-
-        rx, ry = self.roo.pos
-        hx, hy = self.human.pos
-        dx, dy = hx - rx, hy - ry
-
-        need_face = R_FACE_RIGHT if dx >= 0 else R_FACE_LEFT
-        if self.r_face != need_face:
-            self._set_face(need_face)
-
-        if AI_FACE_ONLY:
-            return
-
-        # Wind-up if visually adjacent on same row (guard: do not re-start if already winding)
-        if (AI_PUNCH_ENABLED
-                and (now - self.last_punch_ms >= PUNCH_COOLDOWN_MS)
-                and not getattr(self, "intend_punch", False)
-                and now >= getattr(self, "ai_pause_until", 0)):
-            h_center, r_center = self._centers_screen()
-            h_rect = self.human_rect(h_center)
-            r_rect = self.roo_rect(r_center)
-            if can_punch_yellow(h_rect, r_rect, self.r_face):
-                self.intend_punch = True
-                self.punch_windup_until = now + PUNCH_WINDUP_MS
-                self._dbg("Wind-up start")
-                self._log_event("Roo wind-up", (200, 200, 255))
-                return
-
-        # Follow (prefer X, else Y)
-        if AI_FOLLOW_ENABLED and (now - self.last_ai_ms >= getattr(CFG, "AI_DECIDE_EVERY_MS", 120)):
-            self.last_ai_ms = now
-            moved = False
-            if dx != 0:
-                moved = self._safe_move_roo(rx + (2 if dx > 0 else -2), ry)
-            elif dy != 0:
-                moved = self._safe_move_roo(rx, ry + (2 if dy > 0 else -2))
-            if moved:
-                self.st_r.lose(ROO_JUMP_ST_DRAIN)
-                self.sprite_r.set_state("jump")
+            dmg = ev.data["damage"]
+            pos = self.human_rect(self._centers_screen()[0]).midtop
+            self._spawn_float_msg(f"-{dmg} HP", (240, 80, 80), (pos[0], pos[1] - 20))
+            self._log_event(f"Roo punch -> HIT (-{dmg})", (240, 120, 120))
+        elif k == "half_heart":
+            self._set_center_msg("- 1/2 ♥", (245, 120, 120), ms=900)
+        elif k == "stalemate":
+            self._log_event("Stalemate: roo can't force contact", (250, 210, 120), ms=2400)
+        elif k == "round_end":
+            self._end_round(ev.data["winner"])
+
+    # =====================  Round flow  =====================
+    def _start_next_round(self, now):
+        self.sim.next_round(now)
+        self._prev_pos = (self.sim.human.pos, self.sim.roo.pos)  # respawn: no slide from old cells
+        # Clear transient renders & reset timer
+        self.float_msgs.clear()
+        self.debug_events.clear()
+        self.overtime_started = None
 
     def _end_round(self, winner: str):
         # winner: 'human' / 'roo' / 'tie'
-        idx = max(1, min(3, self.round_idx)) - 1
-        self.round_results[idx] = winner if winner in ("human", "roo") else "tie"
-
         # Freeze game updates & Push to the result page
         self._freeze_for_overlay = True
+        self._save_replay()
+        if self.replay_player is not None:
+            return  # replays continue on their recorded frame instead (see update)
 
         from src.screen.screen_result import RoundResultScreen
         kind = {"human": "win", "roo": "lose", "tie": "tie"}.get(winner, "tie")
-        is_match_over = (self.round_idx >= 3)
+        is_match_over = (self.sim.round_idx >= 3)
         self.m.push(RoundResultScreen(
             manager=self.m,
             kind=kind,
-            round_idx=self.round_idx,
-            round_results=self.round_results,
+            round_idx=self.sim.round_idx,
+            round_results=self.sim.round_results,
             on_continue=self._result_continue,
             is_match_over=is_match_over
         ))
 
+    def _save_replay(self):
+        if self.recorder is None:
+            return
+        try:
+            os.makedirs(os.path.dirname(self._replay_path) or ".", exist_ok=True)
+            self.recorder.snapshot(self._frame()).save(self._replay_path)
+            prune_replays(replay_dir(), getattr(CFG, "REPLAY_KEEP", 50))
+        except OSError as e:
+            self._dbg(f"Replay not saved: {e}")
+
     def _result_continue(self):
         # Back from result screen
-        if self.round_idx < 3:
-            now = pg.time.get_ticks()
-            self.round_idx += 1
-
-            # --- restore HP / stamina / lives ---
-            if hasattr(self.hp_h, "reset"):
-                self.hp_h.reset()
-            else:
-                # fallback if your HP object has no reset()
-                if hasattr(self.hp_h, "max"):
-                    self.hp_h.cur = self.hp_h.max
-                else:
-                    self.hp_h.cur = 100
-
-            if hasattr(self, "st_h") and hasattr(self.st_h, "reset"):
-                self.st_h.reset()
-            if hasattr(self, "st_r") and hasattr(self.st_r, "reset"):
-                self.st_r.reset()
-
-            # if you use "half hearts" for lives, also restore here
-            if hasattr(self, "max_lives_halves"):
-                self.lives_halves = self.max_lives_halves
-            elif hasattr(self, "lives_halves"):
-                # safe default
-                self.lives_halves = 6
-
-            # --- reset positions & facing ---
-            self.human.pos = (1, CFG.GRID_H // 2)
-            self.roo.pos = (CFG.GRID_W - 2, CFG.GRID_H // 2)
-            self.h_face = 1  # right
-            self.r_face = -1  # left
-
-            # --- clear temps & restart timer ---
-            self.float_msgs.clear()
-            self.debug_events.clear()
-            self.round_start = now
-            self.overtime_started = None
-
+        if self.recorder is not None:
+            self.recorder.next_round(self._frame())
+        if self.sim.round_idx < 3:
+            self._start_next_round(self.clock.now)
             self._freeze_for_overlay = False
-
         else:
             # Match finished: go Home (or replace with End screen if you have one)
             self._freeze_for_overlay = False
             self.m.goto("home")
 
     # =====================  Draw  =====================
-    def draw(self):
-        s = self.m.screen
-        now = pg.time.get_ticks()
-
-        # Timer (incl. overtime)
-        secs_left = max(0, ROUND_SECONDS - (now - self.round_start) // 1000)
+    def _secs_left(self, now) -> int:
+        """Timer (incl. overtime)."""
+        secs_left = max(0, ROUND_SECONDS - (now - self.sim.round_start) // 1000)
         if secs_left == 0 and self.overtime_started is not None:
             secs_left = max(0, 15 - (now - self.overtime_started) // 1000)
+        return secs_left
 
-        # HUD
-        draw_top_hud(
-            s, self.W, self.H,
-            halves_left_human=self.lives_halves,
-            halves_left_roo=self.roo_halves,
-            secs_left=secs_left,
+    def _hud_args(self, now) -> dict:
+        return dict(
+            halves_left_human=self.sim.lives_halves,
+            halves_left_roo=self.sim.roo_halves,
+            secs_left=self._secs_left(now),
             fonts=self.m.fonts,
-            st_pct_h=self.st_h.pct,
-            st_pct_r=self.st_r.pct,
-            round_idx=self.round_idx, round_total=3,
+            st_pct_h=self.sim.st_h.pct,
+            st_pct_r=self.sim.st_r.pct,
+            round_idx=self.sim.round_idx, round_total=3,
         )
 
+    def _hud_state(self, now) -> tuple:
+        """HUD layer keys (what it shows, quantized); the HUD strip is dirty only when they change."""
+        return self.hud.keys(self.W, **self._hud_args(now))
+
+    def _advance_sprites(self, now):
+        """Animation step up to now (called once per logic step); a second call at the same tick is a no-op."""
+        dt_ani = now - getattr(self, "_last_anim_tick", now)
+        self._last_anim_tick = now
+        # the elapsed time belongs to the pose shown so far; a block toggle restarts from frame 0
+        self.sprite_h.update(dt_ani)
+        self.sprite_r.update(dt_ani)
+        self.sprite_h.set_state("block" if self.sim.blocking else "idle")
+
+    def dirty_region(self):
+        """
+        Rects the next draw() changes, plus last frame's (to erase what moved away).
+        None = redraw everything (popup overlay, first frame).
+        """
+        now = self.clock.now
+        if self.popup_until > now and self.popup_kind:
+            self._last_dirty = None
+            return None
+        rects = []
+
+        hud = self._hud_state(now)
+        if hud != getattr(self, "_hud_drawn", None):
+            rects.append(pg.Rect(0, 0, self.W, HUD_H))
+
+        # Sprites (inflated for the debug fist dot / outlines)
+        h_center, r_center = self._centers_interpolated()
+        rects.append(self.sprite_h.get_draw_rect(h_center, flip_h=(self.sim.h_face < 0)).inflate(12, 12))
+        rects.append(self.sprite_r.get_draw_rect(r_center, flip_h=(self.sim.r_face > 0)).inflate(12, 12))
+
+        # Floating texts
+        small = self._font("small", 18)
+        for itm in self.float_msgs:
+            if now < itm["until"]:
+                w, h = small.size(itm["text"])
+                r = pg.Rect(0, 0, w + 4, h + 4)
+                r.center = (int(itm["x"]), int(self._float_y(itm, now)))
+                rects.append(r)
+
+        # Center message (generous box: the ♥ path may use another font)
+        if now < self.msg_until and self.msg_text:
+            w, h = self.m.fonts["title"].size(self.msg_text)
+            rects.append(pg.Rect(0, 0, w * 2, h * 2).move(self.play_rect.centerx - w, self.play_rect.centery - h))
+
+        # Bottom-right event log
+        y = self.H - 14
+        for itm in reversed(self.debug_events[-6:]):
+            if now < itm["until"]:
+                w, h = small.size(itm["text"])
+                rects.append(pg.Rect(self.W - 18 - w, y - h, w, h))
+                y -= h + 4
+
+        last = getattr(self, "_last_dirty", None)
+        self._last_dirty = rects
+        if last is None:
+            return None
+        return rects + last
+
+    def draw(self):
+        s = self.m.screen
+        now = self.clock.now
+
+        hud_args = self._hud_args(now)
+        self._hud_drawn = self.hud.keys(self.W, **hud_args)
+
+        # HUD (cached layers, one blit)
+        self.hud.draw(s, self.W, self.H, **hud_args)
+
         # Board
         full_rect = pg.Rect(0, HUD_H, self.W, self.H - HUD_H)
         draw_board(s, full_rect)
 
-        # Play rect (recompute in case of resize)
-        self.play_rect = compute_play_rect(self.W, self.H, hud_h=HUD_H, margin=8)
+        # Play rect: recompute only on resize (layout table follows it)
+        if self.m.size != (self.W, self.H):
+            self.W, self.H = self.m.size
+            self.play_rect = compute_play_rect(self.W, self.H, hud_h=HUD_H, margin=8)
+            self._ensure_layout()
 
-        # Advance sprites
-        dt_ani = now - getattr(self, "_last_draw_tick", now)
-        self._last_draw_tick = now
-        self.sprite_h.set_state("block" if self.blocking else "idle")
-        self.sprite_h.update(dt_ani)
-        self.sprite_r.update(dt_ani)
-
-        # Centers: baseline-aligned then snapped along X
-        h_center, r_center = self._centers_screen()
+        # Centers: baseline-aligned then snapped along X, interpolated between logic steps
+        h_center, r_center = self._centers_interpolated()
 
         # Draw with row-order painter's algorithm
         entities = [
-            ("human", h_center, self.sprite_h, (self.h_face < 0)),
-            ("roo",   r_center, self.sprite_r, (self.r_face > 0)),
+            ("human", h_center, self.sprite_h, (self.sim.h_face < 0)),
+            ("roo",   r_center, self.sprite_r, (self.sim.r_face > 0)),
         ]
         entities.sort(key=lambda it: it[1][1])  # lower first
         for _, cxy, spr, flip in entities:
             spr.draw(s, cxy, flip_h=flip)
 
         # floating texts (rise and fade)
-        now = pg.time.get_ticks()
         small = self._font("small", 18)
-        alive = []
         for itm in self.float_msgs:
-            if now >= itm["until"]:
-                continue
-            itm["y"] -= 0.25  # drift up
-            img = small.render(itm["text"], True, itm["color"])
-            self.m.screen.blit(img, img.get_rect(center=(int(itm["x"]), int(itm["y"]))))
-            alive.append(itm)
-        self.float_msgs = alive
+            if now < itm["until"]:
+                img = render_text(small, itm["text"], itm["color"])
+                self.m.screen.blit(img, img.get_rect(center=(int(itm["x"]), int(self._float_y(itm, now)))))
 
         # Debug overlays (always use same centers as rendering)
         if getattr(CFG, "DEBUG", False):
@@ -752,7 +650,7 @@ class GameScreen:
             r_bbox = self.roo_rect(r_center)
             pg.draw.rect(s, (47, 213, 102), h_bbox, 2)   # human (greenish)
             pg.draw.rect(s, (244, 204, 47),  r_bbox, 2)  # roo (yellow)
-            fx, fy = self.sprite_r.fist_point(r_center, flip_h=(self.r_face > 0))
+            fx, fy = self.sprite_r.fist_point(r_center, flip_h=(self.sim.r_face > 0))
             pg.draw.circle(s, (230, 80, 80), (fx, fy), 5, 0)
 
         # Center message (with ♥ Rollback font library)
@@ -764,27 +662,23 @@ class GameScreen:
                 try:
                     # Use a font size roughly the same as the title
                     size_guess = font.get_height()
-                    sym = pg.font.SysFont("Segoe UI Symbol", size_guess) or pg.font.SysFont("Arial Unicode MS",
-                                                                                            size_guess)
-                    img = sym.render(text, True, self.msg_color)
+                    sym = sys_font("Segoe UI Symbol", size_guess) or sys_font("Arial Unicode MS", size_guess)
+                    img = render_text(sym, text, self.msg_color)
                 except Exception:
-                    img = font.render(text, True, self.msg_color)
+                    img = render_text(font, text, self.msg_color)
             else:
-                img = font.render(text, True, self.msg_color)
+                img = render_text(font, text, self.msg_color)
             s.blit(img, img.get_rect(center=self.play_rect.center))
 
-        # bottom-right debug event log
-        alive = []
+        # bottom-right debug event log (expired lines are dropped in update)
         x = self.W - 18
         y = self.H - 14
         for itm in reversed(self.debug_events[-6:]):  # last few lines
             if now < itm["until"]:
-                img = small.render(itm["text"], True, itm["color"])
+                img = render_text(small, itm["text"], itm["color"])
                 r = img.get_rect(bottomright=(x, y))
                 self.m.screen.blit(img, r)
                 y -= r.height + 4
-                alive.append(itm)
-        self.debug_events = [e for e in self.debug_events if now < e["until"]]
 
         # Round popup
         if self.popup_until > now and self.popup_kind:
@@ -792,7 +686,7 @@ class GameScreen:
             overlay.fill((0, 0, 0, 120))
             s.blit(overlay, (0, 0))
             txt = {"tie": "Round Over", "win": "You Win", "lose": "You Lose"}.get(self.popup_kind, "Round")
-            img = self.m.fonts["title"].render(txt, True, (255, 255, 255))
+            img = render_text(self.m.fonts["title"], txt, (255, 255, 255))
             s.blit(img, img.get_rect(center=self.play_rect.center))
 
 
@@ -817,3 +711,21 @@ def can_punch_yellow(h_rect: pg.Rect, r_rect: pg.Rect, r_face: int) -> bool:
         gap = r_rect.left - h_rect.right
         return abs(gap) <= tol
 
+
+def can_punch_poly(h_pieces, r_pieces, r_face: int) -> bool:
+    """
+    Polygon contact: the roo's convex pieces, pushed CONTACT_MAX_GAP_X toward its facing
+    (the same slack the yellow boxes get), overlap one of the human's.
+    """
+    tol = getattr(CFG, "CONTACT_MAX_GAP_X", 8) * (1 if r_face > 0 else -1)
+    moved = [((x0 + tol, y0, x1 + tol, y1), [(x + tol, y) for x, y in pts])
+             for (x0, y0, x1, y1), pts in r_pieces]
+    return pieces_overlap(moved, h_pieces) or pieces_overlap(r_pieces, h_pieces)
+
+
+def can_punch_mask(h_mask_rect, r_mask_rect, r_face: int) -> bool:
+    """Pixel contact: the roo's mask, at its spot or pushed CONTACT_MAX_GAP_X toward its facing, overlaps the human's."""
+    (hm, hr), (rm, rr) = h_mask_rect, r_mask_rect
+    tol = getattr(CFG, "CONTACT_MAX_GAP_X", 8) * (1 if r_face > 0 else -1)
+    dx, dy = hr.x - rr.x, hr.y - rr.y
+    return rm.overlap(hm, (dx, dy)) is not None or rm.overlap(hm, (dx - tol, dy)) is not None
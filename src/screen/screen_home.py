@@ -2,6 +2,8 @@
 import pygame as pg
 from src.config import CFG
 from src.widgets import Button
+from src.ui.text_cache import render_text, sys_font
+from src.ui.board import draw_checker_background
 
 class HomeScreen:
     def __init__(self, manager):
@@ -24,7 +26,7 @@ class HomeScreen:
         try:
             # Try to generate a larger title font using system font
             size = int(self.title_font.get_height() * 2)
-            self.title_font_big = pg.font.SysFont(None, size, bold=True)
+            self.title_font_big = sys_font(None, size, bold=True)
         except Exception:
             pass
 
@@ -63,14 +65,8 @@ class HomeScreen:
         self.btn_start.rect.centery = self.sub_pos[1] + sub_h // 2 + gap2 + btn_h // 2
 
     def _draw_full_grid(self):
-        COLS, ROWS = 16, 9
-        CELL_W = self.W // COLS
-        CELL_H = self.H // ROWS
-        for r in range(ROWS):
-            for c in range(COLS):
-                rect = pg.Rect(c * CELL_W, r * CELL_H, CELL_W, CELL_H)
-                col = CFG.GRID_LIGHT if (c + r) % 2 == 0 else CFG.GRID_DARK
-                pg.draw.rect(self.m.screen, col, rect)
+        # BG fill + 16x9 checkerboard, pre-rendered once per size/palette
+        draw_checker_background(self.m.screen, 16, 9)
 
     def handle_event(self, e):
         if self.btn_start.handle_event(e):
@@ -82,15 +78,14 @@ class HomeScreen:
 
     def draw(self):
         s = self.m.screen
-        s.fill(CFG.BG)
         self._draw_full_grid()
 
         # Title
-        img_title = self.title_font_big.render(self.title, True, CFG.TEXT)
+        img_title = render_text(self.title_font_big, self.title, CFG.TEXT)
         s.blit(img_title, img_title.get_rect(center=self.title_pos))
 
         # Subtitle
-        img_sub = self.sub_font.render(self.subtitle, True, self.sub_col)
+        img_sub = render_text(self.sub_font, self.subtitle, self.sub_col)
         s.blit(img_sub, img_sub.get_rect(center=self.sub_pos))
 
         # Button
@@ -2,6 +2,8 @@
 import pygame as pg
 from src.config import CFG
 from src.widgets import Button
+from src.ui.text_cache import render_text
+from src.ui.board import draw_checker_background
 
 # ------------- Panel border (selected: thicker blue; unselected: dark gray) -------------
 def draw_panel(surf, rect, *, highlight=False, bw_normal=3, bw_highlight=5):
@@ -60,7 +62,7 @@ def draw_confirm_button(surf, btn: Button, enabled: bool, border_w: int):
         fill, txt, bd = CFG.COL_CONFIRM_FILL_DIS, CFG.COL_CONFIRM_TEXT_DIS, CFG.COL_CONFIRM_BORDER_DIS
     pg.draw.rect(surf, fill, r, border_radius=12)
     pg.draw.rect(surf, bd,   r, width=border_w, border_radius=12)
-    timg = btn.font.render(btn.label, True, txt)
+    timg = render_text(btn.font, btn.label, txt)
     surf.blit(timg, timg.get_rect(center=r.center))
 
 # ====================== Main Screen ======================
@@ -169,17 +171,11 @@ class ModeScreen:
 
     # ---------------- Drawing ----------------
     def _draw_grid(self, s):
-        COLS, ROWS = 16, 9
-        cw, ch = self.W // COLS, self.H // ROWS
-        for r in range(ROWS):
-            for c in range(COLS):
-                rect = pg.Rect(c * cw, r * ch, cw, ch)
-                col = CFG.GRID_LIGHT if (c + r) % 2 == 0 else CFG.GRID_DARK
-                pg.draw.rect(s, col, rect)
+        # BG fill + 16x9 checkerboard, pre-rendered once per size/palette
+        draw_checker_background(s, 16, 9)
 
     def draw(self):
         s = self.m.screen
-        s.fill(CFG.BG)
         self._draw_grid(s)
 
         # Page title
@@ -1,6 +1,7 @@
 # screen_pause.py
 import pygame as pg
 from src.config import CFG
+from src.ui.text_cache import render_text
 
 class PauseScreen:
     """
@@ -9,7 +10,10 @@ class PauseScreen:
     Enter: Retry (replace('game'))
     H: Home (goto('home'))
     Mouse clicks on any of the three button areas also work.
+    Game time (m.game_clock) stands still while this overlay is on the stack.
     """
+    PAUSES_GAME = True
+
     def __init__(self, manager):
         self.m = manager
         self.W, self.H = manager.size
@@ -60,19 +64,19 @@ class PauseScreen:
         s.blit(overlay, (0, 0))
 
         # title
-        title = self.m.fonts["title"].render("Paused", True, CFG.TEXT)
+        title = render_text(self.m.fonts["title"], "Paused", CFG.TEXT)
         s.blit(title, title.get_rect(center=(self.W//2, self.H//2 - 80)))
 
         # draw button
         for text, rect in self.labels:
             pg.draw.rect(s, (200, 200, 210), rect, width=2, border_radius=10)
             # --- Center text inside the button ---
-            img = self.font_btn.render(text, True, (240, 240, 240))
+            img = render_text(self.font_btn, text, (240, 240, 240))
             img_rect = img.get_rect(center=rect.center)
             s.blit(img, img_rect)
 
         # hint
-        hint = self.font_hint.render(
-            "[Esc] Continue   [Enter] Retry the game   [H] back Home", True, CFG.TEXT
+        hint = render_text(
+            self.font_hint, "[Esc] Continue   [Enter] Retry the game   [H] back Home", CFG.TEXT
         )
         s.blit(hint, hint.get_rect(center=(self.W//2, self.H//2 + 200)))
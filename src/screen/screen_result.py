@@ -1,6 +1,7 @@
 # src/screen/screen_result.py
 import pygame as pg
 from src.config import CFG
+from src.ui.text_cache import render_text
 
 
 WHITE = (250, 250, 250)
@@ -9,12 +10,9 @@ GRID_LINE = (250, 250, 250)
 
 def draw_bold_text(surface: pg.Surface, font: pg.font.Font, text: str, color, center):
     """Fake bold by drawing the same text twice with 1px offset."""
-    img1 = font.render(text, True, color)
-    img2 = font.render(text, True, color)
-    r1 = img1.get_rect(center=center)
-    r2 = img2.get_rect(center=(center[0] + 1, center[1]))
-    surface.blit(img1, r1)
-    surface.blit(img2, r2)
+    img = render_text(font, text, color)
+    surface.blit(img, img.get_rect(center=center))
+    surface.blit(img, img.get_rect(center=(center[0] + 1, center[1])))
 
 
 class RoundResultScreen:
@@ -93,13 +91,13 @@ class RoundResultScreen:
         result_word = "WIN" if self.kind == "win" else "LOSE" if self.kind == "lose" else "TIE"
         if self.is_match_over:
             # Two lines: T2 then T1
-            l1 = self.font_mid.render(f"ROUND {self.round_idx}/3: YOU {result_word}", True, WHITE)
-            l2 = self.font_title.render(f"RESULTS OF THIS MATCH: YOU {result_word}", True, WHITE)
+            l1 = render_text(self.font_mid, f"ROUND {self.round_idx}/3: YOU {result_word}", WHITE)
+            l2 = render_text(self.font_title, f"RESULTS OF THIS MATCH: YOU {result_word}", WHITE)
             y0 = self.H // 2 - 180
             surface.blit(l1, l1.get_rect(center=(self.W // 2, y0)))
             surface.blit(l2, l2.get_rect(center=(self.W // 2, y0 + 58)))
         else:
-            l = self.font_title.render(f"ROUND {self.round_idx}/3: YOU {result_word}", True, WHITE)
+            l = render_text(self.font_title, f"ROUND {self.round_idx}/3: YOU {result_word}", WHITE)
             surface.blit(l, l.get_rect(center=(self.W // 2, self.H // 2 - 170)))
 
     def _draw_scoreboard(self, surface: pg.Surface):
@@ -160,10 +158,10 @@ class RoundResultScreen:
                 v_h, v_r = "0", "0"
 
             if v_h:
-                img = self.font_mid.render(v_h, True, WHITE)
+                img = render_text(self.font_mid, v_h, WHITE)
                 surface.blit(img, img.get_rect(center=(rect.x + left_w + col_w * 0.5, cy)))
             if v_r:
-                img = self.font_mid.render(v_r, True, WHITE)
+                img = render_text(self.font_mid, v_r, WHITE)
                 surface.blit(img, img.get_rect(center=(rect.x + left_w + col_w * 1.5, cy)))
 
     def draw(self):
@@ -181,5 +179,5 @@ class RoundResultScreen:
         # Buttons (simple stroked rectangles)
         for text, rect in self.labels:
             pg.draw.rect(s, (200, 200, 210), rect, width=2)  # no radius -> pure rectangle
-            img = self.font_mid.render(text, True, WHITE)
+            img = render_text(self.font_mid, text, WHITE)
             s.blit(img, img.get_rect(center=rect.center))
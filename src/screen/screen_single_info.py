@@ -1,8 +1,10 @@
 # src/screen/screen_single_info.py
-from pathlib import Path
 import pygame as pg
+from src.assets import ASSETS
 from src.config import CFG
 from src.widgets import Button
+from src.ui.text_cache import render_text
+from src.ui.board import draw_checker_background
 
 
 class L:
@@ -113,11 +115,9 @@ class SingleInfoScreen:
             "[Arrow] Move   [Space] Block",
         ]
 
-        # Image
+        # Image (shared with the game's sprites through the asset registry)
         try:
-            here = Path(__file__).resolve().parent
-            img_path = (here.parent.parent / L.IMG_REL_PATH).resolve()
-            self._img = pg.image.load(str(img_path)).convert_alpha()
+            self._img = ASSETS.image(L.IMG_REL_PATH)
         except Exception:
             self._img = None
 
@@ -137,12 +137,8 @@ class SingleInfoScreen:
 
     # Background grid
     def _draw_grid(self, s):
-        COLS, ROWS = 16, 9
-        cw, ch = self.W // COLS, self.H // ROWS
-        for r in range(ROWS):
-            for c in range(COLS):
-                col = CFG.GRID_LIGHT if (r + c) % 2 == 0 else CFG.GRID_DARK
-                pg.draw.rect(s, col, (c*cw, r*ch, cw, ch))
+        # BG fill + 16x9 checkerboard, pre-rendered once per size/palette
+        draw_checker_background(s, 16, 9)
 
     # —— Minimal: scale according to your IMG_SCALE; if it would exceed available height, clamp to just not exceed —— #
     def _blit_image_simple(self, surf, img):
@@ -157,7 +153,7 @@ class SingleInfoScreen:
             scale = max_scale
 
         nw, nh = max(1, int(iw * scale)), max(1, int(ih * scale))
-        simg = pg.transform.smoothscale(img, (nw, nh))
+        simg = ASSETS.resized(L.IMG_REL_PATH, (nw, nh))
 
         dst = simg.get_rect(centerx=self.img_centerx + L.IMG_X_OFFSET,
                             bottom=self.img_bottom + L.IMG_Y_OFFSET)
@@ -174,7 +170,6 @@ class SingleInfoScreen:
 
     def draw(self):
         s = self.m.screen
-        s.fill(CFG.BG)
         self._draw_grid(s)
 
         # Page top-left small title
@@ -211,7 +206,7 @@ class SingleInfoScreen:
         def draw_column(rect, heading_text, items):
             y = rect.top
             # Simple “fake bold” via overdraw
-            head_img  = font_head.render(heading_text, True, CFG.COL_TEXT)
+            head_img  = render_text(font_head, heading_text, CFG.COL_TEXT)
             rect_head = head_img.get_rect(topleft=(rect.left, y))
             for dx, dy in [(0,0),(1,0),(0,1),(1,1)]:
                 s.blit(head_img, rect_head.move(dx, dy))
@@ -221,13 +216,13 @@ class SingleInfoScreen:
             for t in items:
                 lines = wrap_text(t, font_body, wrap_w)
                 if lines:
-                    dot = font_body.render("• ", True, CFG.COL_TEXT)
+                    dot = render_text(font_body, "• ", CFG.COL_TEXT)
                     s.blit(dot, (rect.left, y))
                     x0 = rect.left + dot.get_width()
-                    s.blit(font_body.render(lines[0], True, CFG.COL_TEXT), (x0, y))
+                    s.blit(render_text(font_body, lines[0], CFG.COL_TEXT), (x0, y))
                     y += line_h
                     for cont in lines[1:]:
-                        s.blit(font_body.render(cont, True, CFG.COL_TEXT), (x0, y))
+                        s.blit(render_text(font_body, cont, CFG.COL_TEXT), (x0, y))
                         y += line_h
                 y += L.BULLET_GAP
 
@@ -1,6 +1,9 @@
 # screens.py
 import pygame as pg
 
+from src.config import CFG
+from src.game_clock import GameClock
+
 # Import only the classes needed by the “factory” (avoid circular imports)
 from .screen_home import HomeScreen
 from .screen_mode import ModeScreen
@@ -9,6 +12,40 @@ from .screen_game import GameScreen
 from .screen_end import EndScreen
 from .screen_pause import PauseScreen
 
+def _join_touching(rects):
+    """Union rects that overlap or touch, until none do."""
+    out = []
+    for r in rects:
+        r = pg.Rect(r)
+        hit = r.inflate(2, 2).collidelistall(out)
+        while hit:      # the grown rect may now reach others
+            for k in reversed(hit):
+                r.union_ip(out.pop(k))
+            hit = r.inflate(2, 2).collidelistall(out)
+        out.append(r)
+    return out
+
+
+def merge_rects(rects, max_groups=4):
+    """
+    Disjoint regions covering rects, at most max_groups of them (each costs one redraw):
+    overlapping or touching rects are joined, then the pair whose bounding box adds the
+    least uncovered area, until few enough remain.
+    """
+    out = _join_touching(r for r in rects if r.w > 0 and r.h > 0)
+    while len(out) > max_groups:
+        best = None
+        for i in range(len(out)):
+            for j in range(i + 1, len(out)):
+                u = out[i].union(out[j])
+                waste = u.w * u.h - out[i].w * out[i].h - out[j].w * out[j].h
+                if best is None or waste < best[0]:
+                    best = (waste, i, j, u)
+        _, i, j, u = best
+        out = _join_touching([u] + [r for k, r in enumerate(out) if k not in (i, j)])
+    return out
+
+
 class ScreenManager:
     """
     Manage a stack of screens:
@@ -18,12 +55,23 @@ class ScreenManager:
       - replace(name): replace the top with a new screen (e.g., Retry)
     Draw order: render from bottom to top; overlays draw only a translucent layer + UI.
     Event dispatch: send events only to the top-of-stack (current) screen.
+    Timing: game_clock (src.game_clock.GameClock) calls update(dt) with a fixed logic step;
+    screens read game time from m.game_clock.now and interpolate with m.game_clock.alpha.
+    It is paused while any screen with PAUSES_GAME = True is on the stack.
+    Presenting: draw() renders a frame, present() shows it once. With CFG.DIRTY_RECTS a
+    lone screen that has dirty_region() (list of Rects, or None = everything) is drawn
+    once per merged region, clipped to it, and presented with pg.display.update(rects);
+    screens' draw() must therefore be repeatable within a frame.
     """
     def __init__(self, screen, clock, fonts, size):
         self.screen = screen
         self.clock = clock
         self.fonts = fonts
         self.size = size
+        self.game_clock = GameClock(clock)
+        self.dirty_rects = getattr(CFG, "DIRTY_RECTS", False)
+        self._full_redraw = True
+        self._present_rects = None   # None = flip the whole screen
 
         self._routes = {
             "home":         lambda m, **kw: HomeScreen(m, **kw),
@@ -47,16 +95,30 @@ class ScreenManager:
     def current(self):
         return self.stack[-1] if self.stack else None
 
+    def invalidate(self):
+        """Next frame is drawn and presented in full (stack changes, focus overlays...)."""
+        self._full_redraw = True
+
+    def _sync_pause(self):
+        self._full_redraw = True
+        if any(getattr(v, "PAUSES_GAME", False) for v in self.stack):
+            self.game_clock.pause()
+        else:
+            self.game_clock.resume()
+
     # --- APIs ---
     def goto(self, name, **kwargs):
         self.stack = [self._make(name, **kwargs)]
+        self._sync_pause()
 
     def push(self, name, **kwargs):
         self.stack.append(self._make(name, **kwargs))
+        self._sync_pause()
 
     def pop(self):
         if self.stack:
             self.stack.pop()
+        self._sync_pause()
 
     def replace(self, name, **kwargs):
         if self.stack:
@@ -74,8 +136,30 @@ class ScreenManager:
         if cur:
             cur.update(dt)
 
+    def _dirty_region(self):
+        if not self.dirty_rects or len(self.stack) != 1:
+            return None
+        region = getattr(self.stack[0], "dirty_region", None)
+        rects = region() if region else None   # always asked, so the screen's history stays current
+        return None if self._full_redraw else rects
+
     def draw(self):
-        # Draw from bottom to top; the top layer may overlay with translucency
-        for view in self.stack:
-            view.draw()
-        pg.display.flip()
+        rects = self._dirty_region()
+        self._full_redraw = False
+        if rects is not None:
+            rects = merge_rects(rects)
+        for clip in (rects if rects is not None else [None]):
+            self.screen.set_clip(clip)
+            # Clear with the background color first, so a screen that draws nothing isn't black
+            self.screen.fill(CFG.BG)
+            # Draw from bottom to top; the top layer may overlay with translucency
+            for view in self.stack:
+                view.draw()
+        self.screen.set_clip(None)
+        self._present_rects = rects
+
+    def present(self):
+        if self._present_rects is None:
+            pg.display.flip()
+        elif self._present_rects:
+            pg.display.update(self._present_rects)
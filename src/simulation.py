@@ -0,0 +1,438 @@
+# src/simulation.py
+"""
+Headless match rules (no pygame).
+
+Everything that decides the outcome of a round lives here: stamina drain/regen,
+human move cooldown, AI facing/follow, punch wind-up and commit, block resolution,
+half-hearts, the round timer and the stalemate watch. Time is always passed in explicitly (`now` in ms,
+`dt_ms` per step), input comes in as a small struct, and every step returns a list
+of events for the caller to render (sprites, popups, logs, sfx).
+
+GameScreen is only an adapter over MatchSim; balancing scripts can drive the same
+object at any speed, e.g.
+
+    sim = MatchSim()
+    now = 0
+    while sim.winner is None:
+        now += 16
+        sim.step(now, 16, SimInput(left=True))
+"""
+from __future__ import annotations
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from src.bitboard import SAFE_INDEX, SAFE_OFFSETS, move_tables
+from src.config import CFG
+from src.entities import Human, Kangaroo
+from src.pathing import approach_step
+from src.reachability import human_steps_per_decision, reachability
+from src.stamina import StaminaBar
+from src.tablebase import load_tablebase
+
+# ---- facing enum (same values as the game screen) ----
+R_FACE_LEFT  = -1
+R_FACE_RIGHT =  1
+
+
+@dataclass
+class SimInput:
+    """Held keys for one step. `block` is the held state of SPACE (edges are detected by the sim)."""
+    up: bool = False
+    down: bool = False
+    left: bool = False
+    right: bool = False
+    block: bool = False
+
+
+@dataclass
+class SimEvent:
+    """Something the renderer may want to show. kind + timestamp + free-form payload."""
+    kind: str
+    t: int
+    data: dict = field(default_factory=dict)
+
+
+def grid_contact(sim: "MatchSim", commit: bool = False) -> bool:
+    """
+    Grid-only stand-in for the yellow-bbox test used on screen.
+    The screen snaps two characters on the same row face to face, so their boxes
+    always touch there; on different rows they never do. Same row == contact.
+    That only holds for HITBOX_MODE "bbox" (and "parts", which tests the same boxes)
+    without REQUIRE_FIST_POINT: "poly" and "mask" also need the sprite shapes to meet,
+    which depends on the animation frame, so a same-row punch can miss there.
+    """
+    return sim.human.pos[1] == sim.roo.pos[1]
+
+
+class MatchSim:
+    """
+    One best-of-3 match between the human and the AI kangaroo.
+      - step(now, dt_ms, inp) advances the rules and returns the events of that step.
+      - next_round(now) starts the following round after a "round_end" event.
+      - contact(sim, commit) decides whether a punch connects; GameScreen plugs in
+        its pixel test, headless runs use grid_contact (exact for bbox contact only).
+    """
+
+    def __init__(self, now: int = 0, cfg=None,
+                 contact: Optional[Callable[["MatchSim", bool], bool]] = None,
+                 log: Optional[Callable[[str], None]] = None):
+        self.cfg = cfg if cfg is not None else CFG
+        self.contact = contact or grid_contact
+        self.log = log
+
+        c = self.cfg
+        self.tables = move_tables(c.GRID_W, c.GRID_H)
+        self.reach = reachability(c.GRID_W, c.GRID_H, human_steps_per_decision(c))
+        self.face_only     = getattr(c, "AI_TURN_ONLY_MODE", False)
+        self.ai_follow     = getattr(c, "AI_ALLOW_MOVE", True) and not self.face_only
+        self.ai_punch      = getattr(c, "AI_ALLOW_PUNCH", True) and not self.face_only
+        self.ai_pathing    = getattr(c, "AI_USE_DISTANCE_FIELD", True)
+        self.tablebase     = load_tablebase(c) if self.ai_pathing else None
+
+        # Entities
+        self.human = Human(pos=self.human_spawn())
+        self.roo   = Kangaroo(pos=self.roo_spawn())
+
+        # HP / stamina
+        self.hp_h = StaminaBar(getattr(c, "HUMAN_STAMINA", 100))
+        self.st_h = StaminaBar(getattr(c, "HUMAN_STAMINA", 100))
+        self.st_r = StaminaBar(getattr(c, "ROO_STAMINA", 100))
+
+        # Lives (half hearts)
+        self.max_lives_halves = getattr(c, "HUMAN_HEARTS", 2) * 2
+        self.lives_halves = self.max_lives_halves
+        self.roo_halves   = getattr(c, "ROO_HEARTS", 3) * 2
+
+        # Round/Timer
+        self.round_idx = 1
+        self.round_total = 3
+        self.round_start = now
+        self.round_results = [None, None, None]  # 'human' / 'roo' / 'tie' / None
+        self.winner: str | None = None           # winner of the current round once it ended
+
+        # Facing
+        self.h_face = R_FACE_RIGHT
+        self.r_face = R_FACE_LEFT
+        self.roo_prev = self.roo.pos
+
+        self.score_h = 0
+        self.score_r = 0
+
+        self._reset_timers()
+        self._events: List[SimEvent] = []
+        self._now = now
+
+    # ---------- helpers ----------
+    def human_spawn(self):
+        return (1, self.cfg.GRID_H // 2)
+
+    def roo_spawn(self):
+        return (self.cfg.GRID_W - 2, self.cfg.GRID_H // 2)
+
+    def _reset_timers(self):
+        self.blocking = False
+        self._block_held = False
+        self.last_block_down_ms = -10_000
+        self.last_move_ms = 0
+        self.last_human_step_ms = -10_000
+        self.hitstop_until = 0
+        self.ai_pause_until = 0
+        self.last_ai_ms = 0
+        self.last_punch_ms = -10_000
+        self.intend_punch = False
+        self.punch_windup_until = 0
+        self.roo_punch_until = 0
+        self.evade_since = None
+        self.stalemate = False    # placement has been "human can evade forever" for STALEMATE_MS
+
+    def _emit(self, kind: str, **data):
+        self._events.append(SimEvent(kind, self._now, data))
+
+    def _dbg(self, msg: str):
+        if self.log:
+            self.log(msg)
+
+    def secs_left(self, now: int) -> int:
+        return max(0, self.cfg.ROUND_SECONDS - (now - self.round_start) // 1000)
+
+    @property
+    def match_over(self) -> bool:
+        return self.winner is not None and self.round_idx >= self.round_total
+
+    # ---------- facing ----------
+    @staticmethod
+    def face_str(f): return "Right" if f == R_FACE_RIGHT else "Left"
+
+    def _set_face(self, face):
+        if face != self.r_face:
+            self._dbg(f"Face: {self.face_str(self.r_face)} -> {self.face_str(face)}")
+        self.r_face = face
+
+    def _face_towards_player_x(self):
+        rx, _ = self.roo.pos
+        hx, _ = self.human.pos
+        self._set_face(R_FACE_RIGHT if (hx - rx) >= 0 else R_FACE_LEFT)
+
+    def _face_after_player_moved(self):
+        rx, _ = self.roo.pos
+        hx, _ = self.human.pos
+        if hx > rx: self._set_face(R_FACE_RIGHT)
+        elif hx < rx: self._set_face(R_FACE_LEFT)
+
+    # ---------- roo movement ----------
+    def _safe_move_roo(self, tx, ty) -> bool:
+        """No overlap, no pass-through; also updates facing by X. Target must be one of SAFE_OFFSETS away."""
+        rx, ry = self.roo.pos
+        t = self.tables
+        dst = t.roo_safe[t.idx(self.roo.pos)][t.idx(self.human.pos)][SAFE_INDEX[(tx - rx, ty - ry)]]
+        if dst < 0:
+            self._dbg("SafeMove: blocked by human, cancel")
+            return False
+
+        tx, ty = t.pos(dst)
+        self.roo_prev = self.roo.pos
+        self.roo.pos = (tx, ty)
+        if tx > rx: self._set_face(R_FACE_RIGHT)
+        if tx < rx: self._set_face(R_FACE_LEFT)
+        self._dbg(f"SafeMove: to ({tx},{ty}), face {self.face_str(self.r_face)}")
+        return True
+
+    def _roo_step_back(self):
+        """Step back after being blocked (prefer opposite X, fallback Y)."""
+        rx, ry = self.roo.pos
+        step_x = -1 if self.r_face == R_FACE_RIGHT else 1
+        if not self._safe_move_roo(rx + step_x, ry):
+            if not self._safe_move_roo(rx, ry - 1):
+                self._safe_move_roo(rx, ry + 1)
+
+    # ---------- block ----------
+    def set_blocking(self, on: bool):
+        self.blocking = bool(on)
+        if on:
+            self.last_block_down_ms = self._now
+        self._emit("block_on" if on else "block_off")
+
+    # ---------- rounds ----------
+    def _end_round(self, winner: str):
+        idx = max(1, min(self.round_total, self.round_idx)) - 1
+        self.round_results[idx] = winner if winner in ("human", "roo") else "tie"
+        self.winner = self.round_results[idx]
+        self._emit("round_end", winner=self.winner, round_idx=self.round_idx)
+
+    def _timeout_winner(self) -> str:
+        # Simple win/lose: if human still alive → Win; otherwise Lose
+        return "human" if (self.hp_h.cur > 0 and self.lives_halves > 0) else "roo"
+
+    def roo_can_force(self) -> bool:
+        """True if the roo can force contact from the current placement (see src/reachability.py)."""
+        return self.reach.roo_forces(self.human.pos, self.roo.pos)
+
+    def next_round(self, now: int):
+        """Reset HP/stamina/lives/positions/timers and start the next round."""
+        self._now = now
+        self.round_idx += 1
+        self.winner = None
+
+        self.hp_h.reset()
+        self.st_h.reset()
+        self.st_r.reset()
+        self.lives_halves = self.max_lives_halves
+
+        self.human.pos = self.human_spawn()
+        self.roo.pos = self.roo_spawn()
+        self.roo_prev = self.roo.pos
+        self.h_face = R_FACE_RIGHT
+        self.r_face = R_FACE_LEFT
+
+        self._reset_timers()
+        self.round_start = now
+
+    # =====================  Step  =====================
+    def step(self, now: int, dt_ms: float, inp: SimInput) -> List[SimEvent]:
+        """Advance the rules to `now` (dt_ms since last step). Returns this step's events."""
+        self._now = now
+        self._events = []
+        if self.winner is not None:
+            return self._events
+
+        c = self.cfg
+
+        # SPACE edges (auto-released blocks stay released until pressed again)
+        if inp.block != self._block_held:
+            self._block_held = inp.block
+            self.set_blocking(inp.block)
+
+        # Hitstop keeps animation running on the renderer side
+        if now < self.hitstop_until:
+            return self._events
+
+        # Human stamina drain/regen
+        dt_sec = dt_ms / 1000.0
+        if self.blocking:
+            self.st_h.lose(c.BLOCK_DRAIN_PER_SEC * dt_sec)
+            if self.st_h.cur <= c.BLOCK_MIN_STAMINA:
+                self.set_blocking(False)
+        else:
+            self.st_h.cur = min(self.st_h.max, self.st_h.cur + c.ST_REGEN_PER_SEC_H * dt_sec)
+
+        # —— Round countdown check —— #
+        elapsed_sec = (now - self.round_start) // 1000
+        if elapsed_sec >= c.ROUND_SECONDS:
+            # Simple win/lose: if human still alive → Win; otherwise Lose
+            self._end_round(self._timeout_winner())
+            return self._events
+
+        # —— Stalemate watch: roo cannot force contact for STALEMATE_MS —— #
+        if self.roo_can_force():
+            self.evade_since = None
+            self.stalemate = False
+        elif self.evade_since is None:
+            self.evade_since = now
+        elif not self.stalemate and now - self.evade_since >= c.STALEMATE_MS:
+            self.stalemate = True
+            self._dbg("Stalemate: roo cannot force contact")
+            self._emit("stalemate")
+            if c.STALEMATE_END_ROUND:
+                self._end_round(self._timeout_winner())
+                return self._events
+
+        # Human move (continuous keys + cooldown + stamina)
+        if now - self.last_move_ms >= c.MOVE_COOLDOWN_MS:
+            hx, hy = self.human.pos
+            nx, ny = hx, hy
+            if inp.up:
+                ny -= 1
+            elif inp.down:
+                ny += 1
+            elif inp.left:
+                nx -= 1; self.h_face = R_FACE_LEFT
+            elif inp.right:
+                nx += 1; self.h_face = R_FACE_RIGHT
+
+            if (nx, ny) != (hx, hy) and self.human.can_move(nx, ny, roo_pos=self.roo.pos,
+                                                            cols=c.GRID_W, rows=c.GRID_H):
+                if self.st_h.cur >= c.WALK_COST:
+                    self.human.move_to(nx, ny)
+                    self.st_h.lose(c.WALK_COST)
+                    self.last_move_ms = now
+                    self.last_human_step_ms = now
+                    self._face_after_player_moved()
+                    self._emit("human_move", pos=self.human.pos)
+
+        # AI tick
+        self._ai_decide(now, dt_sec)
+
+        # Punch commit (single hit-check moment)
+        if self.ai_punch and self.intend_punch and now >= self.punch_windup_until:
+            self._commit_punch(now)
+            if self.winner is not None:
+                return self._events
+
+        # Auto reset punch anim
+        if self.roo_punch_until and now >= self.roo_punch_until:
+            self.roo_punch_until = 0
+            self._emit("punch_end")
+
+        return self._events
+
+    def _commit_punch(self, now: int):
+        c = self.cfg
+        self.intend_punch = False
+
+        prev = self.r_face
+        self._face_towards_player_x()
+        self._dbg(f"Punch commit face: {self.face_str(prev)} -> {self.face_str(self.r_face)}")
+
+        self.roo_punch_until = now + c.PUNCH_ANIM_MS
+        self.last_punch_ms = now
+        self._emit("punch")
+
+        if not self.contact(self, True):
+            self.ai_pause_until = now + 220
+            self._dbg("Punch result: WHIFF")
+            self._emit("whiff")
+            return
+
+        # BLOCK or HIT
+        if self.blocking:
+            self._dbg("Punch result: BLOCK")
+            self.hp_h.lose(c.PUNCH_BLOCKED_DAMAGE)
+            self.st_r.lose(c.BLOCK_SHARED_LOSS)
+            self.st_h.lose(c.BLOCK_SHARED_LOSS * 0.5)
+            self._emit("blocked", damage=c.PUNCH_BLOCKED_DAMAGE)
+
+            self.hitstop_until = now + c.HITSTOP_MS
+            self._roo_step_back()
+            self.ai_pause_until = now + c.BLOCK_RECOVER_MS
+            self.score_r += 1
+            return
+
+        # HIT
+        self._dbg("Punch result: HIT")
+        self.hp_h.lose(c.PUNCH_DAMAGE)
+        self._emit("hit", damage=c.PUNCH_DAMAGE)
+
+        self.hitstop_until = now + c.HITSTOP_MS
+        self.score_r += 1
+
+        if self.hp_h.cur <= 0:
+            self.lives_halves = max(0, self.lives_halves - 1)
+            self.hp_h.reset()
+            self._dbg(f"Half-heart lost -> {self.lives_halves}")
+            self._emit("half_heart", left=self.lives_halves)
+            if self.lives_halves == 0:
+                self._end_round("roo")
+
+    # =====================  AI  =====================
+    def _ai_decide(self, now, dt_sec: float):
+        """AI every step: face → (maybe) wind-up punch → (else) follow."""
+        c = self.cfg
+        if now < self.hitstop_until or now < self.ai_pause_until:
+            return
+
+        if self.st_r.cur < c.ROO_REST_THRESHOLD:
+            self.st_r.cur = min(self.st_r.max, self.st_r.cur + c.ST_REGEN_PER_SEC_R * dt_sec)
+            return
+
+        rx, ry = self.roo.pos
+        hx, hy = self.human.pos
+        dx, dy = hx - rx, hy - ry
+
+        need_face = R_FACE_RIGHT if dx >= 0 else R_FACE_LEFT
+        if self.r_face != need_face:
+            self._set_face(need_face)
+
+        if self.face_only:
+            return
+
+        # Wind-up if in contact (guard: do not re-start if already winding)
+        if (self.ai_punch
+                and (now - self.last_punch_ms >= c.PUNCH_COOLDOWN_MS)
+                and not self.intend_punch):
+            if self.contact(self, False):
+                self.intend_punch = True
+                self.punch_windup_until = now + c.PUNCH_WINDUP_MS
+                self._dbg("Wind-up start")
+                self._emit("windup")
+                return
+
+        # Follow: tablebase move when the chase is solved as forced, else the shortest path
+        # on the jump graph when reachable, else prefer X, else Y
+        if self.ai_follow and (now - self.last_ai_ms >= c.AI_DECIDE_EVERY_MS):
+            self.last_ai_ms = now
+            moved = False
+            k = -1
+            if self.tablebase is not None:
+                k = self.tablebase.best_move(self.human.pos, self.roo.pos, self.st_h.cur)
+            if k < 0 and self.ai_pathing:
+                k = approach_step(c.GRID_W, c.GRID_H, self.roo.pos, self.human.pos)
+            if k >= 0:
+                ox, oy = SAFE_OFFSETS[k]
+                moved = self._safe_move_roo(rx + ox, ry + oy)
+            elif dx != 0:
+                moved = self._safe_move_roo(rx + (2 if dx > 0 else -2), ry)
+            elif dy != 0:
+                moved = self._safe_move_roo(rx, ry + (2 if dy > 0 else -2))
+            if moved:
+                self.st_r.lose(c.ROO_JUMP_ST_DRAIN)
+                self._emit("roo_jump", pos=self.roo.pos)
@@ -1,11 +1,16 @@
 # src/sprites.py
 from __future__ import annotations
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 import pygame as pg
 import json, os
 
+from src.assets import fit_size
+from src.atlas import character_atlas
 from src.config import CFG
+from src.hitbox_bin import load_compiled
+from src.polygon import bounds, convex_pieces, simplify
 
 # -----------------------------------------------------------------------------
 # Paths & defaults
@@ -32,34 +37,30 @@ def _hitbox_json_path() -> str:
 # -----------------------------------------------------------------------------
 # Image loading & scale helpers
 # -----------------------------------------------------------------------------
-def _load(name: str) -> pg.Surface:
-    path = _ASSET_DIR / name
-    img = pg.image.load(str(path)).convert_alpha()
-    return img
-
-
 def _fit_to_cell(img: pg.Surface, cell_w: int, cell_h: int, ratio: float = 1.30) -> pg.Surface:
     """Scale an image to fit a grid cell with a multiplier ratio."""
-    w, h = img.get_size()
-    maxw, maxh = int(cell_w * ratio), int(cell_h * ratio)
-    s = min(maxw / max(w, 1), maxh / max(h, 1))
-    new_size = (max(1, int(w * s)), max(1, int(h * s)))
-    return pg.transform.smoothscale(img, new_size)
+    return pg.transform.smoothscale(img, fit_size(img.get_size(), cell_w, cell_h, ratio))
 
 
 # -----------------------------------------------------------------------------
 # Hitbox meta loader
 # -----------------------------------------------------------------------------
-_HIT_META: dict | None = None
+_HIT_META: Mapping | None = None
 
 
-def load_hit_meta() -> dict:
-    """Load (and cache) hitbox metadata JSON."""
+def load_hit_meta() -> Mapping:
+    """
+    Load (and cache) hitbox metadata: the compiled hitbox_meta.bin when it matches the
+    JSON (mmap'd, frames decoded on first lookup), else the JSON itself.
+    """
     global _HIT_META
     if _HIT_META is None:
         _HIT_META = {}
         p = _hitbox_json_path()
-        if os.path.exists(p):
+        compiled = load_compiled(p)
+        if compiled is not None:
+            _HIT_META = compiled
+        elif os.path.exists(p):
             try:
                 with open(p, "r", encoding="utf-8") as f:
                     _HIT_META = json.load(f)
@@ -68,23 +69,27 @@ def load_hit_meta() -> dict:
     return _HIT_META
 
 
-def get_hit_shape(img_name: str, surf: pg.Surface) -> dict:
+def get_hit_shape(img_name: str, size: Tuple[int, int]) -> dict:
     """
     Return active hit shape under the mode:
       - {"type":"rects","rects":[(x,y,w,h), ...]}    (image space)
       - {"type":"poly", "pts":[(x,y), ...]}          (image space)
-    Fallbacks exist when items are missing.
+    Fallbacks exist when items are missing (the whole image, size = original (w, h)).
     """
     meta = load_hit_meta().get(img_name, None)
     if not meta:
         # fallback: full image bbox
-        w, h = surf.get_size()
+        w, h = size
         return {"type": "rects", "rects": [(0, 0, w, h)]}
 
     mode = _hitbox_mode()
 
+    # Simplified contour (compiled by src.hitbox_bin), tens of vertices
+    if mode == "poly" and meta.get("polySimple"):
+        return {"type": "poly", "pts": [tuple(p) for p in meta["polySimple"]]}
+
     # Pixel/contour polygon (the editor stores it as maskPoly)
-    if mode == "mask" and meta.get("maskPoly"):
+    if mode in ("mask", "poly") and meta.get("maskPoly"):
         return {"type": "poly", "pts": [tuple(p) for p in meta["maskPoly"]]}
 
     # Single tight bbox
@@ -100,7 +105,7 @@ def get_hit_shape(img_name: str, surf: pg.Surface) -> dict:
         return {"type": "rects", "rects": rects}
 
     # Last fallback: full image
-    w, h = surf.get_size()
+    w, h = size
     return {"type": "rects", "rects": [(0, 0, w, h)]}
 
 
@@ -111,12 +116,109 @@ def get_hit_shape(img_name: str, surf: pg.Surface) -> dict:
 FrameType = Tuple[pg.Surface, str, Tuple[int, int]]
 
 
+@dataclass(frozen=True)
+class FrameGeom:
+    """
+    Geometry of one frame under one flip, relative to the draw rect's top-left
+    (already mirrored when flipped), so screen-space values are one add away.
+    JSON shapes are in original image pixels; everything here is scaled to the frame.
+    """
+    size: Tuple[int, int]                               # scaled surface size
+    tight: Tuple[int, int, int, int]                    # non-transparent bbox (min_alpha=10)
+    bbox: Optional[Tuple[int, int, int, int]]           # JSON "bbox", scaled
+    fist: Optional[Tuple[float, float]]                 # JSON fist point (punching side), scaled
+    rects: Tuple[Tuple[int, int, int, int], ...] = ()   # get_hit_shape() for HITBOX_MODE at build, scaled
+    pieces: Tuple[tuple, ...] = ()                      # convex hit pieces, scaled: ((bounds), ((x, y), ...))
+    mask: Optional[pg.mask.Mask] = field(default=None, compare=False)   # pixel mask of the (flipped) frame
+
+
+_CONVEX_FALLBACK: Dict[str, list] = {}
+
+
+def _convex_source(name: str, meta) -> list:
+    """Convex pieces in original image pixels: compiled ones, else built from maskPoly (poly mode only)."""
+    if meta.get("convex"):
+        return meta["convex"]
+    if _hitbox_mode() != "poly" or not meta.get("maskPoly"):
+        return []
+    if name not in _CONVEX_FALLBACK:
+        _CONVEX_FALLBACK[name] = convex_pieces(simplify(meta["maskPoly"]))
+    return _CONVEX_FALLBACK[name]
+
+
+def _frame_geometry(frame: FrameType, flip_h: bool, img: Optional[pg.Surface] = None,
+                    fist_side: str = "right") -> FrameGeom:
+    surf, name, (ow, oh) = frame
+    sw, sh = surf.get_size()
+    if img is None:
+        img = pg.transform.flip(surf, True, False) if flip_h else surf
+    meta = load_hit_meta().get(name, {})
+    sx, sy = sw / max(1, ow), sh / max(1, oh)
+
+    def scaled(x, y, w, h):
+        x0, y0, x1, y1 = round(x * sx), round(y * sy), round((x + w) * sx), round((y + h) * sy)
+        if flip_h:
+            x0, x1 = sw - x1, sw - x0
+        return (x0, y0, x1 - x0, y1 - y0)
+
+    bbox = scaled(*meta["bbox"]) if meta.get("bbox") else None
+
+    # Active-mode hit rects (poly shapes degrade to their bounding box)
+    shape = get_hit_shape(name, (ow, oh))
+    if shape["type"] == "rects":
+        rects = tuple(scaled(*r) for r in shape["rects"])
+    else:
+        xs = [p[0] for p in shape["pts"]]
+        ys = [p[1] for p in shape["pts"]]
+        rects = (scaled(min(xs), min(ys), max(xs) - min(xs), max(ys) - min(ys)),) if xs else ()
+
+    # Punching fist (unflipped image coordinates): people punch with "right", the roo with "left";
+    # older metadata stored it as punchR / punchL
+    fist = None
+    pt = (meta.get("fist") or {}).get(fist_side)
+    if pt is None:
+        pt = meta.get("punchR" if fist_side == "right" else "punchL")
+    if pt is not None:
+        px, py = pt[0] * (sw / max(1, ow)), pt[1] * (sh / max(1, oh))
+        fist = ((sw - px) if flip_h else px, py)
+
+    pieces = []
+    for pc in _convex_source(name, meta):
+        pts = tuple(((sw - x * sx) if flip_h else x * sx, y * sy) for x, y in pc)
+        pieces.append((bounds(pts), pts))
+
+    return FrameGeom(size=(sw, sh), tight=tuple(img.get_bounding_rect(min_alpha=10)), bbox=bbox, fist=fist,
+                     rects=rects, pieces=tuple(pieces), mask=pg.mask.from_surface(img))
+
+
+def build_flip_banks(frames_map: Dict[str, List[FrameType]]) -> Dict[str, List[Tuple[pg.Surface, pg.Surface]]]:
+    """{ state: [ (surface, horizontally flipped surface) per frame ] } — flipped once at load time."""
+    return {state: [(f[0], pg.transform.flip(f[0], True, False)) for f in frames]
+            for state, frames in frames_map.items()}
+
+
+def build_geometry(frames_map: Dict[str, List[FrameType]],
+                   banks: Optional[Dict[str, List[Tuple[pg.Surface, pg.Surface]]]] = None,
+                   fist_side: str = "right") -> Dict[str, List[Tuple[FrameGeom, FrameGeom]]]:
+    """{ state: [ (unflipped, flipped) geometry per frame ] } — built once per sprite."""
+    banks = banks if banks is not None else build_flip_banks(frames_map)
+    return {state: [(_frame_geometry(f, False, b[0], fist_side), _frame_geometry(f, True, b[1], fist_side))
+                    for f, b in zip(frames, banks[state])]
+            for state, frames in frames_map.items()}
+
+
 class SimpleSprite:
-    def __init__(self, frames_map: Dict[str, List[FrameType]], fps: float = 6):
+    def __init__(self, frames_map: Dict[str, List[FrameType]], fps: float = 6,
+                 geometry: Optional[Dict[str, List[Tuple[FrameGeom, FrameGeom]]]] = None,
+                 banks: Optional[Dict[str, List[Tuple[pg.Surface, pg.Surface]]]] = None):
         """
         frames_map: { state: [ (scaled_surface, 'file.png', (orig_w, orig_h)), ... ] }
+        geometry:   build_geometry(frames_map), computed here when not given
+        banks:      build_flip_banks(frames_map), computed here when not given
         """
         self._frames: Dict[str, List[FrameType]] = frames_map
+        self._banks = banks if banks is not None else build_flip_banks(frames_map)
+        self._geom = geometry if geometry is not None else build_geometry(frames_map, self._banks)
         self.state = "idle"
         self._idx = 0
         self._acc = 0.0
@@ -158,23 +260,46 @@ class SimpleSprite:
     def current_surface(self) -> pg.Surface:
         return self._cur()[0]
 
+    def current_surface_facing(self, flip_h: bool = False) -> pg.Surface:
+        """Current frame from the pre-flipped bank (no per-call flip)."""
+        self._cur()
+        return self._banks[self.state][self._idx][1 if flip_h else 0]
+
     def current_image_name(self) -> str:
         return self._cur()[1]
 
     def current_orig_size(self) -> Tuple[int, int]:
         return self._cur()[2]
 
+    def frame_key(self) -> Tuple[str, int]:
+        """(state, frame index) of the current frame — stable key for layout tables."""
+        return (self.state, self._idx)
+
+    def frame_keys(self) -> List[Tuple[str, int]]:
+        return [(st, i) for st, frames in self._frames.items() for i in range(len(frames))]
+
+    def current_geom(self, flip_h: bool = False, key: Optional[Tuple[str, int]] = None) -> FrameGeom:
+        """Precomputed geometry of the current frame, or of frame `key` (no surface work)."""
+        state, idx = key if key is not None else (self.state, self._idx)
+        geoms = self._geom.get(state)
+        if not geoms:
+            raise RuntimeError(f"No frames for state '{state}'")
+        return geoms[idx][1 if flip_h else 0]
+
     # --- draw ---
     def get_draw_rect(self, center_xy: Tuple[int, int], flip_h: bool = False) -> pg.Rect:
-        img = self.current_surface()
-        if flip_h:
-            img = pg.transform.flip(img, True, False)
-        return img.get_rect(center=center_xy)
+        w, h = self.current_geom(flip_h).size
+        return pg.Rect(center_xy[0] - w // 2, center_xy[1] - h // 2, w, h)
+
+    def tight_rect(self, center_xy: Tuple[int, int], flip_h: bool = False,
+                   key: Optional[Tuple[str, int]] = None) -> pg.Rect:
+        """Non-transparent bounding rect of the current frame (or frame `key`) in screen coords."""
+        g = self.current_geom(flip_h, key)
+        x, y, w, h = g.tight
+        return pg.Rect(center_xy[0] - g.size[0] // 2 + x, center_xy[1] - g.size[1] // 2 + y, w, h)
 
     def draw(self, surface: pg.Surface, center_xy: Tuple[int, int], flip_h: bool = False):
-        img = self.current_surface()
-        if flip_h:
-            img = pg.transform.flip(img, True, False)
+        img = self.current_surface_facing(flip_h)
         rect = img.get_rect(center=center_xy)
         self._last_draw_rect = rect
         surface.blit(img, rect)
@@ -183,103 +308,61 @@ class SimpleSprite:
     def mask_and_rect(self, center_xy: Tuple[int, int], flip_h: bool = False) -> tuple[pg.mask.Mask, pg.Rect]:
         """
         Return (mask, draw_rect) of current frame at given screen center,
-        respecting horizontal flip.
+        respecting horizontal flip. Masks are built once per frame and facing (build_geometry);
+        treat them as read-only.
         """
-        surf = self.current_surface()
-        if flip_h:
-            surf = pg.transform.flip(surf, True, False)
-        rect = surf.get_rect(center=center_xy)
-        m = pg.mask.from_surface(surf)
-        return m, rect
+        return self.current_geom(flip_h).mask, self.get_draw_rect(center_xy, flip_h=flip_h)
 
     # --- fist anchor (screen space) ---
     def fist_point(self, center_xy: Tuple[int, int], flip_h: bool = False) -> Tuple[int, int]:
         """
-        Compute fist anchor (screen space) from JSON meta:
-          - For "unflipped" image coordinates: people use punchR, roo uses punchL
-          - When flip_h=True, apply mirroring conversion
+        Fist anchor (screen space) from JSON meta, scaled and mirrored once in build_geometry:
+          - For "unflipped" image coordinates: people use fist.right, roo uses fist.left
+          - When flip_h=True, the mirrored anchor is used
         If not provided, fall back to current frame center.
         """
-        name = self.current_image_name()
-        meta = load_hit_meta().get(name, {})
-
-        # Convention: when the human faces right, the punch point is on the right; when the roo faces left, the punch point is on the left
-        # Use punchR by default when not flipped; use mirrored (or punchL) when flipped
-        # To avoid missing data, try punchR first, otherwise punchL
-        pt = meta.get("punchR", None)
-        if pt is None:
-            pt = meta.get("punchL", None)
-
-        surf = self.current_surface()
-        sw, sh = surf.get_size()
-
-        if pt is None:
+        g = self.current_geom(flip_h)
+        draw_rect = self.get_draw_rect(center_xy, flip_h=flip_h)
+        if g.fist is None:
             # No anchor → use draw center
-            draw_rect = self.get_draw_rect(center_xy, flip_h=flip_h)
             return draw_rect.center
-
-        # Scaling from original image to current image (based on recorded original size)
-        ow, oh = self.current_orig_size()
-        sx = sw / max(1, ow)
-        sy = sh / max(1, oh)
-        px, py = pt[0] * sx, pt[1] * sy
-
-        # If horizontally flipped → mirror X
-        if flip_h:
-            px = sw - px
-
-        draw_rect = self.get_draw_rect(center_xy, flip_h=flip_h)
+        px, py = g.fist
         return (int(draw_rect.left + px), int(draw_rect.top + py))
 
     # --- hit rectangles in SCREEN space ---
+    def hit_rects_local(self, flip_h: bool = False) -> Tuple[Tuple[int, int, int, int], ...]:
+        """Hit rects of the current frame relative to its draw rect (precomputed, nothing allocated)."""
+        return self.current_geom(flip_h).rects
+
     def hit_rects(self, center_xy: Tuple[int, int], flip_h: bool = False) -> List[pg.Rect]:
         """
-        Map image-space hit shapes to screen-space rectangles using
-        current frame draw rect. (poly mode currently degrades to its bounding box)
+        Hit shapes of the current frame as screen-space rectangles (scaled and mirrored
+        once in build_geometry; poly modes degrade to their bounding box).
         """
-        img = self.current_surface()
-        name = self.current_image_name()
-        # Note: flip has minimal effect on parts/bbox (can be ignored if left-right symmetric)
         draw_rect = self.get_draw_rect(center_xy, flip_h=flip_h)
         left, top = draw_rect.x, draw_rect.y
+        return [pg.Rect(left + x, top + y, w, h) for (x, y, w, h) in self.current_geom(flip_h).rects]
 
-        shape = get_hit_shape(name, img)
-        rects: List[pg.Rect] = []
-
-        if shape["type"] == "rects":
-            for (x, y, w, h) in shape["rects"]:
-                if flip_h:
-                    x = img.get_width() - x - w
-                rects.append(pg.Rect(int(left + x), int(top + y), int(w), int(h)))
-        elif shape["type"] == "poly":
-            pts = shape["pts"]
-            if pts:
-                # If flipped: mirror polygon points
-                if flip_h:
-                    sw = img.get_width()
-                    pts = [(sw - px, py) for (px, py) in pts]
-                minx = min(p[0] for p in pts); maxx = max(p[0] for p in pts)
-                miny = min(p[1] for p in pts); maxy = max(p[1] for p in pts)
-                rects.append(pg.Rect(int(left + minx), int(top + miny), int(maxx - minx), int(maxy - miny)))
-        return rects
+    def hit_pieces(self, center_xy: Tuple[int, int], flip_h: bool = False) -> List[tuple]:
+        """Convex hit pieces in screen space, [(bounds, points)], for polygon.pieces_overlap."""
+        g = self.current_geom(flip_h)
+        r = self.get_draw_rect(center_xy, flip_h=flip_h)
+        dx, dy = r.x, r.y
+        return [((x0 + dx, y0 + dy, x1 + dx, y1 + dy), [(x + dx, y + dy) for x, y in pts])
+                for (x0, y0, x1, y1), pts in g.pieces]
 
     def bbox_rect(self, center_xy: tuple[int, int], flip_h: bool = False) -> pg.Rect:
         """
         Return the current frame’s “yellow tight bounding box” in screen coordinates (a single Rect).
         If JSON has no bbox, fall back to the full image bounding box.
         """
-        img = self.current_surface()
-        name = self.current_image_name()
+        g = self.current_geom(flip_h)
         draw_rect = self.get_draw_rect(center_xy, flip_h=flip_h)
-        left, top = draw_rect.x, draw_rect.y
 
-        meta = load_hit_meta().get(name, {})
         # Prefer bbox from JSON
-        if meta.get("bbox"):
-            x, y, w, h = meta["bbox"]
-            if flip_h:
-                x = img.get_width() - x - w
-            return pg.Rect(int(left + x), int(top + y), int(w), int(h))
+        if g.bbox is not None:
+            x, y, w, h = g.bbox
+            return pg.Rect(draw_rect.x + x, draw_rect.y + y, w, h)
 
         # Fallback: full image
         return draw_rect.copy()
@@ -289,39 +372,48 @@ class SimpleSprite:
 # -----------------------------------------------------------------------------
 # Sprite factories
 # -----------------------------------------------------------------------------
-def _make_frame_tuple(img: pg.Surface, name: str, cell_w: int, cell_h: int, ratio: float) -> FrameType:
-    """Helper to build (scaled_surface, filename, (orig_w,orig_h))."""
-    ow, oh = img.get_size()
-    scaled = _fit_to_cell(img, cell_w, cell_h, ratio)
-    return (scaled, name, (ow, oh))
+def _make_frame_tuple(name: str, cell_w: int, cell_h: int, ratio: float) -> FrameType:
+    """Helper to build (scaled_surface, filename, (orig_w,orig_h)); the surface is an atlas view."""
+    atlas = character_atlas(cell_w, cell_h, ratio)
+    return (atlas.frame(name, cell_w, cell_h, ratio), name, atlas.orig_size(name))
+
+
+def _atlas_banks(frames_map: Dict[str, List[FrameType]], cell_w: int, cell_h: int,
+                 ratio: float) -> Dict[str, List[Tuple[pg.Surface, pg.Surface]]]:
+    """build_flip_banks, with the flipped frames taken from the atlas."""
+    atlas = character_atlas(cell_w, cell_h, ratio)
+    return {state: [(f[0], atlas.frame(f[1], cell_w, cell_h, ratio, flip=True)) for f in frames]
+            for state, frames in frames_map.items()}
 
 
 def make_people_sprite(cell_w: int, cell_h: int, fps_idle: float = 3) -> SimpleSprite:
     # people01, people02 idle; people03 block
     p1_name, p2_name, pb_name = "people01.png", "people02.png", "people03.png"
 
-    p1 = _make_frame_tuple(_load(p1_name), p1_name, cell_w, cell_h, 1.30)
-    p2 = _make_frame_tuple(_load(p2_name), p2_name, cell_w, cell_h, 1.30)
-    pb = _make_frame_tuple(_load(pb_name), pb_name, cell_w, cell_h, 1.30)
+    p1 = _make_frame_tuple(p1_name, cell_w, cell_h, 1.30)
+    p2 = _make_frame_tuple(p2_name, cell_w, cell_h, 1.30)
+    pb = _make_frame_tuple(pb_name, cell_w, cell_h, 1.30)
 
     frames: Dict[str, List[FrameType]] = {
         "idle":  [p1, p2],
         "block": [pb],
     }
-    return SimpleSprite(frames, fps=fps_idle)
+    banks = _atlas_banks(frames, cell_w, cell_h, 1.30)
+    return SimpleSprite(frames, fps=fps_idle, geometry=build_geometry(frames, banks), banks=banks)
 
 
 def make_roo_sprite(cell_w: int, cell_h: int, fps_idle: float = 4) -> SimpleSprite:
     # roo01 idle, roo02 jump, roo04 punch (roo03 can be added later)
     r1_name, r2_name, r4_name = "roo01.png", "roo02.png", "roo04.png"
 
-    r1 = _make_frame_tuple(_load(r1_name), r1_name, cell_w, cell_h, 1.30)
-    r2 = _make_frame_tuple(_load(r2_name), r2_name, cell_w, cell_h, 1.30)
-    r4 = _make_frame_tuple(_load(r4_name), r4_name, cell_w, cell_h, 1.30)
+    r1 = _make_frame_tuple(r1_name, cell_w, cell_h, 1.30)
+    r2 = _make_frame_tuple(r2_name, cell_w, cell_h, 1.30)
+    r4 = _make_frame_tuple(r4_name, cell_w, cell_h, 1.30)
 
     frames: Dict[str, List[FrameType]] = {
         "idle":  [r1],
         "jump":  [r2],
         "punch": [r4],
     }
-    return SimpleSprite(frames, fps=fps_idle)
+    banks = _atlas_banks(frames, cell_w, cell_h, 1.30)
+    return SimpleSprite(frames, fps=fps_idle, geometry=build_geometry(frames, banks, fist_side="left"), banks=banks)
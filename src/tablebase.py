@@ -0,0 +1,262 @@
+# src/tablebase.py
+"""
+Endgame tablebase for the chase: perfect kangaroo moves from a flat binary file.
+
+State (roo to move): human cell h, roo cell r, human stamina bucket b (walks the
+human can still afford, 0..HUMAN_STAMINA // WALK_COST). Each turn the roo makes one
+safe jump; then the human walks up to min(b, AI_DECIDE_EVERY_MS // MOVE_COOLDOWN_MS)
+tiles off the roo's row and regains the walks that stamina regen pays for during one
+AI decision. Contact = same row, as in grid_contact. Facing is not part of the state:
+the AI always turns before winding up, so it never changes the outcome.
+
+Retrograde solving gives, per state:
+    WIN   roo forces contact within one round's worth of jumps
+    DRAW  roo forces contact, but only after the round clock would have run out
+    LOSS  the human can evade forever
+plus the best first jump (SAFE_OFFSETS index) and the number of jumps to contact.
+
+File layout (little endian): a fixed header (magic, version, the CFG values the
+table was solved for) followed by 2 bytes per state at
+((h * cells + r) * buckets + b) * 2:  [value << 3 | move (7 = none), jumps (255 = inf)].
+The game maps the file with mmap at startup; a query is one index computation.
+
+    python -m src.tablebase            # (re)build assets/tablebase.bin for the current CFG
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+import time
+from pathlib import Path
+
+from src.bitboard import move_tables
+from src.config import CFG
+from src.pathing import JUMP_KS
+
+LOSS, DRAW, WIN = 0, 1, 2
+NO_MOVE = 7
+INF = 255
+
+_MAGIC = b"PFPTB1"
+_VERSION = 1
+# magic, version, cols, rows, buckets, max_steps, regen_walks, round_jumps,
+# walk_cost, human_stamina, decide_ms, move_cooldown_ms
+_HEADER = struct.Struct("<6sHHHHHHHHHHH")
+
+_ROOT = Path(__file__).resolve().parents[1]
+
+
+def _params(cfg) -> tuple:
+    """The CFG values a table depends on (also stored in, and checked against, the header)."""
+    buckets = int(cfg.HUMAN_STAMINA // max(1, cfg.WALK_COST)) + 1
+    max_steps = max(1, int(cfg.AI_DECIDE_EVERY_MS // max(1, cfg.MOVE_COOLDOWN_MS)))
+    regen = int(cfg.ST_REGEN_PER_SEC_H * cfg.AI_DECIDE_EVERY_MS / 1000.0 // max(1, cfg.WALK_COST))
+    round_jumps = int(cfg.ROUND_SECONDS * 1000 // max(1, cfg.AI_DECIDE_EVERY_MS))
+    return (cfg.GRID_W, cfg.GRID_H, buckets, max_steps, regen, round_jumps,
+            int(cfg.WALK_COST), int(cfg.HUMAN_STAMINA), int(cfg.AI_DECIDE_EVERY_MS),
+            int(cfg.MOVE_COOLDOWN_MS))
+
+
+def tablebase_path(cfg=None) -> str:
+    """CFG.AI_TABLEBASE resolved against the repo root ("" = disabled)."""
+    cfg = cfg if cfg is not None else CFG
+    name = getattr(cfg, "AI_TABLEBASE", "") or ""
+    return str(_ROOT / name) if name else ""
+
+
+# --------- solver ---------
+def solve(cfg=None) -> bytes:
+    """Retrograde solve for cfg; returns the entry bytes (without header)."""
+    cfg = cfg if cfg is not None else CFG
+    cols, rows, buckets, max_steps, regen, round_jumps = _params(cfg)[:6]
+    t = move_tables(cols, rows)
+    n = cols * rows
+    top = buckets - 1
+    row_mask = [sum(1 << (y * cols + x) for x in range(cols)) for y in range(rows)]
+
+    # layers[h][d][s]: cells the human reaches in exactly s walks from h with the roo on d
+    def layers(h, d):
+        blocked = row_mask[d // cols]
+        out, seen, frontier = [1 << h], 1 << h, [h]
+        for _ in range(max_steps):
+            nxt, m = [], 0
+            for x in frontier:
+                for c in t.human_moves[x][d]:
+                    if not (seen >> c & 1) and not (blocked >> c & 1):
+                        seen |= 1 << c
+                        m |= 1 << c
+                        nxt.append(c)
+            out.append(m)
+            frontier = nxt
+        return out
+
+    # per (r, h): [(k, d, contact, layers)]
+    moves = [[None] * n for _ in range(n)]
+    for r in range(n):
+        for h in range(n):
+            if h == r or h // cols == r // cols:
+                continue
+            opts = []
+            for k in JUMP_KS:
+                d = t.roo_safe[r][h][k]
+                if d < 0 or d == r:
+                    continue
+                opts.append((k, d, d // cols == h // cols, None if d // cols == h // cols else layers(h, d)))
+            moves[r][h] = opts
+
+    # win[r][b]: mask of human cells from which the roo (on r, to move) has forced contact
+    win = [[0] * buckets for _ in range(n)]
+    dist = bytearray([INF]) * (n * n * buckets)
+    best = bytearray([NO_MOVE]) * (n * n * buckets)
+
+    def idx(h, r, b): return (h * n + r) * buckets + b
+
+    for r in range(n):              # already in contact: 0 jumps
+        for b in range(buckets):
+            m = row_mask[r // cols] & ~(1 << r)
+            win[r][b] = m
+            for h in range(n):
+                if m >> h & 1:
+                    dist[idx(h, r, b)] = 0
+
+    jumps = 0
+    while True:
+        jumps += 1
+        new = []
+        for r in range(n):
+            for h in range(n):
+                opts = moves[r][h]
+                if not opts:
+                    continue
+                for b in range(buckets):
+                    if win[r][b] >> h & 1:
+                        continue
+                    for k, d, contact, lay in opts:
+                        if contact:
+                            ok = True
+                        else:
+                            ok = True
+                            for s, m in enumerate(lay):
+                                if s > b:
+                                    break
+                                if m & ~win[d][min(top, b - s + regen)]:
+                                    ok = False
+                                    break
+                        if ok:
+                            new.append((h, r, b, k))
+                            break
+        if not new or jumps >= INF - 1:
+            break
+        for h, r, b, k in new:
+            win[r][b] |= 1 << h
+            dist[idx(h, r, b)] = jumps
+            best[idx(h, r, b)] = k
+
+    out = bytearray(2 * n * n * buckets)
+    for i in range(n * n * buckets):
+        dtm = dist[i]
+        value = LOSS if dtm == INF else (WIN if dtm <= round_jumps else DRAW)
+        out[2 * i] = (value << 3) | best[i]
+        out[2 * i + 1] = dtm
+    return bytes(out)
+
+
+def build(path: str | os.PathLike | None = None, cfg=None) -> str:
+    cfg = cfg if cfg is not None else CFG
+    path = str(path or tablebase_path(cfg) or _ROOT / "assets" / "tablebase.bin")
+    body = solve(cfg)
+    tmp = path + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, *_params(cfg)))
+        f.write(body)
+    os.replace(tmp, path)
+    return path
+
+
+# --------- runtime (mmap) ---------
+class Tablebase:
+    """Read-only view over a tablebase file; entries stay on disk until touched."""
+
+    def __init__(self, path: str, cfg=None):
+        cfg = cfg if cfg is not None else CFG
+        self._f = open(path, "rb")
+        self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, *params = _HEADER.unpack_from(self._mm, 0)
+        if magic != _MAGIC or version != _VERSION or tuple(params) != _params(cfg):
+            self.close()
+            raise ValueError(f"tablebase {path} was built for a different CFG")
+        self.cols, self.rows, self.buckets = params[0], params[1], params[2]
+        self.walk_cost = max(1, params[6])
+        self._cells = self.cols * self.rows
+        self._base = _HEADER.size
+
+    def close(self):
+        self._mm.close()
+        self._f.close()
+
+    def bucket(self, human_stamina: float) -> int:
+        return max(0, min(self.buckets - 1, int(human_stamina // self.walk_cost)))
+
+    def _off(self, h: int, r: int, b: int) -> int:
+        return self._base + ((h * self._cells + r) * self.buckets + b) * 2
+
+    def probe(self, human_pos, roo_pos, human_stamina: float) -> tuple[int, int, int]:
+        """(value, best SAFE_OFFSETS index or -1, jumps to contact or INF)."""
+        o = self._off(human_pos[1] * self.cols + human_pos[0],
+                      roo_pos[1] * self.cols + roo_pos[0], self.bucket(human_stamina))
+        packed, dtm = self._mm[o], self._mm[o + 1]
+        move = packed & 7
+        return packed >> 3, (-1 if move == NO_MOVE else move), dtm
+
+    def best_move(self, human_pos, roo_pos, human_stamina: float) -> int:
+        """Best jump for a forced (WIN/DRAW) state, else -1."""
+        o = self._off(human_pos[1] * self.cols + human_pos[0],
+                      roo_pos[1] * self.cols + roo_pos[0], self.bucket(human_stamina))
+        move = self._mm[o] & 7
+        return -1 if move == NO_MOVE else move
+
+    def entries(self) -> memoryview:
+        """Raw entry bytes (2 per state), e.g. for np.frombuffer in BatchSim."""
+        return memoryview(self._mm)[self._base:]
+
+
+_TB_CACHE: dict = {}
+
+
+def load_tablebase(cfg=None) -> Tablebase | None:
+    """Map the tablebase named by CFG.AI_TABLEBASE once per process; None if missing or stale."""
+    cfg = cfg if cfg is not None else CFG
+    path = tablebase_path(cfg)
+    if not path:
+        return None
+    key = (path, _params(cfg))
+    if key not in _TB_CACHE:
+        tb = None
+        if os.path.exists(path):
+            try:
+                tb = Tablebase(path, cfg)
+            except (ValueError, OSError, struct.error):
+                tb = None
+        _TB_CACHE[key] = tb
+    return _TB_CACHE[key]
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    out = argv[0] if argv else None
+    t0 = time.perf_counter()
+    path = build(out)
+    tb = Tablebase(path)
+    counts = [0, 0, 0]
+    data = tb.entries()
+    for i in range(0, len(data), 2):
+        counts[data[i] >> 3] += 1
+    del data
+    tb.close()
+    print(f"[tablebase] {path}: {os.path.getsize(path)} bytes, "
+          f"win={counts[WIN]} draw={counts[DRAW]} loss={counts[LOSS]} ({time.perf_counter() - t0:.1f}s)")
+
+
+if __name__ == "__main__":
+    main()
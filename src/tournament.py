@@ -0,0 +1,217 @@
+# src/tournament.py
+"""
+Headless CFG parameter sweeps: AI kangaroo vs scripted (random) human.
+
+Each config is a set of _CFG overrides; every config runs `--rounds` rounds in a
+BatchSim inside a worker process, and one CSV row per config is appended as soon
+as it finishes. Re-running the same command skips configs already in the file,
+so an interrupted sweep resumes where it stopped.
+
+    python -m src.tournament --grid WALK_COST=4,8,12 --grid PUNCH_COOLDOWN_MS=400,500,650 \\
+        --rounds 20000 --out sweep.csv
+    python -m src.tournament --sample 200 --range ROO_JUMP_ST_DRAIN=2:10 \\
+        --range BLOCK_DRAIN_PER_SEC=1:6 --out random.csv
+"""
+from __future__ import annotations
+import argparse
+import copy
+import csv
+import itertools
+import os
+import random
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from src.config import CFG
+
+RESULT_COLS = ["rounds", "roo_win_rate", "human_win_rate", "mean_round_s",
+               "stalemate_rate", "hit_rate", "seed", "elapsed_s"]
+
+
+# --------- config helpers ---------
+def _parse_value(key: str, text: str):
+    """Parse with the type of the CFG default (int stays int, float stays float)."""
+    default = getattr(CFG, key)
+    if isinstance(default, bool):
+        return text.lower() in ("1", "true", "yes", "on")
+    if isinstance(default, int):
+        value = float(text)
+        if not value.is_integer():
+            raise SystemExit(f"{key} takes an integer, got {text!r}")
+        return int(value)
+    return float(text)
+
+
+def _check_key(key: str):
+    if not hasattr(CFG, key):
+        raise SystemExit(f"Unknown CFG key: {key}")
+
+
+def parse_grid(items: list[str]) -> dict[str, list]:
+    """['WALK_COST=4,8', ...] -> {'WALK_COST': [4, 8], ...}"""
+    grid = {}
+    for it in items:
+        key, _, vals = it.partition("=")
+        _check_key(key)
+        grid[key] = [_parse_value(key, v) for v in vals.split(",") if v]
+    return grid
+
+
+def parse_ranges(items: list[str]) -> dict[str, tuple]:
+    """['ROO_JUMP_ST_DRAIN=2:10', ...] -> {'ROO_JUMP_ST_DRAIN': (2.0, 10.0), ...}"""
+    ranges = {}
+    for it in items:
+        key, _, span = it.partition("=")
+        _check_key(key)
+        lo, _, hi = span.partition(":")
+        ranges[key] = (_parse_value(key, lo), _parse_value(key, hi))
+    return ranges
+
+
+def grid_configs(grid: dict[str, list]) -> list[dict]:
+    keys = sorted(grid)
+    return [dict(zip(keys, combo)) for combo in itertools.product(*(grid[k] for k in keys))]
+
+
+def sample_configs(ranges: dict[str, tuple], n: int, seed: int) -> list[dict]:
+    """Deterministic random sample (same seed -> same configs, needed for resume)."""
+    rnd = random.Random(seed)
+    out = []
+    for _ in range(n):
+        cfg = {}
+        for key in sorted(ranges):
+            lo, hi = ranges[key]
+            if isinstance(lo, int) and isinstance(hi, int):
+                cfg[key] = rnd.randint(lo, hi)
+            else:
+                cfg[key] = round(rnd.uniform(lo, hi), 4)
+        out.append(cfg)
+    return out
+
+
+def config_id(overrides: dict) -> str:
+    return ";".join(f"{k}={overrides[k]}" for k in sorted(overrides)) or "default"
+
+
+def make_cfg(overrides: dict):
+    cfg = copy.copy(CFG)
+    for k, v in overrides.items():
+        setattr(cfg, k, v)
+    return cfg
+
+
+# --------- worker ---------
+def run_config(overrides: dict, rounds: int, lanes: int, seed: int, p_block: float) -> dict:
+    """Run one config to completion in this process and return its CSV row."""
+    from src.batch_sim import BatchSim   # numpy only needed in workers
+
+    t0 = time.perf_counter()
+    cfg = make_cfg(overrides)
+    bs = BatchSim(min(lanes, rounds), cfg=cfg)
+    st = bs.run_rounds(rounds, seed=seed, p_block=p_block)
+    row = {"config_id": config_id(overrides), **overrides}
+    row.update({
+        "rounds": st["rounds"],
+        "roo_win_rate": round(st["roo_win_rate"], 6),
+        "human_win_rate": round(st["human_win_rate"], 6),
+        "mean_round_s": round(st["mean_round_ms"] / 1000.0, 3),
+        "stalemate_rate": round(st["stalemate_rate"], 6),
+        "hit_rate": round(st["hit_rate"], 6),
+        "seed": seed,
+        "elapsed_s": round(time.perf_counter() - t0, 2),
+    })
+    return row
+
+
+# --------- output ---------
+def load_done(path: str) -> set[str]:
+    """config_ids already present in a (possibly partial) output file."""
+    if not os.path.exists(path):
+        return set()
+    done = set()
+    with open(path, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            # a row cut off mid-write has no elapsed_s; run that config again
+            if row.get("config_id") and row.get("elapsed_s"):
+                done.add(row["config_id"])
+    return done
+
+
+def read_header(path: str) -> list[str] | None:
+    """Column names of an existing output file, or None if there is none yet."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with open(path, newline="", encoding="utf-8") as f:
+        return next(csv.reader(f), None)
+
+
+def _truncate_partial_line(path: str):
+    """Drop a trailing half-written line left by a hard kill."""
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return
+    with open(path, "rb+") as f:
+        data = f.read()
+        if not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Headless AI-vs-scripted-human CFG sweeps")
+    ap.add_argument("--grid", action="append", default=[], metavar="KEY=v1,v2,...",
+                    help="grid values for a CFG key (repeatable)")
+    ap.add_argument("--range", action="append", default=[], metavar="KEY=lo:hi",
+                    help="random range for a CFG key, used with --sample (repeatable)")
+    ap.add_argument("--sample", type=int, default=0, help="number of random configs from --range")
+    ap.add_argument("--rounds", type=int, default=10_000, help="rounds per config")
+    ap.add_argument("--lanes", type=int, default=4096, help="parallel lanes per BatchSim")
+    ap.add_argument("--p-block", type=float, default=0.3, help="scripted human: chance SPACE is held")
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    ap.add_argument("--out", default="sweep.csv")
+    args = ap.parse_args(argv)
+
+    grid = parse_grid(args.grid)
+    ranges = parse_ranges(args.range)
+    if args.sample and ranges:
+        configs = sample_configs(ranges, args.sample, args.seed)
+        if grid:
+            configs = [{**g, **s} for g in grid_configs(grid) for s in configs]
+    else:
+        configs = grid_configs(grid)
+
+    keys = sorted({k for c in configs for k in c})
+    fields = ["config_id", *keys, *RESULT_COLS]
+
+    _truncate_partial_line(args.out)
+    header = read_header(args.out)
+    if header is not None and header != fields:
+        raise SystemExit(f"{args.out} has columns {header[1:-len(RESULT_COLS)]} but this sweep "
+                         f"varies {keys}; use a different --out")
+    done = load_done(args.out)
+    todo = [c for c in configs if config_id(c) not in done]
+    print(f"[sweep] {len(configs)} configs, {len(done)} already in {args.out}, {len(todo)} to run "
+          f"on {args.workers} workers")
+    if not todo:
+        return
+
+    with open(args.out, "a", newline="", encoding="utf-8") as f:
+        w = csv.DictWriter(f, fieldnames=fields, extrasaction="ignore")
+        if header is None:
+            w.writeheader()
+        with ProcessPoolExecutor(max_workers=args.workers) as ex:
+            futs = {}
+            for c in todo:
+                seed = args.seed ^ zlib.crc32(config_id(c).encode())
+                futs[ex.submit(run_config, c, args.rounds, args.lanes, seed, args.p_block)] = c
+            for n, fut in enumerate(as_completed(futs), 1):
+                row = fut.result()
+                w.writerow(row)
+                f.flush()
+                print(f"[sweep] {n}/{len(todo)} {row['config_id']}  roo_win={row['roo_win_rate']:.3f} "
+                      f"stalemate={row['stalemate_rate']:.3f}  ({row['elapsed_s']}s)")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 # src/ui/__init__.py
-from .board import compute_play_rect, draw_board, grid_center
-from .hud import draw_top_hud, HUD_H
+from .board import compute_play_rect, draw_board, draw_checker_background, grid_center
+from .hud import draw_top_hud, HudLayers, HUD_H
+from .text_cache import TEXT_CACHE, render_text, sys_font
 
-__all__ = ["compute_play_rect", "draw_board", "grid_center", "draw_top_hud", "HUD_H"]
+__all__ = ["compute_play_rect", "draw_board", "draw_checker_background", "grid_center", "draw_top_hud", "HudLayers", "HUD_H",
+           "TEXT_CACHE", "render_text", "sys_font"]
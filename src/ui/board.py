@@ -7,17 +7,67 @@ HUD_H = 96
 def compute_play_rect(W, H, hud_h=HUD_H, margin=8):
     return pg.Rect(margin, hud_h + margin, W - margin * 2, H - hud_h - margin * 2)
 
-def draw_board(surf, rect):
-    cols, rows = CFG.GRID_W, CFG.GRID_H
-    cw = rect.width // cols
-    ch = rect.height // rows
+# Pre-rendered backgrounds: key -> Surface. Keys hold the size and every CFG color
+# used, so a resize or a palette change simply renders a new one.
+_BG_CACHE = {}
+_BG_CACHE_MAX = 8
+
+
+def _cached_bg(key, render):
+    img = _BG_CACHE.get(key)
+    if img is None:
+        if len(_BG_CACHE) >= _BG_CACHE_MAX:
+            _BG_CACHE.clear()
+        img = _BG_CACHE[key] = render()
+    return img
+
+
+_KEY = (255, 0, 255)  # colorkey for the strip the cells leave uncovered (w/h not divisible)
+
+
+def _render_board(size, cols, rows, light, dark):
+    img = pg.Surface(size).convert()
+    img.fill(_KEY)
+    img.set_colorkey(_KEY, pg.RLEACCEL)
+    w, h = size
+    cw = w // cols
+    ch = h // rows
     for y in range(rows):
         for x in range(cols):
-            r = pg.Rect(rect.x + x * cw, rect.y + y * ch, cw, ch)
-            col = CFG.COL_GRID_LIGHT if (x + y) % 2 == 0 else CFG.COL_GRID_DARK
-            pg.draw.rect(surf, col, r)
+            r = pg.Rect(x * cw, y * ch, cw, ch)
+            col = light if (x + y) % 2 == 0 else dark
+            pg.draw.rect(img, col, r)
     # 外框
-    pg.draw.rect(surf, (0, 0, 0), rect, 2, border_radius=8)
+    pg.draw.rect(img, (0, 0, 0), img.get_rect(), 2, border_radius=8)
+    return img
+
+
+def draw_board(surf, rect):
+    cols, rows = CFG.GRID_W, CFG.GRID_H
+    light, dark = CFG.COL_GRID_LIGHT, CFG.COL_GRID_DARK
+    img = _cached_bg(("board", rect.size, cols, rows, light, dark),
+                     lambda: _render_board(rect.size, cols, rows, light, dark))
+    surf.blit(img, rect.topleft)
+
+
+def _render_checker(size, cols, rows, light, dark, bg):
+    img = pg.Surface(size).convert()
+    img.fill(bg)
+    cw, ch = size[0] // cols, size[1] // rows
+    for r in range(rows):
+        for c in range(cols):
+            col = light if (c + r) % 2 == 0 else dark
+            pg.draw.rect(img, col, (c * cw, r * ch, cw, ch))
+    return img
+
+
+def draw_checker_background(surf, cols=16, rows=9):
+    """Full-screen menu checkerboard (CFG.BG behind CFG.GRID_LIGHT/GRID_DARK cells), one blit."""
+    size = surf.get_size()
+    light, dark, bg = CFG.GRID_LIGHT, CFG.GRID_DARK, CFG.BG
+    img = _cached_bg(("checker", size, cols, rows, light, dark, bg),
+                     lambda: _render_checker(size, cols, rows, light, dark, bg))
+    surf.blit(img, (0, 0))
 
 def grid_center(play_rect, gx, gy):
     cw = play_rect.width // CFG.GRID_W
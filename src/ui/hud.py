@@ -1,11 +1,13 @@
 # src/ui/hud.py
 import pygame as pg
 from src.config import CFG
+from src.ui.text_cache import render_text
 
 HUD_H = 96  # 顶栏高度（与 screen_game.py 保持一致）
+BAR_W = 160  # 耐力条宽度
 
 def _text(surf, font, txt, color):
-    return font.render(txt, True, color)
+    return render_text(font, txt, color)
 
 def _blit_center_y(surf, img, x, y_center):
     r = img.get_rect()
@@ -13,11 +15,14 @@ def _blit_center_y(surf, img, x, y_center):
     surf.blit(img, r)
     return r
 
+def _bar_fill(width, pct):
+    return int(width * max(0.0, min(1.0, pct)))
+
 def _draw_bar(surf, rect, pct, fill_col=(80, 180, 255), bg_col=(40, 45, 55)):
     # 背景
     pg.draw.rect(surf, bg_col, rect, border_radius=8)
     # 前景
-    fill_w = int(rect.width * max(0.0, min(1.0, pct)))
+    fill_w = _bar_fill(rect.width, pct)
     if fill_w > 0:
         pg.draw.rect(surf, fill_col, pg.Rect(rect.x, rect.y, fill_w, rect.height), border_radius=8)
     # 描边
@@ -44,6 +49,122 @@ def _draw_hearts_row(surf, left_x, mid_y, count, align="left", img=None, gap=6):
             pg.draw.rect(surf, (0, 0, 0), r, 1, border_radius=6)
         x += w + gap
 
+def _layout(W):
+    # 统一行高/留白
+    pad = 12
+    mid_y = HUD_H // 2
+    ava_size = HUD_H - pad * 2
+    ava_rect_L = pg.Rect(pad, pad, ava_size, ava_size)
+    ava_rect_R = pg.Rect(W - pad - ava_size, pad, ava_size, ava_size)
+    left_col_x = ava_rect_L.right + 10        # 左侧列从头像右侧开始
+    right_col_right = ava_rect_R.left - 10    # 右侧列右对齐到头像左边
+    return {
+        "mid_y": mid_y,
+        "ava_L": ava_rect_L, "ava_R": ava_rect_R,
+        "left_x": left_col_x, "right_x": right_col_right,
+        "bar_L": pg.Rect(left_col_x, mid_y - 6, BAR_W, 12),
+        "bar_R": pg.Rect(right_col_right - BAR_W, mid_y - 6, BAR_W, 12),
+    }
+
+
+class HudLayers:
+    """
+    Top HUD split into cached layers, composited into one strip:
+        chrome  background bar + avatar placeholders   key: width, palette
+        hearts  both heart rows                        key: whole hearts left, heart images
+        bars    both stamina bars                      key: filled width in px
+        text    round / timer / stamina values         key: the strings shown
+    A layer is re-rendered only when its key changes, the strip only when a layer
+    did, and draw() is a single blit. keys() is what the strip currently depends on.
+    """
+
+    LAYERS = ("chrome", "hearts", "bars", "text")
+
+    def __init__(self):
+        self._keys = {}
+        self._surfs = {}
+        self._strip = None
+        self._strip_key = None
+        self.renders = dict.fromkeys(self.LAYERS, 0)
+
+    def keys(self, W, halves_left_human, halves_left_roo, secs_left, fonts, st_pct_h, st_pct_r,
+             round_idx, round_total=3, heart_img_left=None, heart_img_right=None) -> tuple:
+        return (
+            (W, CFG.COL_BG),
+            (W, halves_left_human // 2, halves_left_roo // 2, heart_img_left, heart_img_right),
+            (W, _bar_fill(BAR_W, st_pct_h), _bar_fill(BAR_W, st_pct_r)),
+            (W, fonts["mid"], fonts["title"], fonts["sml"], CFG.COL_TEXT,
+             f"Round {round_idx}/{round_total}", f"{secs_left:02d}s",
+             f"{int(st_pct_h * 100)}/100", f"{int(st_pct_r * 100)}/100"),
+        )
+
+    def _layer(self, name, key, W, render, alpha=True):
+        if self._keys.get(name) == key:
+            return
+        surf = self._surfs.get(name)
+        if surf is None or surf.get_width() != W:
+            surf = self._surfs[name] = pg.Surface((W, HUD_H), pg.SRCALPHA) if alpha else pg.Surface((W, HUD_H))
+        elif alpha:
+            surf.fill((0, 0, 0, 0))
+        render(surf, _layout(W))
+        self._keys[name] = key
+        self.renders[name] += 1
+
+    def draw(self, surf, W, H, halves_left_human, halves_left_roo, secs_left, fonts, st_pct_h, st_pct_r,
+             round_idx, round_total=3, heart_img_left=None, heart_img_right=None):
+        k_chrome, k_hearts, k_bars, k_text = keys = self.keys(
+            W, halves_left_human, halves_left_roo, secs_left, fonts, st_pct_h, st_pct_r,
+            round_idx, round_total, heart_img_left, heart_img_right)
+        if keys != self._strip_key:
+            def chrome(s, lay):
+                # 背景条 + 头像占位（或你自己的头像贴图）
+                s.fill(CFG.COL_BG)
+                for ava in (lay["ava_L"], lay["ava_R"]):
+                    pg.draw.rect(s, (70, 75, 85), ava, border_radius=16)
+                    pg.draw.rect(s, (0, 0, 0), ava, 1, border_radius=16)
+
+            def hearts(s, lay):
+                # 左：心（左对齐）；右：心（右对齐）
+                _draw_hearts_row(s, lay["left_x"], lay["mid_y"] - 18, k_hearts[1], align="left", img=heart_img_left)
+                _draw_hearts_row(s, lay["right_x"], lay["mid_y"] - 18, k_hearts[2], align="right", img=heart_img_right)
+
+            def bars(s, lay):
+                _draw_bar(s, lay["bar_L"], st_pct_h)
+                _draw_bar(s, lay["bar_R"], st_pct_r)
+
+            def text(s, lay):
+                mid_y = lay["mid_y"]
+                # ====== 中间：上下两行（Round / Timer），整体水平居中 ======
+                img_round = _text(s, fonts["mid"], k_text[5], CFG.COL_TEXT)
+                img_timer = _text(s, fonts["title"], k_text[6], CFG.COL_TEXT)
+                total_h = img_round.get_height() + 6 + img_timer.get_height()
+                top_y = mid_y - total_h // 2
+                r1 = img_round.get_rect(center=(W // 2, top_y + img_round.get_height() // 2))
+                r2 = img_timer.get_rect(center=(W // 2, r1.bottom + 6 + img_timer.get_height() // 2))
+                s.blit(img_round, r1)
+                s.blit(img_timer, r2)
+
+                # 下：数值（左侧左对齐 / 右侧右对齐，同一水平线）
+                _blit_center_y(s, _text(s, fonts["sml"], k_text[7], CFG.COL_TEXT), lay["left_x"], mid_y + 16)
+                img_st_R = _text(s, fonts["sml"], k_text[8], CFG.COL_TEXT)
+                s.blit(img_st_R, img_st_R.get_rect(midright=(lay["right_x"], mid_y + 16)))
+
+            self._layer("chrome", k_chrome, W, chrome, alpha=False)
+            self._layer("hearts", k_hearts, W, hearts)
+            self._layer("bars", k_bars, W, bars)
+            self._layer("text", k_text, W, text)
+
+            if self._strip is None or self._strip.get_width() != W:
+                self._strip = pg.Surface((W, HUD_H))
+            for name in self.LAYERS:
+                self._strip.blit(self._surfs[name], (0, 0))
+            self._strip_key = keys
+
+        surf.blit(self._strip, (0, 0))
+
+
+_HUD = HudLayers()
+
 def draw_top_hud(
     surf, W, H,
     halves_left_human: int,
@@ -57,68 +178,6 @@ def draw_top_hud(
     heart_img_left=None,
     heart_img_right=None,
 ):
-    # 背景条
-    pg.draw.rect(surf, CFG.COL_BG, pg.Rect(0, 0, W, HUD_H))
-
-    # 统一行高/留白
-    pad = 12
-    mid_y = HUD_H // 2
-
-    # ====== 中间：上下两行（Round / Timer） ======
-    round_txt = f"Round {round_idx}/{round_total}"
-    timer_txt = f"{secs_left:02d}s"
-    img_round = _text(surf, fonts["mid"], round_txt, CFG.COL_TEXT)
-    img_timer = _text(surf, fonts["title"], timer_txt, CFG.COL_TEXT)
-
-    # 垂直布局：round 在上，timer 在下，整体水平居中
-    total_h = img_round.get_height() + 6 + img_timer.get_height()
-    top_y = mid_y - total_h // 2
-    r1 = img_round.get_rect(center=(W // 2, top_y + img_round.get_height() // 2))
-    r2 = img_timer.get_rect(center=(W // 2, r1.bottom + 6 + img_timer.get_height() // 2))
-    surf.blit(img_round, r1)
-    surf.blit(img_timer, r2)
-
-    # ====== 左侧：头像 | (心/耐力条/数值) 右对齐到头像右侧 ======
-    # 头像占位（或你自己的头像贴图）
-    ava_size = HUD_H - pad * 2
-    ava_rect_L = pg.Rect(pad, pad, ava_size, ava_size)
-    pg.draw.rect(surf, (70, 75, 85), ava_rect_L, border_radius=16)
-    pg.draw.rect(surf, (0, 0, 0), ava_rect_L, 1, border_radius=16)
-
-    # 左侧文字列的起点（从头像右侧开始）
-    left_col_x = ava_rect_L.right + 10
-
-    # 上：心（左对齐）
-    _draw_hearts_row(surf, left_col_x, mid_y - 18, halves_left_human // 2, align="left", img=heart_img_left)
-
-    # 中：耐力条（左对齐）
-    bar_rect_L = pg.Rect(left_col_x, mid_y - 6, 160, 12)
-    _draw_bar(surf, bar_rect_L, st_pct_h)
-
-    # 下：数值（左对齐、同一水平线）
-    st_txt_L = f"{int(st_pct_h * 100)}/100"
-    img_st_L = _text(surf, fonts["sml"], st_txt_L, CFG.COL_TEXT)
-    _blit_center_y(surf, img_st_L, left_col_x, mid_y + 16)
-
-    # ====== 右侧：头像 | (心/耐力条/数值) 左对齐到头像左侧（整体右对齐） ======
-    ava_rect_R = pg.Rect(W - pad - ava_size, pad, ava_size, ava_size)
-    pg.draw.rect(surf, (70, 75, 85), ava_rect_R, border_radius=16)
-    pg.draw.rect(surf, (0, 0, 0), ava_rect_R, 1, border_radius=16)
-
-    # 右侧内容列右对齐到头像左边
-    right_col_right = ava_rect_R.left - 10
-
-    # 上：心（右对齐）
-    _draw_hearts_row(surf, right_col_right, mid_y - 18, halves_left_roo // 2, align="right", img=heart_img_right)
-
-    # 中：耐力条（右对齐）
-    bar_w = 160
-    bar_rect_R = pg.Rect(right_col_right - bar_w, mid_y - 6, bar_w, 12)
-    _draw_bar(surf, bar_rect_R, st_pct_r)
-
-    # 下：数值（右对齐，同一水平线）
-    st_txt_R = f"{int(st_pct_r * 100)}/100"
-    img_st_R = _text(surf, fonts["sml"], st_txt_R, CFG.COL_TEXT)
-    r = img_st_R.get_rect()
-    r.midright = (right_col_right, mid_y + 16)
-    surf.blit(img_st_R, r)
+    """Immediate-mode entry point; draws through a shared HudLayers."""
+    _HUD.draw(surf, W, H, halves_left_human, halves_left_roo, secs_left, fonts, st_pct_h, st_pct_r,
+              round_idx, round_total, heart_img_left, heart_img_right)
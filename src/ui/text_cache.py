@@ -0,0 +1,59 @@
+# src/ui/text_cache.py
+"""
+Shared cache of rendered text surfaces.
+
+    img = render_text(font, "Round 1/3", CFG.COL_TEXT)
+
+Surfaces are keyed by (font, text, color, antialias) and kept in an LRU of
+CFG.TEXT_CACHE_SIZE entries, so a string that did not change is rasterized once.
+Callers must treat the returned surface as read-only (blit it, don't draw on it).
+sys_font() does the same for pg.font.SysFont lookups, which are slow.
+"""
+from __future__ import annotations
+from collections import OrderedDict
+from functools import lru_cache
+
+import pygame as pg
+
+from src.config import CFG
+
+
+class TextCache:
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = max(1, int(maxsize))
+        self._items: "OrderedDict[tuple, pg.Surface]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def render(self, font: pg.font.Font, text: str, color, antialias: bool = True) -> pg.Surface:
+        key = (font, text, tuple(color), antialias)
+        img = self._items.get(key)
+        if img is not None:
+            self.hits += 1
+            self._items.move_to_end(key)
+            return img
+        self.misses += 1
+        img = self._items[key] = font.render(text, antialias, color)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return img
+
+    def clear(self):
+        self._items.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {"size": len(self._items), "maxsize": self.maxsize, "hits": self.hits,
+                "misses": self.misses, "hit_rate": self.hits / total if total else 0.0}
+
+
+TEXT_CACHE = TextCache(getattr(CFG, "TEXT_CACHE_SIZE", 256))
+
+
+def render_text(font: pg.font.Font, text: str, color, antialias: bool = True) -> pg.Surface:
+    return TEXT_CACHE.render(font, text, color, antialias)
+
+
+@lru_cache(maxsize=64)
+def sys_font(name, size: int, bold: bool = False) -> pg.font.Font:
+    return pg.font.SysFont(name, size, bold=bold)
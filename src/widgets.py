@@ -1,5 +1,6 @@
 import pygame as pg
 from config import CFG
+from src.ui.text_cache import render_text
 from typing import Tuple, Optional
 
 # ---------- Font helper: fix garbled Chinese ----------
@@ -40,7 +41,7 @@ def draw_piece(surf: pg.Surface, grid_xy: Tuple[int,int], color: Tuple[int,int,i
     pg.draw.rect(surf, color, r, border_radius=12)
 
 def draw_text(surf, font: pg.font.Font, text: str, xy, color=CFG.TEXT, center=False):
-    img = font.render(text, True, color)
+    img = render_text(font, text, color)
     rect = img.get_rect()
     if center:
         rect.center = xy
@@ -82,5 +83,5 @@ class Button:
             bg = (90, 90, 100)
         pg.draw.rect(surf, bg, self.rect, border_radius=12)
         pg.draw.rect(surf, (20, 20, 24), self.rect, width=2, border_radius=12)
-        txt = self.font.render(self.label, True, (250, 250, 255) if self.enabled else (210,210,210))
+        txt = render_text(self.font, self.label, (250, 250, 255) if self.enabled else (210,210,210))
         surf.blit(txt, txt.get_rect(center=self.rect.center))